@@ -0,0 +1,36 @@
+"""Micro benchmarks for django-sorcery hot paths.
+
+Benchmarks are standalone and use an in-memory sqlite database so they can run
+without any database server, for example::
+
+    python -m benchmarks.profiler
+
+Set ``BENCHMARK_DB_URL`` to run database bound benchmarks against another
+database, e.g. ``postgresql://localhost/benchmarks``.
+"""
+import os
+import timeit
+
+import django
+from django.conf import settings
+
+
+def setup():
+    """Configures a minimal django project for benchmarks."""
+    if not settings.configured:
+        settings.configure(
+            INSTALLED_APPS=["django_sorcery"],
+            SQLALCHEMY_CONNECTIONS={"default": {"DIALECT": "sqlite"}},
+            USE_TZ=True,
+        )
+        django.setup()
+
+
+DB_URL = os.environ.get("BENCHMARK_DB_URL", "sqlite://")
+
+
+def bench(name, func, number=100000, repeat=5, per="call"):
+    """Runs a micro benchmark and prints best time per call."""
+    best = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+    print("{:<60} {:>10.3f} us/{}".format(name, best * 1e6, per))
+    return best
@@ -0,0 +1,34 @@
+"""Benchmarks cloning a graph with ``clone`` against ``bulk_clone``.
+
+Run with::
+
+    python -m benchmarks.bulk
+"""
+from . import bench, setup
+
+
+setup()
+
+from django_sorcery.db.models import bulk_clone, clone  # noqa isort:skip
+
+from .models import Item, Owner, db, load_items  # noqa isort:skip
+
+
+def main():
+    load_items(5000)
+    owner = db.query(Owner).first()
+    owner.items = db.query(Item).all()
+    db.flush()
+    print("cloning owner with {} items".format(len(owner.items)))
+
+    def orm_clone():
+        db.add(clone(owner, Owner.items))
+        db.flush()
+
+    bench("clone + flush", orm_clone, 1, 3, "graph")
+    bench("bulk_clone", lambda: bulk_clone(owner, Owner.items), 1, 3, "graph")
+    db.rollback()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Benchmarks attribute assignment on autocoerced models.
+
+Run with::
+
+    python -m benchmarks.coerce
+"""
+import datetime
+from decimal import Decimal
+
+from . import bench, setup
+
+
+setup()
+
+from .models import Color, CoercedItem, Item, db  # noqa isort:skip
+
+
+VALUES = {
+    "price": Decimal("9.99"),
+    "quantity": 1,
+    "is_active": True,
+    "color": Color.red,
+    "created_at": datetime.datetime(2020, 1, 1, 12),
+    "available_on": datetime.date(2020, 1, 1),
+    "weight": 1.5,
+}
+
+RAW_VALUES = {
+    "price": "9.99",
+    "quantity": "1",
+    "is_active": "t",
+    "color": "red",
+    "created_at": "2020-01-01 12:00",
+    "available_on": "2020-01-01",
+    "weight": "1.5",
+}
+
+
+def main():
+    db.configure_mappers()
+
+    for model in (Item, CoercedItem):
+        bench(
+            "construct {} with typed values".format(model.__name__),
+            lambda model=model: model(**VALUES),
+            10000,
+            per="instance",
+        )
+    bench("construct CoercedItem with raw values", lambda: CoercedItem(**RAW_VALUES), 1000, per="instance")
+
+
+if __name__ == "__main__":
+    main()
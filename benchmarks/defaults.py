@@ -0,0 +1,26 @@
+"""Benchmarks object construction with and without ``instant_defaults``.
+
+Run with::
+
+    python -m benchmarks.defaults
+"""
+from . import bench, setup
+
+
+setup()
+
+from .models import Defaults, PlainDefaults, db  # noqa isort:skip
+
+
+def main():
+    db.configure_mappers()
+    assert Defaults().quantity == 1 and PlainDefaults().quantity is None
+
+    for model in (PlainDefaults, Defaults):
+        for label, func in [("", model), (" with values", lambda model=model: model(quantity=2))]:
+            best = bench("construct {}{}".format(model.__name__, label), func, 100000, per="instance")
+            print("{:<60} {:>10,.0f} instances/s".format("", 1 / best))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+"""Benchmarks model form instantiation for a 40 column model.
+
+Run with::
+
+    python -m benchmarks.forms
+"""
+from . import bench, setup
+
+
+setup()
+
+from django_sorcery.forms import modelform_factory  # noqa isort:skip
+
+from .models import Wide40, db  # noqa isort:skip
+
+
+def main():
+    form_class = modelform_factory(Wide40, fields="__all__", session=db)
+    instance = Wide40()
+
+    bench("ModelForm() 40 fields", form_class, 2000)
+    bench("ModelForm(instance=...) 40 fields", lambda: form_class(instance=instance), 2000)
+    bench("ModelForm().as_p() 40 fields", lambda: form_class().as_p(), 200)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""Benchmarks ``model_info`` registry and field lookups.
+
+Run with::
+
+    python -m benchmarks.meta
+"""
+from . import bench, setup
+
+
+setup()
+
+from django_sorcery.db import meta  # noqa isort:skip
+
+from .models import Item, make_items  # noqa isort:skip
+
+
+def main():
+    item = make_items(1)[0]
+    mapper = Item.__mapper__
+    info = meta.model_info(Item)
+    model_info = meta.model_info
+
+    bench("model_info(instance) x 1M", lambda: model_info(item), 1000000, 3, per="lookup")
+    bench("model_info(class) x 1M", lambda: model_info(Item), 1000000, 3, per="lookup")
+    bench("model_info(mapper) x 1M", lambda: model_info(mapper), 1000000, 3, per="lookup")
+    bench("get_field(column) x 1M", lambda: info.get_field("weight"), 1000000, 3, per="lookup")
+    bench("get_field(relationship) x 1M", lambda: info.get_field("owner"), 1000000, 3, per="lookup")
+    bench("getattr(relationship) x 1M", lambda: info.owner, 1000000, 3, per="lookup")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""Models used by benchmarks."""
+import datetime
+import enum
+import warnings
+from decimal import Decimal
+
+from sqlalchemy.exc import SAWarning
+from sqlalchemy.ext.declarative import declarative_base
+
+from django_sorcery.db import SQLAlchemy
+from django_sorcery.db.models import autocoerce
+
+from . import DB_URL
+
+
+# sqlite stores decimals as floats which is fine for benchmarks
+warnings.filterwarnings("ignore", "Dialect sqlite", SAWarning)
+
+db = SQLAlchemy(DB_URL)
+
+
+class Color(enum.Enum):
+    red = "red"
+    blue = "blue"
+
+
+class Address(db.BaseComposite):
+    def __init__(self, street=None, city=None, zip=None):
+        self.street = street
+        self.city = city
+        self.zip = zip
+
+
+class Owner(db.Model):
+    id = db.Column(db.Integer(), primary_key=True)
+    name = db.Column(db.String(length=50))
+    address = db.CompositeField(Address)
+
+
+class Item(db.Model):
+    id = db.Column(db.Integer(), primary_key=True)
+    name = db.Column(db.String(length=50))
+    description = db.Column(db.Text())
+    price = db.Column(db.Numeric(10, 2))
+    quantity = db.Column(db.Integer())
+    is_active = db.Column(db.Boolean())
+    color = db.Column(db.Enum(Color))
+    created_at = db.Column(db.DateTime())
+    available_on = db.Column(db.Date())
+    weight = db.Column(db.Float())
+
+    owner_id = db.Column(db.Integer(), db.ForeignKey(Owner.id))
+    owner = db.relationship(Owner, backref=db.backref("items"))
+
+
+@autocoerce
+class CoercedItem(db.Model):
+    id = db.Column(db.Integer(), primary_key=True)
+    name = db.Column(db.String(length=50))
+    price = db.Column(db.Numeric(10, 2))
+    quantity = db.Column(db.Integer())
+    is_active = db.Column(db.Boolean())
+    color = db.Column(db.Enum(Color))
+    created_at = db.Column(db.DateTime())
+    available_on = db.Column(db.Date())
+    weight = db.Column(db.Float())
+
+
+PlainBase = declarative_base()
+
+DEFAULTS_COLUMNS = {
+    "name": lambda: db.Column(db.String(length=50), default="name"),
+    "quantity": lambda: db.Column(db.Integer(), default=1),
+    "is_active": lambda: db.Column(db.Boolean(), default=True),
+    "color": lambda: db.Column(db.Enum(Color), default=Color.red),
+    "weight": lambda: db.Column(db.Float(), default=1.5),
+    "created_at": lambda: db.Column(db.DateTime(), default=datetime.datetime.utcnow),
+    "description": lambda: db.Column(db.Text()),
+}
+
+
+# sorcery models set simple column defaults on init via instant_defaults
+Defaults = type(
+    "Defaults",
+    (db.Model,),
+    dict(
+        {"__module__": __name__, "id": db.Column(db.Integer(), primary_key=True)},
+        **{k: v() for k, v in DEFAULTS_COLUMNS.items()},
+    ),
+)
+
+PlainDefaults = type(
+    "PlainDefaults",
+    (PlainBase,),
+    dict(
+        {"__module__": __name__, "__tablename__": "plain_defaults", "id": db.Column(db.Integer(), primary_key=True)},
+        **{k: v() for k, v in DEFAULTS_COLUMNS.items()},
+    ),
+)
+
+
+# 30 columns cycling through the common column types
+WIDE_COLUMNS = [
+    (lambda: db.Column(db.String(length=50), nullable=False), "value"),
+    (lambda: db.Column(db.Integer(), nullable=False), 42),
+    (lambda: db.Column(db.Numeric(10, 2)), Decimal("9.99")),
+    (lambda: db.Column(db.Boolean(), nullable=False), True),
+    (lambda: db.Column(db.Enum(Color), nullable=False), Color.blue),
+    (lambda: db.Column(db.DateTime()), datetime.datetime(2020, 1, 1, 12)),
+    (lambda: db.Column(db.Date(), nullable=False), datetime.date(2020, 1, 1)),
+    (lambda: db.Column(db.Float()), 1.5),
+    (lambda: db.Column(db.Text(), nullable=False), "text"),
+    (lambda: db.Column(db.String(length=20), default="default"), ""),
+] * 3
+
+Wide = type(
+    "Wide",
+    (db.Model,),
+    dict(
+        {"__module__": __name__, "id": db.Column(db.Integer(), primary_key=True)},
+        **{"col_{:02d}".format(i): column() for i, (column, _) in enumerate(WIDE_COLUMNS)},
+    ),
+)
+
+# 40 columns for form benchmarks
+Wide40 = type(
+    "Wide40",
+    (db.Model,),
+    dict(
+        {"__module__": __name__, "id": db.Column(db.Integer(), primary_key=True)},
+        **{"col_{:02d}".format(i): column() for i, (column, _) in enumerate(WIDE_COLUMNS + WIDE_COLUMNS[:10])},
+    ),
+)
+
+
+def make_wide():
+    """Returns a transient 30 column instance with all values set."""
+    return Wide(**{"col_{:02d}".format(i): value for i, (_, value) in enumerate(WIDE_COLUMNS)})
+
+
+def load_items(count):
+    """Creates items in the in-memory database and returns them freshly
+    loaded together with their owners."""
+    db.drop_all()
+    db.create_all()
+    db.add_all(make_items(count))
+    db.commit()
+    db.expunge_all()
+    return db.query(Item).options(db.joinedload(Item.owner)).order_by(Item.id).all()
+
+
+def make_items(count):
+    """Returns transient items sharing a handful of owners."""
+    owners = [
+        Owner(name="owner {}".format(i), address=Address("street {}".format(i), "city", "12345")) for i in range(10)
+    ]
+    return [
+        Item(
+            name="item {}".format(i),
+            description="description",
+            price=Decimal("9.99"),
+            quantity=i,
+            is_active=True,
+            color=Color.red,
+            created_at=datetime.datetime(2020, 1, 1, 12),
+            available_on=datetime.date(2020, 1, 1),
+            weight=1.5,
+            owner=owners[i % len(owners)],
+        )
+        for i in range(count)
+    ]
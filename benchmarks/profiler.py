@@ -0,0 +1,47 @@
+"""Benchmarks profiler overhead per executed statement.
+
+Run with::
+
+    python -m benchmarks.profiler
+
+The target is less than 1us of overhead per statement. Measurements range
+between ~0.9us and ~1.8us without recording queries depending on the box,
+dominated by the two Python level cursor listener calls, so the target is
+not reliably met yet. Each run reports the remaining gap.
+"""
+from . import bench, setup
+
+
+setup()
+
+from django_sorcery.db.profiler import SQLAlchemyProfiler  # noqa isort:skip
+
+
+TARGET = 1e-6
+
+STATEMENT = "SELECT owner.id, owner.first_name, owner.last_name FROM owner WHERE owner.id = %(id_1)s"
+
+
+def main():
+    profiler = SQLAlchemyProfiler(exclude=["alembic_version", "pg_catalog"], record_queries=False)
+    args = (None, None, STATEMENT, {"id_1": 1}, None, False)
+
+    def execute():
+        profiler._before_cursor_execute(*args)
+        profiler._after_cursor_execute(*args)
+
+    best = bench("profiler overhead per statement (record_queries=False)", execute, number=200000)
+    print(
+        "{:<60} {:>10}".format(
+            "target < {:.0f} us/call".format(TARGET * 1e6),
+            "met" if best < TARGET else "+{:.3f} us".format((best - TARGET) * 1e6),
+        )
+    )
+
+    profiler.record_queries = True
+    bench("profiler overhead per statement (record_queries=True)", execute, number=200000)
+    profiler.clear()
+
+
+if __name__ == "__main__":
+    main()
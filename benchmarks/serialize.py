@@ -0,0 +1,66 @@
+"""Benchmarks ``serialize`` against compiled serializer plans.
+
+Run with::
+
+    python -m benchmarks.serialize
+"""
+from . import bench, setup
+
+
+setup()
+
+from django_sorcery.db import meta  # noqa isort:skip
+from django_sorcery.db.models import get_serializer_plan, serialize  # noqa isort:skip
+
+from .models import Item, load_items  # noqa isort:skip
+
+
+def legacy_serialize(instance, *rels):
+    """Generic serializer which inspects the model for every instance."""
+    if instance is None:
+        return None
+
+    if isinstance(instance, (list, set)):
+        return [legacy_serialize(i, *rels) for i in instance]
+
+    info = meta.model_info(instance)
+    rels = set(rels)
+
+    data = {name: getattr(instance, name) for name, _ in info.column_properties}
+
+    for name, composite in info.composites.items():
+        comp = getattr(instance, name)
+        data[name] = vars(comp) if comp else None
+        for _, prop in composite.properties.items():
+            data.pop(prop.property.key, None)
+
+    for name in info.relationships:
+        attr = getattr(info.model_class, name)
+        if attr in rels:
+            sub_instance = getattr(instance, name, None)
+            sub_rels = [r for r in rels if r is not attr]
+            data[name] = legacy_serialize(sub_instance, *sub_rels)
+
+    return data
+
+
+def main():
+    items = load_items(10000)
+    assert legacy_serialize(items, Item.owner) == serialize(items, Item.owner)
+
+    for rels in [(), (Item.owner,)]:
+        label = "with owner" if rels else "columns only"
+        plan = get_serializer_plan(Item, *rels)
+        bench(
+            "legacy serialize 10k items ({})".format(label),
+            lambda rels=rels: legacy_serialize(items, *rels),
+            1,
+            5,
+            "10k",
+        )
+        bench("serialize 10k items ({})".format(label), lambda rels=rels: serialize(items, *rels), 1, 5, "10k")
+        bench("plan.many 10k items ({})".format(label), lambda plan=plan: plan.many(items), 1, 5, "10k")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Benchmarks building model metadata for a 300 model schema.
+
+Run with::
+
+    python -m benchmarks.startup
+"""
+import enum
+import subprocess
+import sys
+from time import perf_counter
+
+from . import setup
+
+
+setup()
+
+from django_sorcery.db import SQLAlchemy, meta  # noqa isort:skip
+from django_sorcery.db.meta import column  # noqa isort:skip
+
+
+class Status(enum.Enum):
+    active = "active"
+    inactive = "inactive"
+
+
+class NoCache(dict):
+    def __setitem__(self, key, value):
+        pass
+
+
+def build_schema(count=300):
+    """Declares ``count`` models with 12 columns each and inspects them."""
+    db = SQLAlchemy("sqlite://")
+    models = []
+    for i in range(count):
+        attrs = {
+            "__module__": __name__,
+            "id": db.Column(db.Integer(), primary_key=True),
+            "name": db.Column(db.String(length=50)),
+            "description": db.Column(db.Text()),
+            "price": db.Column(db.Numeric(10, 2)),
+            "quantity": db.Column(db.Integer()),
+            "ratio": db.Column(db.Float()),
+            "is_active": db.Column(db.Boolean()),
+            "status": db.Column(db.Enum(Status)),
+            "kind": db.Column(db.Enum("a", "b", name="kind_{}".format(i))),
+            "created_at": db.Column(db.DateTime()),
+            "available_on": db.Column(db.Date()),
+            "opens_at": db.Column(db.Time()),
+        }
+        models.append(type("Model{}".format(i), (db.Model,), attrs))
+
+    db.configure_mappers()
+    for model in models:
+        meta.model_info(model)
+    return models
+
+
+def run(cache):
+    """Times building the schema and prints the duration in milliseconds."""
+    if not cache:
+        column._column_info_classes = NoCache()
+
+    start = perf_counter()
+    models = build_schema()
+    startup = perf_counter() - start
+
+    columns = [c for model in models for c in model.__table__.columns]
+    start = perf_counter()
+    for c in columns:
+        column.column_info(c)
+    print(startup * 1e3, (perf_counter() - start) * 1e3)
+
+
+def main():
+    # every schema runs in a fresh interpreter as mappers accumulate in sqlalchemy registries
+    results = {}
+    for label, flag in [("without", "--no-cache"), ("with", "--cache")]:
+        runs = [
+            subprocess.run(
+                [sys.executable, "-m", "benchmarks.startup", flag], stdout=subprocess.PIPE, check=True
+            ).stdout.split()
+            for _ in range(5)
+        ]
+        results[label] = startup, columns = [min(float(r[i]) for r in runs) for i in range(2)]
+        print("{:<60} {:>10.3f} ms".format("300 models {} column info class cache".format(label), startup))
+        print("{:<60} {:>10.3f} ms".format("column_info for 3600 columns {} cache".format(label), columns))
+
+    print("{:<60} {:>10.3f} ms".format("startup savings", results["without"][0] - results["with"][0]))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        run(sys.argv[1] == "--cache")
+    else:
+        main()
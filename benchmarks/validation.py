@@ -0,0 +1,27 @@
+"""Benchmarks ``full_clean`` on a 30 column model.
+
+Run with::
+
+    python -m benchmarks.validation
+"""
+from . import bench, setup
+
+
+setup()
+
+from django_sorcery.db import meta  # noqa isort:skip
+
+from .models import make_wide  # noqa isort:skip
+
+
+def main():
+    instance = make_wide()
+    info = meta.model_info(instance.__class__)
+    instance.full_clean()
+
+    bench("model_info.clean_fields 30 columns", lambda: info.clean_fields(instance), 10000)
+    bench("full_clean 30 columns", instance.full_clean, 10000)
+
+
+if __name__ == "__main__":
+    main()
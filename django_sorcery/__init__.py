@@ -5,7 +5,6 @@ from .__version__ import (
     __version__,
 )
 
-
 __all__ = [
     "__author__",
     "__author_email__",
@@ -0,0 +1,21 @@
+"""Django app config for django-sorcery."""
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class SorceryConfig(AppConfig):
+    """Django Sorcery app config which warms up model metadata when
+    ``DJANGO_SORCERY["warmup"]`` is enabled, e.g.::
+
+        DJANGO_SORCERY = {"warmup": {"parallel": True}}
+    """
+
+    name = "django_sorcery"
+    verbose_name = "Django Sorcery"
+
+    def ready(self):
+        options = getattr(settings, "DJANGO_SORCERY", {}).get("warmup")
+        if options:
+            from .db import meta
+
+            meta.warmup(parallel=isinstance(options, dict) and options.get("parallel", False))
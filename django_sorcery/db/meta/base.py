@@ -9,6 +9,17 @@ class model_info_meta(type):
     _registry = {}
 
     def __call__(cls, model, *args, **kwargs):
+        # fast path for instances and classes which are already registered
+        registry = cls._registry
+        info = registry.get(type(model))
+        if info is None:
+            try:
+                info = registry.get(model)
+            except TypeError:
+                pass
+        if info is not None:
+            return info
+
         obj = sa.inspect(model)
 
         if isinstance(obj, sa.orm.Mapper):
@@ -19,6 +30,7 @@ class model_info_meta(type):
 
         if model not in cls._registry:
             instance = super().__call__(model, *args, **kwargs)
-            cls._registry[model] = instance
+            # setdefault keeps the first instance when built concurrently
+            return cls._registry.setdefault(model, instance)
 
         return cls._registry[model]
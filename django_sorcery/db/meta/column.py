@@ -10,7 +10,9 @@ from django import forms as djangoforms
 from django.conf import settings
 from django.core import validators as djangovalidators
 from django.core.exceptions import ValidationError
+from django.core.signals import setting_changed
 from django.db.models import fields as djangomodelfields
+from django.dispatch import receiver
 from django.forms import fields as djangofields
 from django.utils import timezone
 from django.utils.text import capfirst
@@ -19,6 +21,35 @@ from ... import fields as sorceryfields
 from ...utils import sanitize_separators
 
 
+_column_info_classes = {}
+
+
+@receiver(setting_changed)
+def _clear_column_info_classes(setting, **kwargs):
+    if setting == "DJANGO_SORCERY":
+        _column_info_classes.clear()
+
+
+def _resolve_column_info_class(cls, type_class, enum_class):
+    """Returns the column info class mapped to the column type class or enum class."""
+    column_info_mapping = getattr(settings, "DJANGO_SORCERY", {}).get("column_info_mapping", COLUMN_INFO_MAPPING)
+
+    override_cls = None
+    for base in type_class.mro():
+        if base in column_info_mapping:
+            override_cls = column_info_mapping.get(base, cls)
+
+        for sub in enum_class.mro():
+            if (base, sub) in column_info_mapping:
+                override_cls = column_info_mapping.get((base, sub), cls)
+                break
+
+        if override_cls:
+            break
+
+    return override_cls or cls
+
+
 def _make_naive(value):
     if settings.USE_TZ and timezone.is_aware(value):
         default_timezone = timezone.get_default_timezone()
@@ -33,6 +64,7 @@ class column_info:
     default_form_class = None
     default_error_messages = djangomodelfields.Field.default_error_messages
     is_relation = False
+    python_type = None
 
     __slots__ = (
         "_coercer",
@@ -65,23 +97,12 @@ class column_info:
         if args:
             column = args.pop(0)
 
-        column_info_mapping = getattr(settings, "DJANGO_SORCERY", {}).get("column_info_mapping", COLUMN_INFO_MAPPING)
-
-        override_cls = None
-        for base in column.type.__class__.mro():
-            if base in column_info_mapping:
-                override_cls = column_info_mapping.get(base, cls)
-
-            enum_class = getattr(column.type, "enum_class", object) or object
-            for sub in enum_class.mro():
-                if (base, sub) in column_info_mapping:
-                    override_cls = column_info_mapping.get((base, sub), cls)
-                    break
+        enum_class = getattr(column.type, "enum_class", object) or object
+        key = (cls, column.type.__class__, enum_class)
+        _cls = _column_info_classes.get(key)
+        if _cls is None:
+            _cls = _column_info_classes[key] = _resolve_column_info_class(cls, column.type.__class__, enum_class)
 
-            if override_cls:
-                break
-
-        _cls = override_cls or cls
         return super().__new__(_cls)
 
     def __init__(self, column, prop=None, parent=None, name=None):
@@ -153,6 +174,21 @@ class column_info:
         """Convert input value to appropriate python object."""
         return self.coercer.to_python(value)
 
+    def get_coercer(self):
+        """Returns a callable which converts values like ``to_python`` but
+        returns values which already are of ``python_type`` as is."""
+        to_python = self.to_python
+        python_type = self.python_type
+        if python_type is None:
+            return to_python
+
+        def coerce(value):
+            if value is None or type(value) is python_type:
+                return value
+            return to_python(value)
+
+        return coerce
+
     def clean(self, value, instance):
         """Convert the value's type and run validation.
 
@@ -276,6 +312,17 @@ class enum_column_info(choice_column_info):
 
         return self.coercer.to_python(value)
 
+    def get_coercer(self):
+        to_python = self.to_python
+        enum_class = self.choices
+
+        def coerce(value):
+            if value is None or isinstance(value, enum_class):
+                return value
+            return to_python(value)
+
+        return coerce
+
 
 class numeric_column_info(column_info):
     """Provides meta info for numeric columns."""
@@ -283,6 +330,7 @@ class numeric_column_info(column_info):
     __slots__ = ("max_digits", "decimal_places")
 
     default_form_class = djangofields.DecimalField
+    python_type = decimal.Decimal
 
     def __init__(self, column, prop=None, parent=None, name=None):
         super().__init__(column, prop, parent, name)
@@ -312,6 +360,8 @@ class numeric_column_info(column_info):
 class boolean_column_info(column_info):
     """Provides meta info for boolean columns."""
 
+    python_type = bool
+
     def __init__(self, column, prop=None, parent=None, name=None):
         super().__init__(column, prop, parent, name)
         if not self.form_class:
@@ -333,6 +383,7 @@ class date_column_info(column_info):
     """Provides meta info for date columns."""
 
     default_form_class = djangofields.DateField
+    python_type = datetime.date
 
     @property
     def coercer(self):
@@ -361,6 +412,7 @@ class datetime_column_info(column_info):
     """Provides meta info for datetime columns."""
 
     default_form_class = djangofields.DateTimeField
+    python_type = datetime.datetime
 
     @property
     def coercer(self):
@@ -385,11 +437,23 @@ class datetime_column_info(column_info):
 
         return _make_naive(self.coercer.to_python(parsed))
 
+    def get_coercer(self):
+        to_python = self.to_python
+
+        def coerce(value):
+            # naive datetimes are returned as is by to_python regardless of USE_TZ
+            if value is None or (type(value) is datetime.datetime and value.tzinfo is None):
+                return value
+            return to_python(value)
+
+        return coerce
+
 
 class float_column_info(column_info):
     """Provides meta info for float columns."""
 
     default_form_class = djangofields.FloatField
+    python_type = float
 
     def to_python(self, value):
         if value is None:
@@ -405,6 +469,7 @@ class integer_column_info(column_info):
     """Provides meta info for integer columns."""
 
     default_form_class = djangofields.IntegerField
+    python_type = int
 
     def to_python(self, value):
         if value is None:
@@ -420,6 +485,7 @@ class interval_column_info(column_info):
     """Provides meta info for interval columns."""
 
     default_form_class = djangofields.DurationField
+    python_type = datetime.timedelta
 
     def to_python(self, value):
         if value is None:
@@ -435,6 +501,7 @@ class time_column_info(column_info):
     """Provides meta info for time columns."""
 
     default_form_class = djangofields.TimeField
+    python_type = datetime.time
 
     def to_python(self, value):
         if value is None:
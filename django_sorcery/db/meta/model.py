@@ -1,7 +1,10 @@
 """Metadata for sqlalchemy models."""
 from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from itertools import chain
+from operator import itemgetter
+from time import perf_counter
 
 import inflect
 import sqlalchemy as sa
@@ -24,6 +27,7 @@ class model_info(metaclass=model_info_meta):
     """A helper class that makes sqlalchemy model inspection easier."""
 
     __slots__ = (
+        "_field_lookup",
         "field_names",
         "app_label",
         "composites",
@@ -45,6 +49,7 @@ class model_info(metaclass=model_info_meta):
         "properties",
         "relationships",
         "unique_together",
+        "validation_plan",
         "verbose_name",
         "verbose_name_plural",
     )
@@ -52,6 +57,7 @@ class model_info(metaclass=model_info_meta):
     def __init__(self, model):
         self.model_class = self.model = model
         self.mapper = sa.inspect(model)
+        self._field_lookup = {}
         self.field_names = ()
         self.properties = OrderedDict()
         self.composites = OrderedDict()
@@ -60,6 +66,7 @@ class model_info(metaclass=model_info_meta):
         self.private_fields = ()
         self.local_fields = ()
         self.concrete_fields = ()
+        self.validation_plan = ()
 
         self.opts = getattr(model, "Meta", None)
 
@@ -123,6 +130,55 @@ class model_info(metaclass=model_info_meta):
             )
             if not attr.startswith("_")
         ]
+        self.validation_plan = self._get_validation_plan()
+
+        # earlier sources win the same way get_field probes them
+        self._field_lookup = {}
+        for fields in (self.relationships, self.composites, self.properties, self.primary_keys):
+            self._field_lookup.update(fields)
+
+    def _get_validation_plan(self):
+        """Resolves everything ``clean_fields`` needs to know about properties
+        upfront so that validating an instance only has to look at values.
+
+        Returns a tuple of ``(name, field, skippable, clean, hook, validators)``
+        entries where ``skippable`` tells whether a blank value can skip
+        validation, ``clean`` is set only when the column info customizes
+        cleaning, ``hook`` is the name of the ``clean_<field>`` method which
+        is looked up on each instance and ``validators`` are column validators.
+        """
+        local_remote_pairs = set()
+        for rel in self.relationships.values():
+            for col in chain(*rel.local_remote_pairs):
+                local_remote_pairs.add(col)
+
+        plan = []
+        for name, f in self.properties.items():
+            # skip validation if blank and:
+            # - field is nullable so blank value is valid
+            # - field has either local or server default value since we assume default value will pass validation
+            #   since default values are assigned during flush which as after which validation is verified
+            # - field is a foreign key in a relation that will be populated by the relation
+            # - field is marked as not required in column info
+            skippable = bool(
+                f.null
+                or f.column.default is not None
+                or f.column.server_default is not None
+                or f.column in local_remote_pairs
+                or not f.required
+            )
+            is_custom = type(f).clean is not column_info.clean or type(f).validate is not column_info.validate
+            plan.append(
+                (
+                    name,
+                    f,
+                    skippable,
+                    f.clean if is_custom else None,
+                    "clean_" + name,
+                    tuple(f.validators),
+                )
+            )
+        return tuple(plan)
 
     def __dir__(self):
         return (
@@ -135,15 +191,10 @@ class model_info(metaclass=model_info_meta):
         )
 
     def __getattr__(self, name):
-        if name in self.primary_keys:
-            return self.primary_keys[name]
-        if name in self.properties:
-            return self.properties[name]
-        if name in self.composites:
-            return self.composites[name]
-        if name in self.relationships:
-            return self.relationships[name]
-        return getattr(super(), name)
+        try:
+            return self._field_lookup[name]
+        except KeyError:
+            return getattr(super(), name)
 
     def __repr__(self):
         reprs = ["<model_info({!s})>".format(self.model_class.__name__)]
@@ -162,17 +213,11 @@ class model_info(metaclass=model_info_meta):
         return sa.inspect(instance)
 
     def get_field(self, field_name):
-        field = (
-            self.primary_keys.get(field_name)
-            or self.properties.get(field_name)
-            or self.composites.get(field_name)
-            or self.relationships.get(field_name)
-        )
-        if not field:
+        try:
+            return self._field_lookup[field_name]
+        except KeyError:
             raise FieldDoesNotExist
 
-        return field
-
     def primary_keys_from_dict(self, kwargs):
         """Returns the primary key tuple from a dictionary to be used in a
         sqlalchemy query.get() call."""
@@ -244,7 +289,9 @@ class model_info(metaclass=model_info_meta):
             lambda x: getattr(x, "clean_nested_fields", partial(self.clean_nested_fields, instance=instance))(
                 exclude=exclude, **kwargs
             ),
-            lambda x: getattr(x, "run_validators", partial(self.run_validators, instance=instance))(**kwargs),
+            lambda x: getattr(x, "run_validators", partial(self.run_validators, instance=instance))(
+                exclude=exclude, **kwargs
+            ),
             lambda x: x.clean(**kwargs),
         ]
         if kwargs.get("recursive", False):
@@ -260,41 +307,35 @@ class model_info(metaclass=model_info_meta):
     def clean_fields(self, instance, exclude=None, **kwargs):
         """Clean all fields on object."""
         errors = {}
-        exclude = exclude or []
-        local_remote_pairs = set()
-        for rel in self.relationships.values():
-            for col in chain(*rel.local_remote_pairs):
-                local_remote_pairs.add(col)
+        exclude = exclude or ()
+        plan = self.validation_plan
 
-        props = [
-            self.properties[prop]
-            for prop in getattr(instance, "_get_properties_for_validation", lambda x: self.properties.values())()
-            if prop in self.properties
-        ]
+        props = getattr(instance, "_get_properties_for_validation", None)
+        props = props() if props is not None else self.properties
+        if props is not self.properties:
+            plan = [p for p in plan if p[0] in props]
 
-        for f in props:
-            raw_value = getattr(instance, f.name)
-            is_blank = not bool(raw_value)
-            is_nullable = f.null
-            is_fk = f.column in local_remote_pairs
-            is_defaulted = f.column.default or f.column.server_default
-            is_required = f.required
-
-            # skip validation if:
-            # - field is blank and either when field is nullable so blank value is valid
-            # - field has either local or server default value since we assume default value will pass validation
-            #   since default values are assigned during flush which as after which validation is verified
-            # - field is blank and is a foreign key in a relation that will be populated by the relation
-            # - field is marked as not required in column info
-            is_skippable = is_blank and (is_nullable or is_defaulted or is_fk or not is_required)
+        for name, f, skippable, clean, hook, validators in plan:
+            if name in exclude:
+                continue
 
-            if f.name in exclude or is_skippable:
+            raw_value = getattr(instance, name)
+            if skippable and not raw_value:
                 continue
 
             try:
-                setattr(instance, f.name, f.clean(raw_value, instance))
+                if clean is not None:
+                    value = clean(raw_value, instance)
+                else:
+                    value = f.to_python(raw_value)
+                    getattr(instance, hook, bool)()
+                    if validators:
+                        f.run_validators(value)
             except ValidationError as e:
-                errors[f.name] = e.error_list
+                errors[name] = e.error_list
+            else:
+                if value is not raw_value:
+                    setattr(instance, name, value)
 
         if errors:
             raise NestedValidationError(errors)
@@ -388,6 +429,73 @@ class model_info(metaclass=model_info_meta):
 
     def run_validators(self, instance, exclude=None, **kwargs):
         """Check all model validators registered on ``validators``
-        attribute."""
-        runner = ValidationRunner(validators=getattr(instance, "validators", []))
+        attribute.
+
+        Validators which declare the fields they depend on via
+        ``depends_on`` are skipped when all of those fields are excluded.
+        """
+        exclude = exclude or []
+        validators = [
+            v
+            for v in getattr(instance, "validators", [])
+            if not getattr(v, "depends_on", None) or not all(f in exclude for f in v.depends_on)
+        ]
+        runner = ValidationRunner(validators=validators)
         runner.is_valid(instance, raise_exception=True)
+
+    def unchanged_fields(self, instance):
+        """Returns names of properties, composites and relationships of an
+        instance which have no pending changes according to attribute
+        history."""
+        attrs = self.sa_state(instance).attrs
+        unchanged = [name for name in self.properties if not attrs[name].history.has_changes()]
+        unchanged.extend(
+            name
+            for name, composite in self.composites.items()
+            if not any(attrs[prop.property.key].history.has_changes() for prop in composite.properties.values())
+        )
+        unchanged.extend(name for name in self.relationships if not attrs[name].history.has_changes())
+        return unchanged
+
+
+def warmup(dbs=None, parallel=False):
+    """Eagerly builds model metadata for all models in the ``models_registry`` of
+    given databases, all configured databases by default, so that first requests
+    don't pay for it.
+
+    When ``parallel`` is set, each app's models are built in a separate thread.
+    Returns an ordered dict of models and seconds it took to build their
+    metadata, slowest first. Models whose metadata is already registered, e.g.
+    by mapper configuration, are skipped.
+    """
+    if dbs is None:
+        from .. import databases
+
+        dbs = databases.values()
+
+    sa.orm.configure_mappers()
+
+    groups = OrderedDict()
+    for db in dbs:
+        for model in db.models_registry:
+            if isinstance(sa.inspect(model, raiseerr=False), sa.orm.Mapper):
+                app_config = apps.get_containing_app_config(model.__module__)
+                groups.setdefault(getattr(app_config, "label", None), []).append(model)
+
+    def build(models):
+        timings = []
+        for model in models:
+            if model in model_info._registry:
+                continue
+            start = perf_counter()
+            model_info(model)
+            timings.append((model, perf_counter() - start))
+        return timings
+
+    if parallel and len(groups) > 1:
+        with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+            results = list(executor.map(build, groups.values()))
+    else:
+        results = [build(models) for models in groups.values()]
+
+    return OrderedDict(sorted(chain.from_iterable(results), key=itemgetter(1), reverse=True))
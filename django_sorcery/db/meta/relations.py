@@ -47,6 +47,10 @@ class relation_info:
             self.field_kwargs["required"] = False
         else:
             self.field_kwargs["required"] = not all(col.nullable for col in self.foreign_keys)
+        if self.relationship.info.get("choices_cache_timeout") is not None:
+            self.field_kwargs["cache_timeout"] = self.relationship.info["choices_cache_timeout"]
+        if self.relationship.info.get("search_url") is not None:
+            self.field_kwargs["search_url"] = self.relationship.info["search_url"]
 
         self.local_remote_pairs = self.relationship.local_remote_pairs
 
@@ -1,16 +1,28 @@
 """sqlalchemy model related things."""
+import logging
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import partial
 from itertools import chain
+from operator import attrgetter, itemgetter
+from time import perf_counter
+from uuid import uuid4
 
 import sqlalchemy as sa
 import sqlalchemy.ext.declarative  # noqa
 import sqlalchemy.orm  # noqa
+from django.conf import settings
+from django.core.cache import caches
 from django.core.exceptions import ValidationError
 from django.utils.text import camel_case_to_spaces
-from sqlalchemy.orm.base import MANYTOONE, NO_VALUE
+from sqlalchemy.orm.base import MANYTOONE, NO_VALUE, ONETOMANY
 
+from ..utils import chunked
 from . import meta, signals
 from .mixins import CleanMixin
 
+logger = logging.getLogger(__name__)
+
 
 def simple_repr(instance, fields=None):
     """
@@ -48,6 +60,104 @@ def simple_repr(instance, fields=None):
     return "".join([instance.__class__.__name__, "(", ", ".join(chain(pk_reprs, sorted(field_reprs))), ")"])
 
 
+_serializer_plans = {}
+
+
+class SerializerPlan:
+    """
+    Compiled serializer for a model and a set of relationships
+    ------------------------------
+    model:
+        a model class
+    rels: list of relations
+        relationships to be serialized
+
+    Column and composite getters and nested plans for serialized
+    relationships are computed once so serializing instances does not have
+    to inspect the model again. Loaded attributes are read straight from the
+    instance dict, falling back to attribute access for anything which is
+    not loaded yet. Use :py:func:`get_serializer_plan` to get a cached plan.
+    """
+
+    def __init__(self, model, rels=()):
+        info = meta.model_info(model)
+        self.model = model
+        self.rels = frozenset(rels)
+
+        composite_keys = {
+            prop.property.key for composite in info.composites.values() for prop in composite.properties.values()
+        }
+        self.columns = tuple(name for name, _ in info.column_properties if name not in composite_keys)
+        getter, loaded_getter = attrgetter(*self.columns), itemgetter(*self.columns)
+        if len(self.columns) > 1:
+            self.get_columns, self.get_loaded_columns = getter, loaded_getter
+        else:
+            self.get_columns = lambda instance: (getter(instance),)
+            self.get_loaded_columns = lambda state: (loaded_getter(state),)
+
+        self.composites = tuple((name, attrgetter(name)) for name in info.composites)
+
+        self.relationships = []
+        for name, relationship in info.relationships.items():
+            attr = getattr(info.model_class, name)
+            if attr in self.rels:
+                sub_rels = [r for r in self.rels if r is not attr]
+                self.relationships.append((name, get_serializer_plan(relationship.related_model, *sub_rels)))
+
+    def __call__(self, instance):
+        if instance is None:
+            return None
+
+        if isinstance(instance, (list, set)):
+            return self.many(instance)
+
+        if instance.__class__ is not self.model:
+            return get_serializer_plan(instance.__class__, *self.rels).serialize(instance)
+
+        return self.serialize(instance)
+
+    def serialize(self, instance):
+        """Returns a dict of column attributes of an instance of the plan's
+        model."""
+        state = instance.__dict__
+        try:
+            values = self.get_loaded_columns(state)
+        except KeyError:
+            values = self.get_columns(instance)
+        data = dict(zip(self.columns, values))
+
+        for name, getter in self.composites:
+            comp = getter(instance)
+            data[name] = vars(comp) if comp else None
+
+        for name, plan in self.relationships:
+            data[name] = plan(state[name] if name in state else getattr(instance, name, None))
+
+        return data
+
+    def many(self, instances):
+        """Returns a list of dicts for a list of instances."""
+        model = self.model
+        serialize = self.serialize
+        return [serialize(i) if i.__class__ is model else self(i) for i in instances]
+
+
+def get_serializer_plan(model, *rels):
+    """
+    Return a cached serializer plan
+    ------------------------------
+    model:
+        a model class
+    rels: list of relations
+        relationships to be serialized
+    """
+    key = (model, frozenset(rels))
+    plan = _serializer_plans.get(key)
+    if plan is None:
+        plan = _serializer_plans[key] = SerializerPlan(model, rels)
+    return plan
+
+
 def serialize(instance, *rels):
     """
     Return a dict of column attributes
@@ -61,28 +171,13 @@ def serialize(instance, *rels):
         return None
 
     if isinstance(instance, (list, set)):
-        return [serialize(i, *rels) for i in instance]
+        instances = list(instance)
+        model = next((i.__class__ for i in instances if i is not None and not isinstance(i, (list, set))), None)
+        if model is None:
+            return [serialize(i, *rels) for i in instances]
+        return get_serializer_plan(model, *rels).many(instances)
 
-    info = meta.model_info(instance)
-    rels = set(rels)
-
-    data = {name: getattr(instance, name) for name, _ in info.column_properties}
-
-    for name, composite in info.composites.items():
-        comp = getattr(instance, name)
-        data[name] = vars(comp) if comp else None
-        # since we're copying, remove props from the composite
-        for _, prop in composite.properties.items():
-            data.pop(prop.property.key, None)
-
-    for name in info.relationships:
-        attr = getattr(info.model_class, name)
-        if attr in rels:
-            sub_instance = getattr(instance, name, None)
-            sub_rels = [r for r in rels if r is not attr]
-            data[name] = serialize(sub_instance, *sub_rels)
-
-    return data
+    return get_serializer_plan(instance.__class__, *rels).serialize(instance)
 
 
 def deserialize(model, data):
@@ -156,6 +251,411 @@ def _deserialize(model, data, identity_map):
     return instance
 
 
+class _BulkNode:
+    """A row to be inserted in bulk, which may take some of its values from
+    other rows once they are inserted."""
+
+    __slots__ = ("mapper", "table", "values", "sources", "inserted")
+
+    def __init__(self, mapper, table, values):
+        if mapper is not None and len(mapper.tables) > 1:
+            raise ValueError(
+                "Bulk inserts do not support joined table inheritance of {}".format(mapper.class_.__name__)
+            )
+        self.mapper = mapper
+        self.table = table
+        self.values = values
+        self.sources = []
+        self.inserted = False
+
+    @property
+    def identity(self):
+        return tuple(self.values.get(column) for column in self.mapper.primary_key)
+
+    @property
+    def identity_key(self):
+        identity = self.identity
+        if any(value is None for value in identity):
+            return None
+        return self.mapper.identity_key_from_primary_key(identity)
+
+
+class _BulkGraph:
+    """A graph of rows which are inserted table by table in dependency order
+    with foreign keys resolved from the inserted rows they reference."""
+
+    _compiled_inserts = OrderedDict()
+    max_compiled_inserts = 100
+
+    def __init__(self):
+        self.nodes = []
+
+    def add(self, mapper, values, table=None):
+        node = _BulkNode(mapper, mapper.local_table if table is None else table, values)
+        self.nodes.append(node)
+        return node
+
+    def link(self, relationship, parent, child):
+        """Links a parent row to a child row of a parent's relationship."""
+        if relationship.secondary is not None:
+            row = self.add(None, {}, table=relationship.secondary)
+            row.sources.append((parent, relationship.synchronize_pairs))
+            row.sources.append((child, relationship.secondary_synchronize_pairs))
+        elif relationship.direction == MANYTOONE:
+            parent.sources.append((child, relationship.synchronize_pairs))
+        else:
+            child.sources.append((parent, relationship.synchronize_pairs))
+
+    def link_identities(self, identity_map):
+        """Links rows to the rows of ``identity_map`` their many-to-one
+        foreign key values refer to, unless the relationship is already
+        linked."""
+        for node in list(identity_map.values()):
+            info = meta.model_info(node.mapper.class_)
+            for rel in info.relationships.values():
+                if rel.direction != MANYTOONE:
+                    continue
+                if any(pairs is rel.relationship.synchronize_pairs for _, pairs in node.sources):
+                    continue
+
+                identity = [node.values.get(local) for local, _ in rel.local_remote_pairs_for_identity_key]
+                if any(value is None for value in identity):
+                    continue
+
+                related_node = identity_map.get(rel.related_mapper.identity_key_from_primary_key(identity))
+                if related_node is not None and related_node is not node:
+                    self.link(rel.relationship, node, related_node)
+
+    def execute(self, session, batch_size=1000):
+        tables = {}
+        for node in self.nodes:
+            tables.setdefault(node.table, []).append(node)
+        if not tables:
+            return
+
+        order = {table: i for i, table in enumerate(next(iter(tables)).metadata.sorted_tables)}
+        for table in sorted(tables, key=lambda t: order.get(t, len(order))):
+            pending = tables[table]
+            while pending:
+                ready, pending = self._partition(pending)
+                if not ready:
+                    raise ValueError("Cannot bulk insert rows with cyclic dependencies into {}".format(table.name))
+                self._insert(session, table, ready, batch_size)
+
+    def _partition(self, nodes):
+        ready, pending = [], []
+        for node in nodes:
+            (ready if all(source.inserted for source, _ in node.sources) else pending).append(node)
+        return ready, pending
+
+    def _insert(self, session, table, nodes, batch_size):
+        connection = session.connection(mapper=nodes[0].mapper, clause=table)
+        record_written_tables(session, [table])
+        dialect = connection.dialect
+        pk = list(table.primary_key.columns)
+
+        groups = {}
+        for node in nodes:
+            for source, pairs in node.sources:
+                for source_column, column in pairs:
+                    node.values[column] = source.values.get(source_column)
+            node.inserted = True
+            # like the orm, missing values of generated columns are left to their defaults
+            for column in [c for c, v in node.values.items() if v is None and _is_generated(c)]:
+                del node.values[column]
+            params = {column.key: value for column, value in node.values.items()}
+            generated = any(node.values.get(column) is None for column in pk)
+            columns = sorted(node.values, key=attrgetter("key"))
+            group = groups.setdefault((generated, tuple(c.key for c in columns)), (columns, []))
+            group[1].append((node, params))
+
+        returning = dialect.implicit_returning and dialect.supports_multivalues_insert
+        # like the orm, reuse one insert statement so that it is compiled once per set of columns
+        insert = table.insert()
+        connection = connection.execution_options(compiled_cache={})
+        for (generated, keys), (columns, rows) in groups.items():
+            for batch in chunked(rows, batch_size):
+                if not generated:
+                    connection.execute(insert, [params for _, params in batch])
+                elif returning and columns:
+                    stmt = self._returning_insert(
+                        nodes[0].mapper, table, keys, columns, len(batch), dialect, len(batch) == batch_size
+                    )
+                    values = {
+                        "v{}_{}".format(n, k): params[c.key]
+                        for n, (_, params) in enumerate(batch)
+                        for k, c in enumerate(columns)
+                    }
+                    for (node, _), row in zip(batch, connection.execute(stmt, values)):
+                        node.values.update((column, row[column]) for column in pk)
+                else:
+                    for node, params in batch:
+                        result = connection.execute(insert, params)
+                        node.values.update(zip(pk, result.inserted_primary_key))
+
+    def _returning_insert(self, mapper, table, keys, columns, size, dialect, cache=False):
+        """Returns a compiled multi-row ``INSERT ... RETURNING`` statement,
+        full batches are cached since compiling thousands of bind parameters
+        dominates the cost of the insert.
+
+        At most ``max_compiled_inserts`` statements are cached, least recently
+        used ones are evicted first.
+        """
+        key = (mapper, table, keys, size, dialect)
+        compiled = self._compiled_inserts.get(key)
+        if compiled is not None:
+            self._compiled_inserts.move_to_end(key)
+        else:
+            rows = [
+                {c: sa.bindparam("v{}_{}".format(n, k), type_=c.type) for k, c in enumerate(columns)}
+                for n in range(size)
+            ]
+            compiled = table.insert().values(rows).returning(*table.primary_key.columns).compile(dialect=dialect)
+            if cache:
+                self._compiled_inserts[key] = compiled
+                while len(self._compiled_inserts) > self.max_compiled_inserts:
+                    self._compiled_inserts.popitem(last=False)
+        return compiled
+
+
+def _is_generated(column):
+    return column.primary_key or column.default is not None or column.server_default is not None
+
+
+def bulk_deserialize(session, model, data, batch_size=1000):
+    """
+    Insert data in bulk without creating model instances and return primary keys
+    ------------------------------
+    session: Session
+        a session or db to insert with
+    model:
+        a model class
+    data: dict or list of dicts
+        values, possibly with nested relationship values
+    batch_size: int
+        maximum number of rows per insert statement
+
+    Nested payloads are flattened into rows per table which are inserted in
+    ``metadata.sorted_tables`` order with foreign keys resolved from the
+    inserted related rows or from identity keys of other records in the
+    payload. Rows are written with executemany, or with multi-row
+    ``INSERT ... RETURNING`` when primary keys are generated and the dialect
+    supports it. Returns primary key tuples of the top level records.
+
+    Model validation and ORM events are bypassed.
+    """
+    graph = _BulkGraph()
+    identity_map = {}
+    nodes = _bulk_deserialize(graph, model, data, identity_map)
+
+    graph.link_identities(identity_map)
+    graph.execute(session, batch_size)
+
+    if isinstance(nodes, list):
+        return [None if node is None else node.identity for node in nodes]
+    return None if nodes is None else nodes.identity
+
+
+def _bulk_deserialize(graph, model, data, identity_map):
+    if data is None:
+        return None
+
+    if isinstance(data, (list, tuple, set)):
+        return [_bulk_deserialize(graph, model, i, identity_map) for i in data]
+
+    info = meta.model_info(model)
+    mapper = info.mapper
+
+    values = {prop.columns[0]: data[prop.key] for prop in mapper.column_attrs if prop.key in data}
+
+    for composite in mapper.composites:
+        composite_data = data.get(composite.key)
+        if composite_data is not None:
+            composite_args = [composite_data.get(i) for i in info.composites[composite.key].properties]
+            composite_values = composite.composite_class(*composite_args).__composite_values__()
+            values.update((prop.columns[0], value) for prop, value in zip(composite.props, composite_values))
+
+    node = _BulkNode(mapper, mapper.local_table, values)
+    identity_key = node.identity_key
+    if identity_key is not None:
+        if identity_key in identity_map:
+            return identity_map[identity_key]
+        identity_map[identity_key] = node
+    graph.nodes.append(node)
+
+    for relationship in mapper.relationships:
+        if relationship.key in data:
+            related = _bulk_deserialize(graph, relationship.mapper.class_, data[relationship.key], identity_map)
+            for related_node in related if isinstance(related, list) else [related]:
+                if related_node is not None:
+                    graph.link(relationship, node, related_node)
+
+    return node
+
+
+_clone_plans = {}
+
+
+class _ClonePlan:
+    """Columns and relationships of a mapper used for cloning."""
+
+    def __init__(self, mapper):
+        self.mapper = mapper
+        self.foreign_keys = set(
+            chain(
+                *[
+                    fk.columns
+                    for fk in chain(*[table.constraints for table in mapper.tables])
+                    if isinstance(fk, sa.ForeignKeyConstraint)
+                ]
+            )
+        )
+        # primary keys are regenerated unless they are also foreign keys which are remapped
+        self.columns = tuple(c for c in mapper.columns if not c.primary_key or c in self.foreign_keys)
+        self.columns_by_key = {mapper.get_property_by_column(c).key: c for c in self.columns}
+        self.get_values = attrgetter(*self.columns_by_key) if len(self.columns) > 1 else None
+        self.composites = {composite.key: composite for composite in mapper.composites}
+        self.relationships = tuple((getattr(mapper.class_, rel.key), rel) for rel in mapper.relationships)
+
+    def values(self, instance):
+        if self.get_values is None:
+            return {c: getattr(instance, key) for key, c in self.columns_by_key.items()}
+        return dict(zip(self.columns, self.get_values(instance)))
+
+
+def _get_clone_plan(mapper):
+    plan = _clone_plans.get(mapper)
+    if plan is None:
+        plan = _clone_plans[mapper] = _ClonePlan(mapper)
+    return plan
+
+
+def _clone_relations(rels):
+    relations = {}
+    for rel in rels:
+        r = rel
+        rkwargs = {}
+        if isinstance(rel, tuple):
+            r, rkwargs = rel
+
+        relations[r] = rkwargs
+    return relations
+
+
+def bulk_clone(instances, *rels, batch_size=1000, session=None, **kwargs):
+    """
+    Clone a graph of model instances with bulk inserts and return primary keys
+    --------------------------------------------------------------------------
+    instances: Model or list of Models
+        model instances to clone
+    relations: list or relations or a tuple of relation and kwargs for that relation
+        relationships to be cloned with relationship and optionally kwargs
+    batch_size: int
+        maximum number of rows per insert statement
+    session: Session
+        a session or db to insert with, defaults to the session of the first instance
+    kwargs: dict string of any
+        attribute values to be overridden, relationship overrides are only
+        supported for many-to-one and many-to-many relationships
+
+    Unlike :py:func:`clone`, no model instances are created. Rows are copied
+    with column plans computed once per mapper and inserted in batches per
+    table. Each instance is cloned once even when it is reachable through
+    multiple relationships. Primary keys are regenerated and foreign keys
+    referring to cloned rows are remapped to the clones, while foreign keys
+    referring to rows outside of the cloned graph are kept. Returns primary
+    key tuples of the clones of ``instances``.
+
+    Model validation and ORM events are bypassed.
+    """
+    single = not isinstance(instances, (list, set, tuple))
+    instances = [instances] if single else list(instances)
+    if not instances:
+        return []
+
+    if session is None:
+        session = sa.orm.object_session(instances[0])
+    if session is None:
+        raise ValueError("Cannot bulk clone detached instances without a session")
+
+    graph = _BulkGraph()
+    identity_map = {}
+    clones = {}
+    relations = _clone_relations(rels)
+    nodes = [_bulk_clone(graph, instance, relations, kwargs, clones, identity_map) for instance in instances]
+
+    graph.link_identities(identity_map)
+    graph.execute(session, batch_size)
+
+    identities = [node.identity for node in nodes]
+    return identities[0] if single else identities
+
+
+def _bulk_clone(graph, instance, relations, kwargs, clones, identity_map):
+    state = sa.inspect(instance)
+    if state in clones:
+        return clones[state]
+
+    plan = _get_clone_plan(state.mapper)
+    values = plan.values(instance)
+
+    for key, value in kwargs.items():
+        if key in plan.columns_by_key:
+            values[plan.columns_by_key[key]] = value
+        elif key in plan.composites:
+            composite = plan.composites[key]
+            composite_values = value.__composite_values__() if value is not None else [None] * len(composite.props)
+            values.update((prop.columns[0], v) for prop, v in zip(composite.props, composite_values))
+
+    node = clones[state] = graph.add(state.mapper, values)
+    if state.key is not None:
+        identity_map[state.key] = node
+
+    for attr, relation in plan.relationships:
+        if relation.key in kwargs:
+            if relation.direction == ONETOMANY:
+                raise ValueError(
+                    "Cannot bulk clone {} with overridden one-to-many relationship {}".format(
+                        state.mapper.class_.__name__, relation.key
+                    )
+                )
+            related = kwargs[relation.key]
+            related_nodes = [_persistent_node(i) for i in _related_instances(relation, related)]
+        elif attr in relations:
+            related = getattr(instance, relation.key, None)
+            sub_rels = {r: kw for r, kw in relations.items() if r is not attr}
+            related_nodes = [
+                _bulk_clone(graph, i, sub_rels, relations[attr], clones, identity_map)
+                for i in _related_instances(relation, related)
+            ]
+        else:
+            continue
+
+        for related_node in related_nodes:
+            graph.link(relation, node, related_node)
+
+    return node
+
+
+def _related_instances(relation, related):
+    if related is None:
+        return []
+    if not relation.uselist:
+        return [related]
+    if isinstance(related, dict):
+        return list(related.values())
+    return list(related)
+
+
+def _persistent_node(instance):
+    mapper = sa.inspect(instance).mapper
+    values = {c: getattr(instance, k) for k, c in _get_clone_plan(mapper).columns_by_key.items()}
+    node = _BulkNode(mapper, mapper.local_table, values)
+    node.values.update(zip(mapper.primary_key, mapper.primary_key_from_instance(instance)))
+    node.inserted = True
+    return node
+
+
 def clone(instance, *rels, **kwargs):
     """
     Clone a model instance with or without any relationships
@@ -173,27 +673,11 @@ def clone(instance, *rels, **kwargs):
     if isinstance(instance, (list, set)):
         return [clone(i, *rels, **kwargs) for i in instance]
 
-    relations = {}
-    for rel in rels:
-        r = rel
-        rkwargs = {}
-        if isinstance(rel, tuple):
-            r, rkwargs = rel
-
-        relations[r] = rkwargs
+    relations = _clone_relations(rels)
 
     mapper = sa.inspect(instance).mapper
     kwargs = kwargs or {}
-
-    fks = set(
-        chain(
-            *[
-                fk.columns
-                for fk in chain(*[table.constraints for table in mapper.tables])
-                if isinstance(fk, sa.ForeignKeyConstraint)
-            ]
-        )
-    )
+    fks = _get_clone_plan(mapper).foreign_keys
 
     for column in mapper.columns:
         prop = mapper.get_property_by_column(column)
@@ -301,7 +785,7 @@ class Base(CleanMixin):
         return meta.model_info(self.__class__).relationships
 
 
-_instant_defaults = set()
+_instant_defaults = {}
 
 
 def instant_defaults(cls):
@@ -321,39 +805,123 @@ def instant_defaults(cls):
     if not mapper:
         return
 
-    _instant_defaults.add(cls)
+    if cls not in _instant_defaults:
+        # defaults are resolved on first init since mappers may not be configurable yet
+        _instant_defaults[cls] = None
+        sa.event.listen(cls, "init", partial(_set_instant_defaults, cls))
+
     return cls
 
 
 signals.declare_last.connect(instant_defaults)
 
 
-def _set_instant_defaults(target, args, kwargs):
-    info = meta.model_info(target.__class__)
-    for prop in info.properties.values():
-        if not prop.column.default or not hasattr(prop.column.default, "arg") or callable(prop.column.default.arg):
-            continue  # pragma: nocover
-
-        if getattr(target, prop.name, None) is None:
-            setattr(target, prop.name, prop.column.default.arg)
+def _get_instant_defaults(cls):
+    """Returns ``(attribute key, default value)`` pairs of the model columns with
+    simple default values."""
+    info = meta.model_info(cls)
+    return tuple(
+        (prop.name, prop.column.default.arg)
+        for prop in info.properties.values()
+        if prop.column.default is not None
+        and hasattr(prop.column.default, "arg")
+        and not callable(prop.column.default.arg)
+    )
 
 
-@sa.event.listens_for(sa.orm.mapper, "after_configured")
-def _configure_instant_defaults():
-    for cls in _instant_defaults:
-        if not sa.event.contains(cls, "init", _set_instant_defaults):
-            sa.event.listen(cls, "init", _set_instant_defaults)
+def _set_instant_defaults(cls, target, args, kwargs):
+    defaults = _instant_defaults[cls]
+    if defaults is None:
+        defaults = _instant_defaults[cls] = _get_instant_defaults(cls)
 
-    _instant_defaults.clear()
+    # init runs before constructor kwargs are applied so only pre-populated attributes are in __dict__
+    state = target.__dict__
+    for key, value in defaults:
+        if state.get(key) is None:
+            setattr(target, key, value)
 
 
 @signals.before_flush.connect
 def full_clean_flush_handler(session, **kwargs):
     """Signal handler for executing ``full_clean`` on all dirty and new objects
-    in session."""
-    for i in session.dirty | session.new:
-        if isinstance(i, Base):
-            i.full_clean()
+    in session.
+
+    When ``DJANGO_SORCERY["incremental_validation"]`` is enabled, dirty
+    instances only validate changed fields and the composites containing
+    them, and skip validators whose ``depends_on`` fields are all unchanged.
+
+    Validators with ``batch`` enabled validate all instances of a model with
+    ``validate_batch`` first. Instances within :py:func:`skip_flush_validation`
+    are not validated.
+    """
+    start = perf_counter()
+    incremental = getattr(settings, "DJANGO_SORCERY", {}).get("incremental_validation", False)
+    new = session.new
+    validated = session.info.get(_VALIDATED_KEY, {})
+    instances = [
+        i
+        for i in session.dirty | new
+        if isinstance(i, Base) and (i not in validated or validated[i] != validated_state(i))
+    ]
+
+    try:
+        with batch_validation(instances):
+            for i in instances:
+                if incremental and i not in new:
+                    i.full_clean(exclude=meta.model_info(i.__class__).unchanged_fields(i))
+                else:
+                    i.full_clean()
+    finally:
+        signals.flush_validated.send(session, instances=instances, duration=perf_counter() - start)
+
+
+_VALIDATED_KEY = "django_sorcery:validated"
+
+
+def validated_state(instance):
+    """Returns a snapshot of the attribute values of a validated instance
+    for :py:func:`skip_flush_validation`."""
+    return dict(sa.inspect(instance).dict)
+
+
+@contextmanager
+def skip_flush_validation(session, validated):
+    """Context manager which skips validating instances when ``session`` is
+    flushed, e.g. when they were already validated.
+
+    ``validated`` maps instances to their :py:func:`validated_state` taken
+    when they were validated, instances changed since then are validated
+    again.
+    """
+    states = session.info.setdefault(_VALIDATED_KEY, {})
+    added = {i: state for i, state in validated.items() if i not in states}
+    states.update(added)
+    try:
+        yield
+    finally:
+        for i in added:
+            states.pop(i, None)
+
+
+@contextmanager
+def batch_validation(instances):
+    """Context manager which validates ``instances`` with validators
+    supporting batches, e.g. ``ValidateUnique(batch=True)``, all at once per
+    model and clears their results on exit."""
+    batches = {}
+    for i in instances:
+        for validator in getattr(i, "validators", ()):
+            if getattr(validator, "batch", False):
+                batches.setdefault((validator, i.__class__), []).append(i)
+
+    try:
+        for (validator, _), batch in batches.items():
+            validator.validate_batch(batch)
+
+        yield
+    finally:
+        for validator, _ in batches:
+            validator.clear_batch()
 
 
 _autocoerce_attrs = set()
@@ -403,19 +971,115 @@ def autocoerce(cls):
     return cls
 
 
-def _coerce(target, value, oldvalue, initiator):
-    minfo = meta.model_info(target)
-    cinfo = minfo.properties.get(initiator.key) or minfo.primary_keys.get(initiator.key)
-    try:
-        return cinfo.to_python(value) if cinfo else value
-    except ValidationError as ex:
-        raise ValidationError({initiator.key: ex})
+_coercers = {}
+
+
+def _make_coercer(attr):
+    """Returns a set event listener for the attribute with the column coercer
+    resolved upfront."""
+    minfo = meta.model_info(attr.class_)
+    cinfo = minfo.properties.get(attr.key) or minfo.primary_keys.get(attr.key)
+    if cinfo is None:
+        return None
+
+    key = attr.key
+    coerce = cinfo.get_coercer()
+
+    def _coerce(target, value, oldvalue, initiator):
+        try:
+            return coerce(value)
+        except ValidationError as ex:
+            raise ValidationError({key: ex})
+
+    return _coerce
 
 
 @sa.event.listens_for(sa.orm.mapper, "after_configured")
 def _configure_coercers():
     for target in _autocoerce_attrs:
-        if not sa.event.contains(target, "set", _coerce):
-            sa.event.listen(target, "set", _coerce, retval=True)
+        if target in _coercers:
+            continue
+
+        listener = _coercers[target] = _make_coercer(target)
+        if listener is not None:
+            sa.event.listen(target, "set", listener, retval=True)
 
     _autocoerce_attrs.clear()
+
+
+def get_choices_cache():
+    """Returns the django cache used for caching choices, configured with
+    ``DJANGO_SORCERY["choices_cache"]`` alias and defaults to ``default``."""
+    return caches[getattr(settings, "DJANGO_SORCERY", {}).get("choices_cache", "default")]
+
+
+def _table_version_key(table):
+    return "django_sorcery:table_version:{}".format(table)
+
+
+def get_table_versions(tables):
+    """Returns cache versions of given table names which change whenever a
+    commit writes to any of the tables.
+
+    Missing versions are created, which registers the tables for versioning
+    on commit.
+    """
+    cache = get_choices_cache()
+    keys = [_table_version_key(table) for table in sorted(tables)]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            versions[key] = uuid4().hex
+            if not cache.add(key, versions[key], None):
+                # another process added the version first
+                versions[key] = cache.get(key, versions[key])
+    return tuple(versions[key] for key in keys)
+
+
+_WRITTEN_TABLES_KEY = "django_sorcery:written_tables"
+
+
+def record_written_tables(session, tables):
+    """Records tables written in ``session`` outside of the unit of work,
+    e.g. by bulk statements, so that their cache versions change on
+    commit."""
+    session.info.setdefault(_WRITTEN_TABLES_KEY, set()).update(table.fullname for table in tables)
+
+
+@sa.event.listens_for(sa.orm.Session, "after_bulk_update")
+@sa.event.listens_for(sa.orm.Session, "after_bulk_delete")
+def _record_bulk_tables(context):
+    record_written_tables(context.session, context.mapper.tables)
+
+
+@signals.after_rollback.connect
+def written_tables_rollback_handler(session, **kwargs):
+    """Forgets tables written in the rolled back transaction."""
+    session.info.pop(_WRITTEN_TABLES_KEY, None)
+
+
+@signals.after_commit.connect
+def table_versions_commit_handler(session, **kwargs):
+    """Changes cache versions of the tables written by models committed or
+    deleted in the session and of tables recorded with
+    :py:func:`record_written_tables`, e.g. by ``query.update()``,
+    ``query.delete()`` and bulk inserts.
+
+    Only tables which have a version, i.e. which cached choices were loaded
+    from, are changed. Cache errors are logged since the commit already
+    happened.
+    """
+    models = {type(i) for i in chain(getattr(session, "models_committed", ()), getattr(session, "models_deleted", ()))}
+    tables = {table.fullname for model in models for table in sa.inspect(model).tables}
+    tables.update(session.info.pop(_WRITTEN_TABLES_KEY, ()))
+    keys = {_table_version_key(table) for table in tables}
+    if not keys:
+        return
+
+    try:
+        cache = get_choices_cache()
+        versioned = cache.get_many(keys)
+        if versioned:
+            cache.set_many({key: uuid4().hex for key in versioned}, None)
+    except Exception:
+        logger.exception("Error changing table versions of cached choices")
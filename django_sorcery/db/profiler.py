@@ -1,19 +1,123 @@
 """sqlalchemy profiling things."""
+import functools
+import hashlib
+import json
 import logging
+import random
+import re
+import sys
 import time
-from collections import defaultdict, namedtuple
+from collections import OrderedDict, defaultdict, namedtuple
 from functools import partial
-from threading import local
+from itertools import chain
+from threading import Lock, local
+from time import perf_counter
 
 import sqlalchemy as sa
 from django.conf import settings
 
+from ..exceptions import QueryBudgetExceeded
+from . import signals
 
 logger = logging.getLogger(__name__)
 STATEMENT_TYPES = {"SELECT": "select", "INSERT INTO": "insert", "UPDATE": "update", "DELETE": "delete"}
 
 
+EXPLAIN_PREFIXES = {"sqlite": "EXPLAIN QUERY PLAN ", "oracle": "EXPLAIN PLAN FOR "}
+IGNORED_CALL_SITE_MODULES = ("sqlalchemy.", "django_sorcery.db.")
+
+_placeholders = re.compile(r"%\(\w+\)s|%s|(?<!:):\w+|\$\d+|\?")
+_literals = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_in_lists = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_whitespace = re.compile(r"\s+")
+
+
+SPAN_KIND_INTERNAL = "INTERNAL"
+SPAN_KIND_SERVER = "SERVER"
+SPAN_KIND_CLIENT = "CLIENT"
+STATUS_UNSET = "UNSET"
+STATUS_OK = "OK"
+STATUS_ERROR = "ERROR"
+
 Query = namedtuple("Query", ["timestamp", "statement", "parameters", "duration"])
+SlowQuery = namedtuple(
+    "SlowQuery",
+    ["timestamp", "fingerprint", "statement", "parameters", "duration", "alias", "engine", "call_site", "plan"],
+)
+
+
+def fingerprint(statement):
+    """Returns a short stable hash of a statement with literals, ``IN`` lists
+    and whitespace normalized so that same queries with different values
+    share the same fingerprint."""
+    normalized = _placeholders.sub("?", statement)
+    normalized = _literals.sub("?", normalized)
+    normalized = _in_lists.sub("(?)", normalized)
+    normalized = _whitespace.sub(" ", normalized).strip().lower()
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:16]
+
+
+def get_call_site():
+    """Returns the first stack frame outside of sqlalchemy and sorcery db
+    internals as ``path:lineno in function``."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if not module.startswith(IGNORED_CALL_SITE_MODULES) and module != __name__:
+            code = frame.f_code
+            return "{}:{} in {}".format(code.co_filename, frame.f_lineno, code.co_name)
+        frame = frame.f_back
+    return None  # pragma: nocover
+
+
+def get_alias(engine):
+    """Returns the configured database alias for an engine, if any."""
+    from . import databases
+
+    for alias, db in databases.items():
+        # only look at already created registries, sessions may be created by other registry implementations
+        factory = getattr(db._registry, "createfunc", None)
+        if (getattr(factory, "kw", None) or {}).get("bind") is engine:
+            return alias
+    return None
+
+
+class RateLimiter:
+    """A fixed window rate limiter that allows ``limit`` hits per key within
+    ``period`` seconds and counts suppressed hits in between.
+
+    At most ``max_keys`` windows are kept, least recently hit keys are
+    evicted first.
+    """
+
+    def __init__(self, limit=10, period=60.0, max_keys=1000):
+        self.limit = limit
+        self.period = period
+        self.max_keys = max_keys
+        self.windows = OrderedDict()
+        self.lock = Lock()
+
+    def acquire(self, key):
+        """Returns a tuple of whether hit is allowed and how many hits were
+        suppressed since the last allowed one."""
+        now = time.monotonic()
+        with self.lock:
+            start, count, suppressed = self.windows.get(key, (now, 0, 0))
+            if now - start >= self.period:
+                start, count = now, 0
+
+            if count >= self.limit:
+                self._set(key, (start, count, suppressed + 1))
+                return False, suppressed + 1
+
+            self._set(key, (start, count + 1, 0))
+            return True, suppressed
+
+    def _set(self, key, window):
+        self.windows[key] = window
+        self.windows.move_to_end(key)
+        while len(self.windows) > self.max_keys:
+            self.windows.popitem(last=False)
 
 
 class SQLAlchemyProfiler:
@@ -22,12 +126,34 @@ class SQLAlchemyProfiler:
 
     Can also capture executed sql statements. Useful for profiling or
     testing sql statements.
+
+    When ``slow_query_threshold`` (in seconds) is provided, any statement
+    slower than the threshold is logged with its fingerprint, bound
+    parameters, call site and the alias/engine it ran on. With
+    ``explain_slow_queries`` enabled, ``SELECT`` statements are also explained
+    on a separate connection and the plan is attached to the log record.
+    Slow query logs are rate limited per fingerprint to at most
+    ``slow_query_rate`` records per ``slow_query_period`` seconds.
     """
 
-    def __init__(self, exclude=None, record_queries=True):
+    logger = logger
+
+    def __init__(
+        self,
+        exclude=None,
+        record_queries=True,
+        slow_query_threshold=None,
+        explain_slow_queries=False,
+        slow_query_rate=10,
+        slow_query_period=60.0,
+    ):
         self.local = local()
+        self.statement_cache_size = 1000
         self.exclude = exclude or []
         self.record_queries = record_queries
+        self.slow_query_threshold = slow_query_threshold
+        self.explain_slow_queries = explain_slow_queries
+        self.slow_query_limiter = RateLimiter(slow_query_rate, slow_query_period)
 
         self._events = [
             ("before_cursor_execute", sa.engine.Engine, self._before_cursor_execute),
@@ -55,7 +181,12 @@ class SQLAlchemyProfiler:
             ("invalidate", sa.pool.Pool, partial(self._event_counter, count_event="pool_invalidate")),
             ("reset", sa.pool.Pool, partial(self._event_counter, count_event="pool_reset")),
             ("soft_invalidate", sa.pool.Pool, partial(self._event_counter, count_event="pool_soft_invalidate")),
+            ("loaded_as_persistent", sa.orm.Session, self._loaded_as_persistent),
+            ("before_flush", sa.orm.Session, self._before_flush),
+            ("after_flush_postexec", sa.orm.Session, self._after_flush_postexec),
+            ("after_soft_rollback", sa.orm.Session, self._after_soft_rollback),
         ]
+        self._signals = [(signals.flush_validated, self._flush_validated)]
 
     def __enter__(self):
         self.start()
@@ -80,6 +211,9 @@ class SQLAlchemyProfiler:
                 # Gets raised when pool doesnt support the event, so ignore it
                 pass  # pragma: nocover
 
+        for signal, receiver in self._signals:
+            signal.connect(receiver)
+
     def stop(self):
         """Stops profiling by detaching wired up sqlalchemy events."""
         for ev, target, handler in self._events:
@@ -90,6 +224,9 @@ class SQLAlchemyProfiler:
                 # Gets raised when pool doesnt support the event, so ignore it
                 pass  # pragma: nocover
 
+        for signal, receiver in self._signals:
+            signal.disconnect(receiver)
+
     def clear(self):
         """Clears collected stats."""
         self.local.__dict__.clear()
@@ -115,42 +252,624 @@ class SQLAlchemyProfiler:
         """Returns executed statements."""
         return self.local.__dict__.setdefault("queries", [])
 
+    @property
+    def slow_queries(self):
+        """Returns statements that took longer than the slow query
+        threshold."""
+        return self.local.__dict__.setdefault("slow_queries", [])
+
+    @property
+    def phases(self):
+        """Returns counts and durations of ORM phases beyond statement
+        execution.
+
+        * ``load`` and ``load_duration`` - number of instances hydrated from rows
+          and time spent hydrating them measured from end of cursor execution
+        * ``flush`` and ``flush_duration`` - number of flushes and total time spent
+          in unit-of-work flushes
+        * ``flush_insert_duration``, ``flush_update_duration`` and
+          ``flush_delete_duration`` - statement time during flushes split by
+          statement type
+        * ``validation_duration`` - time spent in ``full_clean`` validation during
+          flushes
+        """
+        return self.local.__dict__.setdefault("phases", defaultdict(lambda: 0))
+
+    @property
+    def loaded(self):
+        """Returns a dict of number of instances loaded per mapped class
+        name."""
+        return self.local.__dict__.setdefault("loaded", defaultdict(lambda: 0))
+
     @property
     def stats(self):
         """Returns profiling stats."""
         stats = self.counts.copy()
         stats["duration"] = self.duration
+        stats.update(self.phases)
         return stats
 
+    @property
+    def exclude(self):
+        """Returns substrings of statements to be excluded from profiling."""
+        return self._exclude
+
+    @exclude.setter
+    def exclude(self, value):
+        """Sets excluded statement substrings and precompiles the matcher."""
+        self._exclude = value
+        self._exclude_match = re.compile("|".join(re.escape(e) for e in value)).search if value else None
+        self._statement_cache = {}
+
+    def classify(self, statement):
+        """Returns a tuple of statement type and its flush duration stat name
+        or ``None`` when statement is excluded.
+
+        Results are cached per statement string so repeated statements
+        are classified with a single dict lookup.
+        """
+        try:
+            return self._statement_cache[statement]
+        except KeyError:
+            pass
+
+        result = ("", "")
+        if self._exclude_match is not None and self._exclude_match(statement):
+            result = None
+        else:
+            for start, event in STATEMENT_TYPES.items():
+                if statement.startswith(start):
+                    result = (event, "flush_{}_duration".format(event))
+                    break
+
+        if len(self._statement_cache) >= self.statement_cache_size:
+            self._statement_cache.clear()
+        self._statement_cache[statement] = result
+        return result
+
     def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
-        self.local._profiler_query_start_time = time.time()
+        self.local._profiler_query_start_time = perf_counter()
 
     def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
-        end_time = time.time()
-        start_time = self.local._profiler_query_start_time
-        duration = end_time - start_time
+        end_time = perf_counter()
+        state = self.local.__dict__
+        if "_explaining" in state:
+            return
 
-        for e in self.exclude:
-            if e in statement:
+        try:
+            event, flush_key = self._statement_cache[statement]
+        except KeyError:
+            classified = self.classify(statement)
+            if classified is None:
                 return
+            event, flush_key = classified
+        except TypeError:
+            # cached as excluded
+            return
+
+        duration = end_time - state.get("_profiler_query_start_time", end_time)
 
-        params = getattr(context, "compiled_parameters", [])
         if self.record_queries:
+            params = getattr(context, "compiled_parameters", [])
             self.queries.append(Query(int(round(time.time() * 1000)), statement, params, duration))
 
-        self.duration += duration
-        self.counts["execute"] += 1
-
-        for start, event in STATEMENT_TYPES.items():
-            if statement.startswith(start):
-                self.counts[event] += 1
-                break
+        state["duration"] = state.get("duration", 0) + duration
+        counts = state.get("counts") or self.counts
+        counts["execute"] += 1
+        if event:
+            counts[event] += 1
+            if "_flushing" in state:
+                self.phases[flush_key] += duration
+
+        state["_profiler_load_mark"] = end_time
+
+        threshold = self.slow_query_threshold
+        if threshold is not None and duration >= threshold:
+            self._slow_query(conn, statement, parameters, executemany, duration)
+
+    def _slow_query(self, conn, statement, parameters, executemany, duration):
+        key = fingerprint(statement)
+        allowed, suppressed = self.slow_query_limiter.acquire(key)
+        if not allowed:
+            return
+
+        engine = conn.engine
+        plan = None
+        if self.explain_slow_queries and not executemany and statement.lstrip().upper().startswith("SELECT"):
+            plan = self.explain(engine, statement, parameters)
+
+        query = SlowQuery(
+            timestamp=int(round(time.time() * 1000)),
+            fingerprint=key,
+            statement=statement,
+            parameters=parameters,
+            duration=duration,
+            alias=get_alias(engine),
+            engine=repr(engine.url),
+            call_site=get_call_site(),
+            plan=plan,
+        )
+        if self.record_queries:
+            self.slow_queries.append(query)
+
+        self.logger.warning(
+            "SQLAlchemy slow query fingerprint=%s duration=%.6f alias=%s engine=%s call_site=%s suppressed=%s "
+            "statement=%s parameters=%r%s",
+            query.fingerprint,
+            query.duration,
+            query.alias,
+            query.engine,
+            query.call_site,
+            suppressed,
+            query.statement,
+            query.parameters,
+            "\n" + query.plan if query.plan else "",
+            extra={"sa_slow_query": query._asdict(), "sa_suppressed": suppressed},
+        )
+
+    def explain(self, engine, statement, parameters):
+        """Runs ``EXPLAIN`` for a statement on a separate connection and
+        returns the plan as text."""
+        prefix = EXPLAIN_PREFIXES.get(engine.dialect.name, "EXPLAIN ")
+        self.local._explaining = True
+        try:
+            with engine.connect() as conn:
+                execute = getattr(conn, "exec_driver_sql", conn.execute)
+                rows = execute(prefix + statement, parameters).fetchall()
+        except Exception as e:
+            return "EXPLAIN failed: {!r}".format(e)
+        finally:
+            del self.local._explaining
+
+        return "\n".join(" | ".join(str(i) for i in row) for row in rows)
+
+    def _loaded_as_persistent(self, session, instance):
+        now = perf_counter()
+        self.phases["load_duration"] += now - self.local.__dict__.get("_profiler_load_mark", now)
+        self.phases["load"] += 1
+        self.loaded[instance.__class__.__name__] += 1
+        self.local._profiler_load_mark = now
+
+    def _before_flush(self, session, flush_context, instances):
+        self.local._flushing = perf_counter()
+
+    def _after_flush_postexec(self, session, flush_context):
+        start_time = self.local.__dict__.pop("_flushing", None)
+        if start_time is not None:
+            self.phases["flush_duration"] += perf_counter() - start_time
+        self.phases["flush"] += 1
+
+    def _after_soft_rollback(self, session, previous_transaction):
+        self.local.__dict__.pop("_flushing", None)
+
+    def _flush_validated(self, session, duration=0, **kwargs):
+        self.phases["validation_duration"] += duration
 
     def _event_counter(self, *args, **kwargs):
+        if "_explaining" in self.local.__dict__:
+            return
         count_event = kwargs.get("count_event")
         self.counts[count_event] += 1
 
 
+class QueryBudget:
+    """Context manager and decorator that enforces a budget on the number of
+    executed statements and total statement time in milliseconds.
+
+    Violations are always logged and sent through the
+    ``query_budget_exceeded`` signal so they can be reported as metrics. When
+    ``raise_exception`` is enabled, which defaults to
+    ``DJANGO_SORCERY["raise_on_query_budget"]``, a
+    :py:class:`...exceptions.QueryBudgetExceeded` is also raised. When the
+    setting is not configured budgets raise with ``DEBUG`` and when
+    ``QueryBudget.testing`` is set, which the pytest plugin does, so that a
+    budget regression fails tests. Other test runners can enable
+    ``raise_on_query_budget`` in test settings.
+
+    For example::
+
+        with QueryBudget(max_queries=5, max_query_time_ms=50):
+            ...
+    """
+
+    logger = logger
+    profiler = None
+    testing = False
+
+    def __init__(self, max_queries=None, max_query_time_ms=None, name=None, raise_exception=None, sender=None):
+        self.max_queries = max_queries
+        self.max_query_time_ms = max_query_time_ms
+        self.name = name
+        self.raise_exception = raise_exception
+        self.sender = sender
+        self.local = local()
+
+    @classmethod
+    def get_profiler(cls):
+        """Returns the shared always-on profiler used to measure budgets."""
+        if cls.profiler is None:
+            cls.profiler = SQLAlchemyProfiler(record_queries=False)
+            cls.profiler.start()
+        return cls.profiler
+
+    def should_raise(self):
+        """Determines if budget violations should raise or only be
+        reported."""
+        if self.raise_exception is not None:
+            return self.raise_exception
+        should_raise = getattr(settings, "DJANGO_SORCERY", {}).get("raise_on_query_budget")
+        if should_raise is None:
+            should_raise = settings.DEBUG or QueryBudget.testing
+        return should_raise
+
+    def __call__(self, func):
+        @functools.wraps(func)
+        def wrapped(*args, **kwargs):
+            with self:
+                return func(*args, **kwargs)
+
+        return wrapped
+
+    def __enter__(self):
+        self.local.__dict__.setdefault("starts", []).append(self.start())
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        start = self.local.starts.pop()
+        if exc_type is None:
+            self.check(start)
+
+    def start(self):
+        """Returns the current statement count and time to check the budget
+        from with :py:meth:`check`."""
+        profiler = self.get_profiler()
+        return profiler.counts["execute"], profiler.duration
+
+    def check(self, start):
+        """Reports and raises, when enabled, if statements executed since
+        ``start`` exceed the budget."""
+        profiler = self.get_profiler()
+        start_queries, start_duration = start
+        queries = profiler.counts["execute"] - start_queries
+        query_time_ms = (profiler.duration - start_duration) * 1000
+
+        violations = []
+        if self.max_queries is not None and queries > self.max_queries:
+            violations.append("{} queries exceeds max_queries={}".format(queries, self.max_queries))
+        if self.max_query_time_ms is not None and query_time_ms > self.max_query_time_ms:
+            violations.append(
+                "{:.2f}ms query time exceeds max_query_time_ms={}".format(query_time_ms, self.max_query_time_ms)
+            )
+
+        if not violations:
+            return
+
+        message = "Query budget exceeded for {}: {}".format(self.name or "<unnamed>", ", ".join(violations))
+        self.logger.warning(message)
+        signals.query_budget_exceeded.send(
+            self.sender, budget=self, name=self.name, queries=queries, query_time_ms=query_time_ms
+        )
+        if self.should_raise():
+            raise QueryBudgetExceeded(message)
+
+
+def query_budget(max_queries=None, max_query_time_ms=None):
+    """Decorator for declaring a query budget on a view method or viewset
+    action.
+
+    For example::
+
+        class OwnerViewSet(ModelViewSet):
+
+            @query_budget(max_queries=2)
+            def list(self, request, *args, **kwargs):
+                ...
+    """
+
+    def decorator(func):
+        func.max_queries = max_queries
+        func.max_query_time_ms = max_query_time_ms
+        return func
+
+    return decorator
+
+
+class Span:
+    """A timed operation within a trace, modelled after OpenTelemetry spans.
+
+    Timestamps are nanoseconds since the epoch and attributes follow the
+    OpenTelemetry semantic conventions, e.g. ``db.system`` and
+    ``db.statement`` for statement spans.
+    """
+
+    def __init__(self, tracer, name, kind=SPAN_KIND_INTERNAL, attributes=None, parent=None):
+        self.tracer = tracer
+        self.name = name
+        self.kind = kind
+        self.attributes = dict(attributes or {})
+        self.trace_id = parent.trace_id if parent is not None else "{:032x}".format(random.getrandbits(128))
+        self.span_id = "{:016x}".format(random.getrandbits(64))
+        self.parent_id = parent.span_id if parent is not None else None
+        self.status = STATUS_UNSET
+        self.status_description = None
+        self.start_time = time.time_ns()
+        self.end_time = None
+
+    def __repr__(self):
+        return "<Span {!r} span_id={} parent_id={}>".format(self.name, self.span_id, self.parent_id)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.end(exception=exc_val)
+
+    @property
+    def duration(self):
+        """Returns span duration in seconds or ``None`` when still running."""
+        if self.end_time is None:
+            return None
+        return (self.end_time - self.start_time) / 1e9
+
+    def set_attribute(self, key, value):
+        """Sets a span attribute."""
+        self.attributes[key] = value
+
+    def set_status(self, status, description=None):
+        """Sets span status, one of ``UNSET``, ``OK`` or ``ERROR``."""
+        self.status = status
+        self.status_description = description
+
+    def end(self, exception=None):
+        """Ends the span, marking it as failed when an exception is
+        provided."""
+        if self.end_time is not None:
+            return
+        if exception is not None:
+            self.set_status(STATUS_ERROR, str(exception))
+            self.attributes["exception.type"] = exception.__class__.__name__
+            self.attributes["exception.message"] = str(exception)
+        self.end_time = time.time_ns()
+        self.tracer._end_span(self)
+
+    def to_dict(self):
+        """Returns a json serializable representation of the span."""
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "kind": self.kind,
+            "start_time_unix_nano": self.start_time,
+            "end_time_unix_nano": self.end_time,
+            "attributes": self.attributes,
+            "status": {"status_code": self.status, "description": self.status_description},
+        }
+
+
+class SpanExporter:
+    """Base span exporter, receives spans as they end.
+
+    Any object providing ``export(spans)`` can be used as an exporter, which
+    allows bridging spans to a real tracing backend.
+    """
+
+    def export(self, spans):
+        """Exports finished spans."""
+        raise NotImplementedError
+
+    def shutdown(self):
+        """Releases any exporter resources."""
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Exporter that keeps finished spans in memory, useful for tests."""
+
+    def __init__(self):
+        self.spans = []
+
+    def export(self, spans):
+        self.spans.extend(spans)
+
+    def clear(self):
+        """Clears exported spans."""
+        self.spans = []
+
+
+class JSONFileSpanExporter(SpanExporter):
+    """Exporter that appends finished spans to a file as json lines."""
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = Lock()
+
+    def export(self, spans):
+        lines = "".join(json.dumps(span.to_dict(), default=str) + "\n" for span in spans)
+        with self.lock, open(self.path, "a") as f:
+            f.write(lines)
+
+
+class SQLAlchemyTracer:
+    """A local tracer that emits nested spans for middleware units of work,
+    :py:class:`..transaction.TransactionContext` blocks, flushes and cursor
+    executes without requiring a collector.
+
+    Spans are handed to the ``exporter`` as soon as they end, which defaults
+    to an :py:class:`InMemorySpanExporter`. For example::
+
+        with SQLAlchemyTracer(exporter=JSONFileSpanExporter("spans.json")) as tracer:
+            ...
+    """
+
+    active = None
+
+    def __init__(self, exporter=None):
+        self.exporter = exporter if exporter is not None else InMemorySpanExporter()
+        self.local = local()
+        self._engine_attributes = {}
+
+        self._events = [
+            ("before_cursor_execute", sa.engine.Engine, self._before_cursor_execute),
+            ("after_cursor_execute", sa.engine.Engine, self._after_cursor_execute),
+            ("handle_error", sa.engine.Engine, self._handle_error),
+            ("before_flush", sa.orm.Session, self._before_flush),
+            ("after_flush_postexec", sa.orm.Session, self._after_flush_postexec),
+            ("after_soft_rollback", sa.orm.Session, self._after_soft_rollback),
+        ]
+        self._signals = [
+            (signals.before_middleware_request, self._before_middleware_request),
+            (signals.after_middleware_response, self._after_middleware_response),
+        ]
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    @classmethod
+    def start_active_span(cls, name, kind=SPAN_KIND_INTERNAL, attributes=None):
+        """Starts a span on the active tracer, returns ``None`` when tracing is
+        not enabled."""
+        tracer = cls.active
+        if tracer is None:
+            return None
+        return tracer.start_span(name, kind=kind, attributes=attributes)
+
+    def start(self):
+        """Starts tracing by wiring up sqlalchemy events and signals."""
+        for ev, target, handler in self._events:
+            if not sa.event.contains(target, ev, handler):
+                sa.event.listen(target, ev, handler)
+
+        for signal, receiver in self._signals:
+            signal.connect(receiver)
+
+        SQLAlchemyTracer.active = self
+
+    def stop(self):
+        """Stops tracing by detaching wired up sqlalchemy events and
+        signals."""
+        for ev, target, handler in self._events:
+            if sa.event.contains(target, ev, handler):
+                sa.event.remove(target, ev, handler)
+
+        for signal, receiver in self._signals:
+            signal.disconnect(receiver)
+
+        if SQLAlchemyTracer.active is self:
+            SQLAlchemyTracer.active = None
+
+    @property
+    def stack(self):
+        """Returns open spans of the current thread."""
+        return self.local.__dict__.setdefault("stack", [])
+
+    @property
+    def current_span(self):
+        """Returns innermost open span of the current thread."""
+        stack = self.stack
+        return stack[-1] if stack else None
+
+    def start_span(self, name, kind=SPAN_KIND_INTERNAL, attributes=None):
+        """Starts a span as a child of the current span."""
+        span = Span(self, name, kind=kind, attributes=attributes, parent=self.current_span)
+        self.stack.append(span)
+        return span
+
+    def _end_span(self, span):
+        stack = self.stack
+        if span in stack:
+            # end any children left open by a failure first
+            while stack[-1] is not span:
+                stack[-1].set_status(STATUS_ERROR, "Span was not ended")
+                stack[-1].end()
+            stack.pop()
+        self.exporter.export([span])
+
+    def get_engine_attributes(self, engine):
+        """Returns OpenTelemetry db connection attributes for an engine."""
+        attributes = self._engine_attributes.get(engine)
+        if attributes is None:
+            url = engine.url
+            attributes = {"db.system": engine.dialect.name}
+            for key, value in [
+                ("db.name", url.database),
+                ("db.user", url.username),
+                ("net.peer.name", url.host),
+                ("net.peer.port", url.port),
+                ("db.sorcery.alias", get_alias(engine)),
+            ]:
+                if value is not None:
+                    attributes[key] = value
+            self._engine_attributes[engine] = attributes
+        return attributes
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        attributes = dict(self.get_engine_attributes(conn.engine))
+        operation = statement.split(None, 1)[0].upper() if statement.strip() else ""
+        attributes["db.statement"] = statement
+        attributes["db.operation"] = operation
+        if executemany:
+            attributes["db.sorcery.executemany"] = len(parameters)
+        name = " ".join(i for i in (operation, attributes.get("db.name")) if i) or attributes["db.system"]
+        self.local.execute_span = self.start_span(name, kind=SPAN_KIND_CLIENT, attributes=attributes)
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        span = self.local.__dict__.pop("execute_span", None)
+        if span is not None:
+            span.end()
+
+    def _handle_error(self, exception_context):
+        span = self.local.__dict__.pop("execute_span", None)
+        if span is not None:
+            span.end(exception=exception_context.original_exception)
+
+    def _before_flush(self, session, flush_context, instances):
+        self.local.flush_span = self.start_span(
+            "flush",
+            attributes={
+                "db.sorcery.new": len(session.new),
+                "db.sorcery.dirty": len(session.dirty),
+                "db.sorcery.deleted": len(session.deleted),
+            },
+        )
+
+    def _after_flush_postexec(self, session, flush_context):
+        span = self.local.__dict__.pop("flush_span", None)
+        if span is not None:
+            span.end()
+
+    def _after_soft_rollback(self, session, previous_transaction):
+        span = self.local.__dict__.pop("flush_span", None)
+        if span is not None:
+            span.set_status(STATUS_ERROR, "Flush rolled back")
+            span.end()
+
+    def _before_middleware_request(self, sender, middleware=None, request=None, **kwargs):
+        span = self.local.__dict__.pop("middleware_span", None)
+        if span is not None:
+            # previous request never got a response
+            span.set_status(STATUS_ERROR, "No response")
+            span.end()
+
+        self.local.middleware_span = self.start_span(
+            "HTTP {}".format(request.method),
+            kind=SPAN_KIND_SERVER,
+            attributes={"http.method": request.method, "http.target": request.get_full_path()},
+        )
+
+    def _after_middleware_response(self, sender, middleware=None, request=None, response=None, **kwargs):
+        span = self.local.__dict__.pop("middleware_span", None)
+        if span is None:
+            return
+        span.set_attribute("http.status_code", response.status_code)
+        if response.status_code >= 500:
+            span.set_status(STATUS_ERROR)
+        span.end()
+
+
 class SQLAlchemyProfilingMiddleware:
     """Django middleware that provides sqlalchemy statistics."""
 
@@ -158,7 +877,13 @@ class SQLAlchemyProfilingMiddleware:
 
     def __init__(self, get_response=None):
         self.get_response = get_response
-        self.profiler = SQLAlchemyProfiler(record_queries=False)
+        self.profiler = SQLAlchemyProfiler(record_queries=False, **self.profiler_options)
+
+    @property
+    def profiler_options(self):
+        """Returns profiler options from ``DJANGO_SORCERY["profiler"]``
+        setting, e.g. ``slow_query_threshold`` and ``explain_slow_queries``."""
+        return getattr(settings, "DJANGO_SORCERY", {}).get("profiler", {})
 
     @property
     def log_results(self):
@@ -190,7 +915,8 @@ class SQLAlchemyProfilingMiddleware:
         try:
             stats = self.profiler.stats
             if stats["duration"] or self.log_results:
-                self.log(**{"sa_{}".format(k): v for k, v in stats.items()})
+                loaded = {"loaded_{}".format(k): v for k, v in self.profiler.loaded.items()}
+                self.log(**{"sa_{}".format(k): v for k, v in chain(stats.items(), loaded.items())})
         except Exception:  # pragma: nocover
             # The show must go on...
             pass  # pragma: nocover
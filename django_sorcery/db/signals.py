@@ -80,6 +80,7 @@ all_signals = Namespace()
 
 before_flush = all_signals.signal("before_flush")
 after_flush = all_signals.signal("after_flush")
+flush_validated = all_signals.signal("flush_validated")
 
 before_commit = all_signals.signal("before_commit")
 before_scoped_commit = all_signals.scopedsignal("before_scoped_commit")
@@ -92,6 +93,8 @@ after_scoped_rollback = all_signals.scopedsignal("after_scoped_rollback")
 
 engine_created = all_signals.signal("engine_created")
 
+query_budget_exceeded = all_signals.signal("query_budget_exceeded")
+
 before_middleware_request = all_signals.signal("before_middleware_request")
 after_middleware_response = all_signals.signal("after_middleware_response")
 
@@ -1,6 +1,8 @@
 """sqlalchemy transaction related things."""
 import functools
 
+from .profiler import SQLAlchemyTracer
+
 
 class TransactionContext:
     """Transaction context manager for maintaining a transaction or
@@ -10,6 +12,7 @@ class TransactionContext:
         self.dbs = dbs
         self.savepoint = kwargs.get("savepoint", True)
         self.transactions = None
+        self.span = None
 
     def __call__(self, func, *args, **kwargs):
         @functools.wraps(func)
@@ -21,6 +24,9 @@ class TransactionContext:
 
     def __enter__(self):
         self.transactions = [db.begin(subtransactions=True, nested=self.savepoint) for db in self.dbs]
+        self.span = SQLAlchemyTracer.start_active_span(
+            "transaction", attributes={"db.sorcery.savepoint": self.savepoint}
+        )
         return self
 
     def __exit__(self, exception_type, value, tb=None):
@@ -35,5 +41,8 @@ class TransactionContext:
         for transaction in self.transactions:
             transaction.__exit__(exception_type, value, tb)
         self.transactions = None
+        if self.span is not None:
+            self.span.end(exception=value)
+            self.span = None
         if value:
             raise value.with_traceback(tb)
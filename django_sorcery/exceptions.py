@@ -80,3 +80,8 @@ class NestedValidationError(ValidationError):
 
     def __repr__(self):
         return "Nested" + super().__repr__()
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised when a view or block of code exceeds its declared query
+    budget."""
@@ -1,10 +1,14 @@
 """Field mapping from SQLAlchemy type's to form fields."""
+import hashlib
 import json
 from contextlib import suppress
 
+import sqlalchemy as sa
 from django.core.exceptions import ValidationError
 from django.forms import fields as djangofields
+from django.forms import widgets as djangowidgets
 from django.utils.translation import gettext_lazy
+from sqlalchemy.sql.util import find_tables
 
 
 class EnumField(djangofields.ChoiceField):
@@ -50,21 +54,112 @@ class EnumField(djangofields.ChoiceField):
         return self.prepare_value(value)
 
 
+class SearchSelectMixin:
+    """Widget mixin for search backed model choice fields.
+
+    Only options for the selected values are rendered, the rest are expected
+    to be fetched by the client from ``search_url``.
+    """
+
+    def __init__(self, attrs=None, choices=(), search_url=None):
+        super().__init__(attrs=attrs, choices=choices)
+        self.search_url = search_url
+
+    def build_attrs(self, base_attrs, extra_attrs=None):
+        attrs = super().build_attrs(base_attrs, extra_attrs=extra_attrs)
+        if self.search_url is not None:
+            attrs["data-search-url"] = str(self.search_url)
+        return attrs
+
+    def optgroups(self, name, value, attrs=None):
+        choices = self.choices
+        if isinstance(choices, ModelChoiceIterator):
+            self.choices = choices.field.iterator(choices.field, values=value)
+        try:
+            return super().optgroups(name, value, attrs=attrs)
+        finally:
+            self.choices = choices
+
+
+class SearchSelect(SearchSelectMixin, djangowidgets.Select):
+    """Select widget which renders only the selected option."""
+
+
+class SearchSelectMultiple(SearchSelectMixin, djangowidgets.SelectMultiple):
+    """Multiple select widget which renders only the selected options."""
+
+
 class ModelChoiceIterator:
-    """Iterator for sqlalchemy query for model choice fields."""
+    """Iterator for sqlalchemy query for model choice fields.
 
-    def __init__(self, field):
+    Choices are loaded once and reused for both ``len()`` and iteration. For
+    search backed fields only choices for ``values`` are loaded.
+    """
+
+    def __init__(self, field, values=None):
         self.field = field
+        self.values = values
+        self._choices = None
 
     def __iter__(self):
         if self.field.empty_label is not None:
             yield ("", self.field.empty_label)
 
-        for obj in self.field.queryset:
-            yield self.choice(obj)
+        yield from self.get_choices()
 
     def __len__(self):
-        return self.field.queryset.count() + (1 if self.field.empty_label is not None else 0)
+        return len(self.get_choices()) + (1 if self.field.empty_label is not None else 0)
+
+    def get_choices(self):
+        """Returns loaded choice items."""
+        if self._choices is None:
+            if self.field.search_url is not None:
+                self._choices = self.get_selected_choices()
+            elif self.field.cache_timeout is None:
+                self._choices = [self.choice(obj) for obj in self.field.queryset]
+            else:
+                self._choices = self.get_cached_choices()
+
+        return self._choices
+
+    def get_cached_choices(self):
+        """Returns choice items from django cache, loading and caching them
+        when missing.
+
+        Cache keys include the compiled queryset and cache versions of all its
+        tables which change whenever a commit writes to any of them.
+        """
+        from .db.models import get_choices_cache, get_table_versions
+
+        query = self.field.queryset
+        statement = query.statement
+        compiled = statement.compile()
+        tables = {t.fullname for t in find_tables(statement, check_columns=True) if isinstance(t, sa.Table)}
+        tables.update(t.fullname for t in self.field.model_info.mapper.tables)
+
+        versions = get_table_versions(tables)
+        parts = (type(self.field).__qualname__, str(compiled), sorted(compiled.params.items()), versions)
+        digest = hashlib.sha1(repr(parts).encode()).hexdigest()
+        key = "django_sorcery:choices:{}:{}".format(self.field.model_info.label_lower, digest)
+
+        cache = get_choices_cache()
+        choices = cache.get(key)
+        if choices is None:
+            choices = [self.choice(obj) for obj in query]
+            cache.set(key, choices, self.field.cache_timeout)
+
+        return choices
+
+    def get_selected_choices(self):
+        """Returns choice items of valid selected values in selected order."""
+        keys = []
+        for value in self.values or ():
+            if value not in self.field.empty_values:
+                with suppress(ValidationError):
+                    keys.append(self.field.get_key(value))
+
+        objects = self.field.get_objects(keys)
+        return [self.choice(objects[k]) for k in dict.fromkeys(keys) if k in objects]
 
     def choice(self, obj):
         """Returns choice item for django choice field."""
@@ -79,6 +174,7 @@ class ModelChoiceField(djangofields.ChoiceField):
     }
 
     iterator = ModelChoiceIterator
+    search_widget = SearchSelect
 
     def __init__(
         self,
@@ -92,9 +188,13 @@ class ModelChoiceField(djangofields.ChoiceField):
         help_text="",
         to_field_name=None,
         limit_choices_to=None,
+        cache_timeout=None,
+        search_url=None,
         **kwargs,
     ):
         self.empty_label = None if required and (initial is not None) else empty_label
+        if search_url is not None and widget is None:
+            widget = self.search_widget(search_url=search_url)
         djangofields.Field.__init__(
             self, required=required, widget=widget, label=label, initial=initial, help_text=help_text, **kwargs
         )
@@ -108,6 +208,8 @@ class ModelChoiceField(djangofields.ChoiceField):
         self._queryset = None
         self.limit_choices_to = limit_choices_to  # limit the queryset later.
         self.to_field_name = to_field_name
+        self.cache_timeout = cache_timeout  # opt-in caching of choices in django cache
+        self.search_url = search_url  # render only selected choices and search the rest remotely
 
     def _get_queryset(self):
         return self._queryset or self.session.query(self.model)
@@ -122,12 +224,8 @@ class ModelChoiceField(djangofields.ChoiceField):
 
     choices = property(_get_choices, djangofields.ChoiceField._set_choices)
 
-    def get_object(self, value):
-        """Returns model instance."""
-        if value in self.empty_values:
-            return None
-
-        pk = None
+    def get_pk(self, value):
+        """Returns primary key from submitted value."""
         try:
             pk = json.loads(value)
             if isinstance(pk, dict):
@@ -135,12 +233,46 @@ class ModelChoiceField(djangofields.ChoiceField):
         except TypeError:
             pk = value
 
-        obj = self.session.query(self.model).get(pk)
+        return pk
+
+    def get_object(self, value):
+        """Returns model instance."""
+        if value in self.empty_values:
+            return None
+
+        obj = self.session.query(self.model).get(self.get_pk(value))
         if obj is None:
             raise ValidationError(self.error_messages["invalid_choice"], code="invalid_choice")
 
         return obj
 
+    def get_objects(self, keys):
+        """Returns a dict of model instances by primary key tuples loading all
+        of the ``keys`` with a single query."""
+        mapper = self.model_info.mapper
+        unique = list(dict.fromkeys(keys))
+        if not unique:
+            return {}
+
+        if len(mapper.primary_key) == 1:
+            criterion = mapper.primary_key[0].in_([k[0] for k in unique])
+        else:
+            criterion = sa.tuple_(*mapper.primary_key).in_(unique)
+
+        query = self.session.query(self.model).filter(criterion)
+        return {tuple(mapper.primary_key_from_instance(obj)): obj for obj in query}
+
+    def get_key(self, value):
+        """Returns primary key tuple of a submitted value coerced to column types."""
+        infos = list(self.model_info.primary_keys.values())
+        with suppress(ValidationError, ValueError):
+            pk = self.get_pk(value)
+            pk = tuple(pk) if isinstance(pk, (list, tuple)) else (pk,)
+            if len(pk) == len(infos):
+                return tuple(info.to_python(p) for info, p in zip(infos, pk))
+
+        raise ValidationError(self.error_messages["invalid_choice"], code="invalid_choice", params={"value": value})
+
     def to_python(self, value):
         return self.get_object(value)
 
@@ -179,6 +311,7 @@ class ModelMultipleChoiceField(ModelChoiceField):
     """A ChoiceField whose choices are a sqlalchemy model list relationship."""
 
     widget = djangofields.SelectMultiple
+    search_widget = SearchSelectMultiple
     hidden_widget = djangofields.MultipleHiddenInput
     default_error_messages = {
         "list": gettext_lazy("Enter a list of values."),
@@ -193,7 +326,16 @@ class ModelMultipleChoiceField(ModelChoiceField):
         return list(self._check_values(value)) if value else []
 
     def _check_values(self, value):
-        return [self.get_object(pk) for pk in value]
+        """Returns model instances for submitted primary keys in submitted order
+        by loading all of them with a single query."""
+        keys = [None if v in self.empty_values else self.get_key(v) for v in value]
+        objects = self.get_objects([k for k in keys if k is not None])
+
+        for v, k in zip(value, keys):
+            if k is not None and k not in objects:
+                raise ValidationError(self.error_messages["invalid_choice"], code="invalid_choice", params={"value": v})
+
+        return [None if k is None else objects[k] for k in keys]
 
     def prepare_value(self, value):
         try:
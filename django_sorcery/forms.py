@@ -1,13 +1,20 @@
 """Helper functions for creating Form classes from SQLAlchemy models."""
+import copy
+import threading
 from collections import OrderedDict
+from collections.abc import MutableMapping
 from contextlib import suppress
 from itertools import chain
 
+import sqlalchemy as sa
+from django.conf import settings
 from django.core.exceptions import (
     NON_FIELD_ERRORS,
     ImproperlyConfigured,
     ValidationError,
 )
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.forms import ALL_FIELDS
 from django.forms.forms import (
     BaseForm as DjangoBaseForm,
@@ -155,6 +162,7 @@ def model_to_dict(instance, fields=None, exclude=None):
 
         data[name] = getattr(instance, name)
 
+    state = sa.inspect(instance)
     for name, rel in info.relationships.items():
         related_info = meta.model_info(rel.related_model)
 
@@ -167,7 +175,15 @@ def model_to_dict(instance, fields=None, exclude=None):
         if name in exclude:
             continue
 
-        if rel.uselist:
+        if name not in state.dict and state.persistent:
+            # avoid loading related objects just for their primary keys
+            pks = [pk for pk in _get_related_primary_keys(instance, rel, related_info) if pk]
+            if rel.uselist:
+                if pks:
+                    data[name] = pks
+            elif pks:
+                data[name] = pks[0]
+        elif rel.uselist:
             for obj in getattr(instance, name):
                 pks = related_info.primary_keys_from_instance(obj)
                 if pks:
@@ -181,6 +197,45 @@ def model_to_dict(instance, fields=None, exclude=None):
     return data
 
 
+def _get_related_primary_keys(instance, rel, related_info):
+    """Returns primary keys of related objects of a persistent ``instance``
+    without loading them.
+
+    Many-to-one keys come from the local foreign key columns when the join
+    condition matches exactly the related primary key, others are queried as
+    primary key columns only in a single query.
+    """
+    names = list(related_info.primary_keys)
+    rows = None
+
+    primary_key = set(rel.related_mapper.primary_key)
+    if (
+        rel.direction == sa.orm.interfaces.MANYTOONE
+        and {remote for _, remote in rel.local_remote_pairs} == primary_key
+        and set(rel.relationship.remote_side) == primary_key
+    ):
+        with suppress(sa.orm.exc.UnmappedColumnError):
+            values = [
+                getattr(instance, rel.parent_mapper.get_property_by_column(local).key)
+                for local, _ in rel.local_remote_pairs_for_identity_key
+            ]
+            rows = [] if any(v is None for v in values) else [values]
+
+    if rows is None:
+        session = sa.orm.object_session(instance)
+        query = session.query(*[getattr(rel.related_model, n) for n in names]).filter(
+            sa.orm.with_parent(instance, rel.attribute)
+        )
+        if rel.relationship.order_by:
+            query = query.order_by(*rel.relationship.order_by)
+        rows = query.all() if rel.uselist else query.limit(1).all()
+
+    if len(names) > 1:
+        return [OrderedDict(zip(names, row)) for row in rows]
+
+    return [row[0] for row in rows]
+
+
 class SQLAModelFormOptions(ModelFormOptions):
     """Model form options for sqlalchemy."""
 
@@ -189,6 +244,58 @@ class SQLAModelFormOptions(ModelFormOptions):
         self.session = getattr(options, "session", None)
 
 
+class CopyOnWriteFields(MutableMapping):
+    """Fields of a form instance which are copied from form class fields on
+    first access.
+
+    Form class fields are shared between form instances until a form accesses
+    them, so fields which a form never touches are never copied.
+    """
+
+    def __init__(self, base_fields, prepare=None):
+        self._fields = dict(base_fields)
+        self._copied = set()
+        self._prepare = prepare
+
+    def __getitem__(self, name):
+        field = self._fields[name]
+        if name not in self._copied:
+            field = self._fields[name] = copy.deepcopy(field)
+            self._copied.add(name)
+            if self._prepare is not None:
+                self._prepare(field)
+
+        return field
+
+    def __setitem__(self, name, field):
+        self._fields[name] = field
+        self._copied.add(name)
+
+    def __delitem__(self, name):
+        del self._fields[name]
+        self._copied.discard(name)
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __contains__(self, name):
+        return name in self._fields
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, list(self._fields))
+
+
+class ModelFormFields(OrderedDict):
+    """Model form class fields which are copied on write into form
+    instances instead of deep copying all of them per form instance."""
+
+    def __deepcopy__(self, memo):
+        return CopyOnWriteFields(self, prepare=apply_limit_choices_to_form_field)
+
+
 class ModelFormMetaclass(DeclarativeFieldsMetaclass):
     """ModelForm metaclass for sqlalchemy models."""
 
@@ -243,6 +350,7 @@ class ModelFormMetaclass(DeclarativeFieldsMetaclass):
                 apply_limit_choices_to=False,
             )
             cls.base_fields.update(cls.declared_fields)
+            cls.base_fields = ModelFormFields(cls.base_fields)
         else:
             cls.base_fields = cls.declared_fields
 
@@ -279,6 +387,7 @@ class BaseModelForm(DjangoBaseModelForm):
         object_data = self.model_to_dict()
         object_data.update(initial or {})
         self._validate_unique = False
+        self._validate_model = True  # formsets in bulk mode validate instances of all forms at once
         DjangoBaseForm.__init__(
             self,
             data=data,
@@ -292,8 +401,9 @@ class BaseModelForm(DjangoBaseModelForm):
             use_required_attribute=use_required_attribute,
             renderer=renderer,
         )
-        for field in self.fields.values():
-            apply_limit_choices_to_form_field(field)
+        if not isinstance(self.base_fields, ModelFormFields):
+            for field in self.fields.values():
+                apply_limit_choices_to_form_field(field)
 
     def model_to_dict(self):
         """Returns a dict containing the data in ``instance`` suitable for
@@ -359,6 +469,11 @@ class BaseModelForm(DjangoBaseModelForm):
         except ValidationError as e:
             self._update_errors(e)
 
+        if self._validate_model:
+            self.validate_instance()
+
+    def validate_instance(self):
+        """Runs model validation of form's instance."""
         try:
             getattr(self.instance, "full_clean", bool)()
         except ValidationError as e:
@@ -422,3 +537,65 @@ def modelform_factory(model, form=ModelForm, formfield_callback=None, **kwargs):
         )
 
     return type(form)(str(class_name), (form,), {"Meta": meta_, "formfield_callback": formfield_callback})
+
+
+_form_classes = OrderedDict()
+_form_classes_lock = threading.Lock()
+
+
+@receiver(setting_changed)
+def _clear_form_classes(setting, **kwargs):
+    if setting == "DJANGO_SORCERY":
+        clear_form_class_cache()
+
+
+def clear_form_class_cache():
+    """Clears form classes cached by :py:func:`cached_modelform_factory`."""
+    with _form_classes_lock:
+        _form_classes.clear()
+
+
+def _freeze(value):
+    """Returns a hashable equivalent of ``value`` for form class cache keys."""
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+
+    hash(value)
+    return value
+
+
+def cached_modelform_factory(model, form=ModelForm, formfield_callback=None, **kwargs):
+    """Same as :py:func:`modelform_factory` but reuses form classes created
+    with the same arguments from a bounded LRU cache.
+
+    The cache size is ``DJANGO_SORCERY["form_class_cache_size"]``, 128 by
+    default. Forms without session or with arguments which cannot be hashed
+    are not cached.
+    """
+    size = getattr(settings, "DJANGO_SORCERY", {}).get("form_class_cache_size", 128)
+    try:
+        key = (model, form, formfield_callback, _freeze(kwargs)) if kwargs.get("session") is not None else None
+    except TypeError:
+        key = None
+
+    if key is None or not size:
+        return modelform_factory(model, form=form, formfield_callback=formfield_callback, **kwargs)
+
+    with _form_classes_lock:
+        form_class = _form_classes.get(key)
+        if form_class is not None:
+            _form_classes.move_to_end(key)
+            return form_class
+
+    form_class = modelform_factory(model, form=form, formfield_callback=formfield_callback, **kwargs)
+
+    with _form_classes_lock:
+        _form_classes[key] = form_class
+        while len(_form_classes) > size:
+            _form_classes.popitem(last=False)
+
+    return form_class
@@ -6,15 +6,25 @@ from django.forms.formsets import BaseFormSet, formset_factory
 from django.forms.widgets import HiddenInput
 
 from ..db import meta
+from ..db.models import batch_validation, skip_flush_validation, validated_state
 from ..forms import ModelForm, modelform_factory
 
 
 class BaseModelFormSet(BaseFormSet):
-    """A ``FormSet`` for editing a queryset and/or adding new objects to it."""
+    """A ``FormSet`` for editing a queryset and/or adding new objects to it.
+
+    In ``bulk`` mode instances of all forms are validated together, running
+    batch validators once per model, and are saved with a single flush which
+    only validates them again if they changed since. The flush groups updates
+    and deletes into executemany statements per table. Inserts are grouped as
+    well when primary keys are assigned, otherwise the unit of work inserts
+    rows one at a time to fetch the generated keys.
+    """
 
     model = None
     session = None
     absolute_max = 2000
+    bulk = False
 
     # Set of fields that must be unique among forms of this set.
     unique_fields = set()
@@ -64,7 +74,31 @@ class BaseModelFormSet(BaseFormSet):
             except IndexError:
                 pass
         kwargs["session"] = self.session
-        return super()._construct_form(i, **kwargs)
+        form = super()._construct_form(i, **kwargs)
+        form._validate_model = not self.bulk
+        return form
+
+    def full_clean(self):
+        super().full_clean()
+
+        if self.bulk and self.is_bound:
+            self.validate_instances(
+                [
+                    form
+                    for form in self.forms
+                    if not (form.empty_permitted and not form.has_changed())
+                    and not (self.can_delete and self._should_delete_form(form))
+                ]
+            )
+
+    def validate_instances(self, forms):
+        """Runs model validation of instances of ``forms`` at once, adding
+        errors to their forms."""
+        with batch_validation([form.instance for form in forms]):
+            for form in forms:
+                form.validate_instance()
+
+        self._validated = {form.instance: validated_state(form.instance) for form in forms}
 
     def add_fields(self, form, index):
         info = meta.model_info(self.model)
@@ -84,8 +118,11 @@ class BaseModelFormSet(BaseFormSet):
             else:
                 qs = self.session.query(self.model)[: self.absolute_max]
 
+            # materialize once so that form count, forms and existing objects share the same rows
             if hasattr(qs, "all"):
                 qs = qs.all()
+            elif not isinstance(qs, list):
+                qs = list(qs)
 
             self._queryset = qs
 
@@ -102,6 +139,7 @@ class BaseModelFormSet(BaseFormSet):
         self.changed_objects = []
         self.deleted_objects = []
         saved_instances = []
+        form_flush = flush and not self.bulk
 
         for form in self.extra_forms:
             if not form.has_changed():
@@ -110,7 +148,7 @@ class BaseModelFormSet(BaseFormSet):
             if self.can_delete and self._should_delete_form(form):
                 continue
 
-            obj = form.save(flush=flush)
+            obj = form.save(flush=form_flush)
             self.new_objects.append(obj)
             saved_instances.append(obj)
 
@@ -123,9 +161,13 @@ class BaseModelFormSet(BaseFormSet):
             elif form.has_changed():
                 self.changed_objects.append(form.instance)
 
-            obj = form.save(flush=flush)
+            obj = form.save(flush=form_flush)
             saved_instances.append(obj)
 
+        if flush and self.bulk:
+            with skip_flush_validation(self.session, getattr(self, "_validated", {})):
+                self.session.flush()
+
         return saved_instances
 
     save.alters_data = True
@@ -152,6 +194,7 @@ def modelformset_factory(
     validate_min=False,
     field_classes=None,
     session=None,
+    bulk=False,
 ):
     """Return a FormSet class for the given sqlalchemy model class."""
     _meta = getattr(form, "Meta", None)
@@ -189,4 +232,7 @@ def modelformset_factory(
         validate_max=validate_max,
     )
     class_name = f"{model.__name__}FormSet"
-    return type(form)(str(class_name), (FormSet,), {"model": model, "session": session})
+    attrs = {"model": model, "session": session}
+    if bulk:
+        attrs["bulk"] = bulk
+    return type(form)(str(class_name), (FormSet,), attrs)
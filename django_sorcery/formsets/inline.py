@@ -74,6 +74,7 @@ def inlineformset_factory(
     validate_min=False,
     field_classes=None,
     session=None,
+    bulk=False,
 ):
     """Return an ``InlineFormSet`` for the given kwargs.
 
@@ -107,6 +108,7 @@ def inlineformset_factory(
         "error_messages": error_messages,
         "field_classes": field_classes,
         "session": session,
+        "bulk": bulk,
     }
     FormSet = modelformset_factory(model, **kwargs)
     FormSet.fk = fk
@@ -10,6 +10,7 @@ from .sorcery_history import History
 from .sorcery_revision import Revision
 from .sorcery_stamp import Stamp
 from .sorcery_upgrade import Upgrade
+from .sorcery_warmup import Warmup
 
 
 class Command(NamespacedCommand):
@@ -26,6 +27,7 @@ class Command(NamespacedCommand):
     downgrade = Downgrade
     current = Current
     stamp = Stamp
+    warmup = Warmup
 
     class Meta:
         namespace = "sorcery"
@@ -0,0 +1,46 @@
+"""Warmup command."""
+
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+
+from ...db import databases, meta
+
+
+class Warmup(BaseCommand):
+    """Builds model metadata for all models and reports how long it took."""
+
+    help = "Builds model metadata for all models"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            "-d",
+            action="append",
+            dest="databases",
+            type=str,
+            help="Nominates a database to warm up. By default will warm up all.",
+        )
+        parser.add_argument(
+            "--parallel", action="store_true", default=False, help="Builds metadata of each app in a separate thread."
+        )
+        parser.add_argument(
+            "--profile", action="store_true", default=False, help="Reports time spent per model, slowest first."
+        )
+
+    def handle(self, *args, **kwargs):
+        dbs = [databases.get(key) for key in kwargs.get("databases") or []] or None
+        start = perf_counter()
+        timings = meta.warmup(dbs, parallel=kwargs.get("parallel"))
+        duration = perf_counter() - start
+
+        if kwargs.get("profile"):
+            for model, seconds in timings.items():
+                self.stdout.write("{:>10.3f} ms  {}".format(seconds * 1e3, meta.model_info(model).label))
+
+        self.stdout.write(
+            self.style.SUCCESS("Built metadata for {} models in {:.3f} ms".format(len(timings), duration * 1e3))
+        )
+
+
+Command = Warmup
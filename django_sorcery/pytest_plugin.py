@@ -2,10 +2,15 @@
 
 import pytest
 
-from .db.profiler import SQLAlchemyProfiler
+from .db.profiler import QueryBudget, SQLAlchemyProfiler
 from .testing import Transact
 
 
+def pytest_configure(config):
+    """Makes exceeded query budgets raise while testing."""
+    QueryBudget.testing = True
+
+
 @pytest.fixture(scope="function")
 def sqlalchemy_profiler():
     """pytest fixture for sqlalchemy profiler."""
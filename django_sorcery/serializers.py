@@ -0,0 +1,98 @@
+"""JSON serialization of sqlalchemy model instances and queries."""
+import enum
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+
+from .db.composites import BaseComposite
+from .db.models import get_serializer_plan
+
+
+class SorceryJSONEncoder(DjangoJSONEncoder):
+    """JSON encoder which can encode dates, times, decimals, enums (by name)
+    and composites."""
+
+    def default(self, o):
+        if isinstance(o, enum.Enum):
+            return o.name
+        if isinstance(o, BaseComposite):
+            return vars(o)
+        return super().default(o)
+
+
+def stream_json(instances, *rels, chunk_size=100, encoder=SorceryJSONEncoder):
+    """Yields a JSON array of serialized model instances in chunks of
+    ``chunk_size`` instances.
+
+    ``instances`` can be any iterable of model instances, such as a query,
+    which is consumed lazily so the whole list is never held in memory.
+    Instances are serialized with the cached serializer plan of their model
+    and ``rels`` relationships, and ``None`` elements as ``null``.
+    """
+    encode = encoder().encode
+    plans = {}
+    chunk = ["["]
+    separator = ""
+    count = 0
+
+    for instance in instances:
+        chunk.append(separator)
+        if instance is None:
+            chunk.append("null")
+        else:
+            model = instance.__class__
+            plan = plans.get(model)
+            if plan is None:
+                plan = plans[model] = get_serializer_plan(model, *rels)
+
+            chunk.append(encode(plan.serialize(instance)))
+
+        separator = ","
+        count += 1
+
+        if count == chunk_size:
+            yield "".join(chunk)
+            chunk = []
+            count = 0
+
+    chunk.append("]")
+    yield "".join(chunk)
+
+
+class StreamingJSONResponse(StreamingHttpResponse):
+    """A streaming response which encodes a query or an iterable of model
+    instances as a JSON array.
+
+    Queries are iterated with ``yield_per`` so that large responses start
+    sending immediately and rows are fetched and serialized in batches.
+    Serialized relationships should be many-to-one and eagerly joined, as
+    collections cannot be eagerly loaded with ``yield_per`` and would lazy
+    load per row otherwise. For example::
+
+        def vehicles(request):
+            query = Vehicle.objects.options(db.joinedload(Vehicle.owner)).order_by(Vehicle.id)
+            return StreamingJSONResponse(query, Vehicle.owner)
+
+    The content is generated while the response is being sent, after any
+    middleware has already processed the response and removed the scoped
+    session. Pass ``close_session=True`` to close the session of the query
+    when the response is closed, e.g. when the query uses a session created
+    only for the response. Otherwise the caller must manage the session.
+    """
+
+    def __init__(
+        self, instances, *rels, yield_per=1000, chunk_size=100, encoder=SorceryJSONEncoder, close_session=False, **kwargs
+    ):
+        kwargs.setdefault("content_type", "application/json")
+        self.session = getattr(instances, "session", None) if close_session else None
+        if yield_per and hasattr(instances, "yield_per"):
+            instances = instances.yield_per(yield_per)
+        super().__init__(stream_json(instances, *rels, chunk_size=chunk_size, encoder=encoder), **kwargs)
+
+    def close(self):
+        try:
+            super().close()
+        finally:
+            if self.session is not None:
+                self.session.close()
+                self.session = None
@@ -65,3 +65,15 @@ def lower(value):
         return value.lower()
     except AttributeError:
         return value
+
+
+def chunked(values, size):
+    """Yields successive lists of up to ``size`` items of a sequence.
+
+    For example::
+
+        >>> print(list(chunked([1, 2, 3, 4, 5], 2)))
+        [[1, 2], [3, 4], [5]]
+    """
+    for start in range(0, len(values), size):
+        yield values[slice(start, start + size)]
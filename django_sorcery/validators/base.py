@@ -1,10 +1,38 @@
 """Validators."""
+from threading import local
 
 import sqlalchemy as sa
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 from sqlalchemy import inspect
 
+from ..utils import chunked
+
+
+def depends_on(*fields):
+    """Decorator for declaring which fields a model validator depends on.
+
+    Validators with declared dependencies are skipped when all of those
+    fields are excluded from validation, for example when incremental
+    validation excludes unchanged fields.
+
+    For example::
+
+        @depends_on("start", "end")
+        def validate_range(m):
+            if m.start > m.end:
+                raise ValidationError("Start must be before end.")
+
+        class MyModel(db.Model):
+            validators = [validate_range]
+    """
+
+    def decorator(validator):
+        validator.depends_on = fields
+        return validator
+
+    return decorator
+
 
 class ValidateTogetherModelFields:
     """Validator for checking that multiple model fields are always saved
@@ -29,6 +57,10 @@ class ValidateTogetherModelFields:
         self.message = message or self.message
         self.code = code or self.code
 
+    @property
+    def depends_on(self):
+        return self.fields
+
     def __call__(self, m):
         if not any(getattr(m, i, None) for i in self.fields):
             return
@@ -51,18 +83,42 @@ class ValidateUnique:
                 ValidateUnique(db, "name"),      # checks for name uniqueness
                 ValidateUnique(db, "foo", "bar"),  # checks for foo and bar combination uniqueness
             ]
+
+    With ``batch=True``, all instances being flushed are checked together
+    with one query per ``batch_size`` instances and instances within the
+    flush which share the same values are reported as duplicates.
+    Instances with ``None`` values fall back to individual queries.
     """
 
     message = _("%(fields)s must make a unique set.")
     code = "required"
+    batch_size = 500
 
     def __init__(self, session, *args, **kwargs):
         self.session = session
         self.message = kwargs.get("message", self.message)
         self.code = kwargs.get("code", self.code)
+        self.batch = kwargs.get("batch", False)
+        self.batch_size = kwargs.get("batch_size", self.batch_size)
         self.attrs = args
+        self.local = local()
+
+    @property
+    def depends_on(self):
+        return self.attrs
 
     def __call__(self, m):
+        results = self.local.__dict__.get("results")
+        if results and id(m) in results:
+            exists = results.pop(id(m))[1]
+        else:
+            exists = self.exists(m)
+
+        if exists:
+            raise ValidationError(self.message, code=self.code, params={"fields": ", ".join(sorted(self.attrs))})
+
+    def exists(self, m):
+        """Checks if other rows with same values exist."""
         clauses = [getattr(m.__class__, attr) == getattr(m, attr) for attr in self.attrs]
 
         from ..db import meta
@@ -76,10 +132,57 @@ class ValidateUnique:
                 clauses.append(getattr(m.__class__, name) != pk)
 
         query = self.session.query(m.__class__).filter(*clauses)
-        exists = self.session.query(sa.literal(True)).filter(query.exists()).scalar()
+        return self.session.query(sa.literal(True)).filter(query.exists()).scalar()
 
-        if exists:
-            raise ValidationError(self.message, code=self.code, params={"fields": ", ".join(sorted(self.attrs))})
+    def validate_batch(self, instances):
+        """Checks uniqueness of instances of the same model in bulk and keeps
+        results for validating them until :py:meth:`clear_batch` is
+        called."""
+        from ..db import meta
+
+        model = instances[0].__class__
+        info = meta.model_info(model)
+        results = self.local.__dict__.setdefault("results", {})
+        by_values = {}
+        for m in instances:
+            try:
+                values = tuple(self._to_python(info, m, attr) for attr in self.attrs)
+            except ValidationError:
+                # invalid values are reported by clean_fields
+                continue
+            if None not in values:
+                by_values.setdefault(values, []).append(m)
+        if not by_values:
+            return
+
+        columns = [getattr(model, attr) for attr in self.attrs]
+        pks = [getattr(model, name) for name in info.primary_keys]
+        values = list(by_values)
+
+        existing = {}
+        n = len(columns)
+        for chunk in chunked(values, self.batch_size):
+            clause = sa.tuple_(*columns).in_(chunk) if n > 1 else columns[0].in_([v[0] for v in chunk])
+            for row in self.session.query(*columns + pks).filter(clause):
+                existing.setdefault(tuple(row[:n]), set()).add(tuple(row[n:]))
+
+        for values, group in by_values.items():
+            rows = existing.get(values, set())
+            for m in group:
+                state = info.sa_state(m)
+                pk = tuple(info.mapper.primary_key_from_instance(m)) if state.persistent else None
+                results[id(m)] = (m, len(group) > 1 or bool(rows - {pk}))
+
+    def _to_python(self, info, m, attr):
+        """Returns the value of ``attr`` coerced the same way as
+        ``clean_fields`` does since batches are validated before cleaning."""
+        value = getattr(m, attr)
+        prop = info.properties.get(attr)
+        return value if prop is None else prop.to_python(value)
+
+    def clear_batch(self):
+        """Clears results of :py:meth:`validate_batch`."""
+        self.local.__dict__.pop("results", None)
 
 
 class ValidateValue:
@@ -106,12 +209,13 @@ class ValidateValue:
 
     negated = False
 
-    def __init__(self, field, predicate, message=None, code=None):
+    def __init__(self, field, predicate, message=None, code=None, depends_on=None):
         assert callable(predicate), "predicate must be callable"
         self.field = field
         self.predicate = predicate
         self.message = message or self.message
         self.code = code or self.code
+        self.depends_on = depends_on
 
     def __call__(self, m):
         e = ValidationError({self.field: ValidationError(self.message, code=self.code, params={"field": self.field})})
@@ -146,12 +250,13 @@ class ValidateEmptyWhen:
 
     allow_empty = True
 
-    def __init__(self, field, predicate, message=None, code=None):
+    def __init__(self, field, predicate, message=None, code=None, depends_on=None):
         assert callable(predicate), "predicate must be callable"
         self.field = field
         self.predicate = predicate
         self.message = message or self.message
         self.code = code or self.code
+        self.depends_on = depends_on
 
     def __call__(self, m):
         is_empty = not bool(getattr(m, self.field, None))
@@ -212,6 +317,10 @@ class ValidateOnlyOneOf:
         self.message = message or self.message
         self.code = code or self.code
 
+    @property
+    def depends_on(self):
+        return self.fields
+
     def __call__(self, m):
         e = ValidationError(self.message, code=self.code, params={"fields": ", ".join(sorted(self.fields))})
 
@@ -242,6 +351,10 @@ class ValidateCantRemove:
         self.message = message or self.message
         self.code = code or self.code
 
+    @property
+    def depends_on(self):
+        return (self.field,)
+
     def __call__(self, m):
         inspected = inspect(m).attrs
         history = getattr(inspected, self.field).history
@@ -2,3 +2,4 @@ from .base import *  # noqa
 from .detail import *  # noqa
 from .edit import *  # noqa
 from .list import *  # noqa
+from .search import *  # noqa
@@ -11,6 +11,7 @@ from sqlalchemy import literal
 from sqlalchemy.exc import InvalidRequestError
 
 from ..db import meta
+from ..db.profiler import QueryBudget
 
 
 class SQLAlchemyMixin(ContextMixin):
@@ -22,6 +23,8 @@ class SQLAlchemyMixin(ContextMixin):
     session = None
     context_object_name = None
     query_options = None
+    max_queries = None
+    max_query_time_ms = None
 
     @classmethod
     def get_model(cls):
@@ -77,6 +80,47 @@ class SQLAlchemyMixin(ContextMixin):
         """Returns sqlalchemy query options."""
         return self.query_options or []
 
+    def get_query_budget(self):
+        """Returns the query budget for current request handler or action.
+
+        Budgets declared on the handler with
+        :py:func:`..db.profiler.query_budget` take precedence over
+        ``max_queries`` and ``max_query_time_ms`` view attributes.
+        """
+        action = getattr(self, "action", None) or self.request.method.lower()
+        handler = getattr(self, self.request.method.lower(), None)
+        max_queries = getattr(handler, "max_queries", self.max_queries)
+        max_query_time_ms = getattr(handler, "max_query_time_ms", self.max_query_time_ms)
+        if max_queries is None and max_query_time_ms is None:
+            return None
+
+        return QueryBudget(
+            max_queries=max_queries,
+            max_query_time_ms=max_query_time_ms,
+            name="{}.{}".format(self.__class__.__name__, action),
+            sender=self.__class__,
+        )
+
+    def dispatch(self, request, *args, **kwargs):
+        """Dispatches the request within its query budget if one is
+        declared.
+
+        Template responses are not rendered early, their budget is checked
+        after they are rendered.
+        """
+        budget = self.get_query_budget()
+        if budget is None:
+            return super().dispatch(request, *args, **kwargs)
+
+        start = budget.start()
+        response = super().dispatch(request, *args, **kwargs)
+        if callable(getattr(response, "add_post_render_callback", None)) and not response.is_rendered:
+            # lazy template responses are checked once rendered so that queries from templates count
+            response.add_post_render_callback(lambda r: budget.check(start))
+        else:
+            budget.check(start)
+        return response
+
     def get_model_template_name(self):
         """Returns the base template path."""
         model = self.get_model()
@@ -26,7 +26,7 @@ class ModelFormMixin(FormMixin, SingleObjectMixin):
             return self.form_class
 
         model = self.get_model()
-        return forms.modelform_factory(model, fields=self.fields, session=self.session)
+        return forms.cached_modelform_factory(model, fields=self.fields, session=self.session)
 
     def get_form_kwargs(self):
         """Return the keyword arguments for instantiating the form."""
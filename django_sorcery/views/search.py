@@ -0,0 +1,117 @@
+"""Django search views for search backed model choice fields."""
+import json
+from contextlib import suppress
+
+import sqlalchemy as sa
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.http import HttpResponseBadRequest, JsonResponse
+from django.views.generic.base import View
+
+from ..db import meta
+from ..serializers import SorceryJSONEncoder
+from .base import SQLAlchemyMixin
+
+
+class BaseSearchView(SQLAlchemyMixin, View):
+    """A base view for serving JSON search results of a model.
+
+    Results are filtered by a case insensitive prefix match on
+    ``search_fields`` and paginated with a keyset cursor over the primary
+    key, so every page is a single ``LIMIT`` query regardless of table size.
+    """
+
+    search_fields = None
+    search_kwarg = "q"
+    limit_kwarg = "limit"
+    cursor_kwarg = "cursor"
+    paginate_by = 20
+    max_paginate_by = 100
+    encoder = SorceryJSONEncoder
+
+    def get(self, request, *args, **kwargs):
+        """Handle GET request on search view."""
+        try:
+            cursor = self.get_cursor()
+        except ValidationError:
+            return HttpResponseBadRequest("Invalid cursor.")
+
+        limit = self.get_limit()
+        objects = self.get_results(self.request.GET.get(self.search_kwarg, ""), cursor, limit)
+        next_cursor = None
+        if len(objects) > limit:
+            objects = objects[:limit]
+            next_cursor = self.encode_cursor(objects[-1])
+
+        return JsonResponse(
+            {"results": [self.get_result(obj) for obj in objects], "next": next_cursor}, encoder=self.encoder
+        )
+
+    def get_search_fields(self):
+        """Returns the names of columns to search."""
+        if not self.search_fields:
+            raise ImproperlyConfigured("%(cls)s is missing search_fields." % {"cls": self.__class__.__name__})
+
+        return self.search_fields
+
+    def get_search_filter(self, term):
+        """Returns the sqlalchemy criterion matching rows starting with
+        ``term``."""
+        model = self.get_model()
+        columns = [getattr(model, name) for name in self.get_search_fields()]
+        return sa.or_(*[sa.func.lower(column).startswith(term.lower(), autoescape=True) for column in columns])
+
+    def get_limit(self):
+        """Returns the number of results to return."""
+        limit = self.paginate_by
+        with suppress(KeyError, TypeError, ValueError):
+            limit = int(self.request.GET[self.limit_kwarg])
+
+        return max(1, min(limit, self.max_paginate_by))
+
+    def get_cursor(self):
+        """Returns the primary key tuple to continue after from the request."""
+        value = self.request.GET.get(self.cursor_kwarg)
+        if not value:
+            return None
+
+        infos = list(meta.model_info(self.get_model()).primary_keys.values())
+        try:
+            cursor = json.loads(value)
+        except ValueError:
+            cursor = None
+
+        if not isinstance(cursor, list) or len(cursor) != len(infos):
+            raise ValidationError("Invalid cursor.", code="invalid")
+
+        return tuple(info.to_python(v) for info, v in zip(infos, cursor))
+
+    def encode_cursor(self, obj):
+        """Returns the cursor value for continuing after ``obj``."""
+        mapper = meta.model_info(self.get_model()).mapper
+        return json.dumps(mapper.primary_key_from_instance(obj), cls=self.encoder)
+
+    def get_results(self, term, cursor, limit):
+        """Returns up to ``limit + 1`` model instances matching ``term`` after
+        ``cursor`` in primary key order."""
+        primary_key = meta.model_info(self.get_model()).mapper.primary_key
+        queryset = self.get_queryset()
+        if term:
+            queryset = queryset.filter(self.get_search_filter(term))
+
+        if cursor is not None:
+            if len(primary_key) == 1:
+                queryset = queryset.filter(primary_key[0] > cursor[0])
+            else:
+                queryset = queryset.filter(sa.tuple_(*primary_key) > sa.tuple_(*cursor))
+
+        return queryset.order_by(None).order_by(*primary_key).limit(limit + 1).all()
+
+    def get_result(self, obj):
+        """Returns the JSON result item for ``obj`` in the format of model
+        choice field choices."""
+        return {"id": meta.model_info(self.get_model()).primary_keys_from_instance(obj), "text": str(obj)}
+
+
+class SearchView(BaseSearchView):
+    """Serves JSON search results for search backed model choice fields, set
+    by ``self.model`` or ``self.queryset``."""
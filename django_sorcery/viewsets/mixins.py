@@ -6,7 +6,7 @@ from django.http import HttpResponseRedirect
 from django.views.generic.edit import FormMixin
 
 from ..db import meta
-from ..forms import modelform_factory
+from ..forms import cached_modelform_factory
 from ..views.base import BaseMultipleObjectMixin, BaseSingleObjectMixin
 
 
@@ -104,7 +104,7 @@ class ModelFormMixin(FormMixin, RetrieveModelMixin):
             return self.form_class
 
         model = self.get_model()
-        return modelform_factory(model, fields=self.fields, session=self.get_session())
+        return cached_modelform_factory(model, fields=self.fields, session=self.get_session())
 
     def get_form_kwargs(self):
         """Returns the keyword arguments for instantiating the form."""
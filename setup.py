@@ -26,7 +26,7 @@ setup(
     license="MIT",
     long_description=read("README.rst"),
     name="django-sorcery",
-    packages=find_packages(exclude=["tests", "tests.*"]),
+    packages=find_packages(exclude=["tests", "tests.*", "benchmarks", "benchmarks.*"]),
     entry_points={"pytest11": ["django-sorcery = django_sorcery.pytest_plugin"]},
     url="https://github.com/shosca/django-sorcery",
     version=about["__version__"],
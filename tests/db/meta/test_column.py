@@ -10,6 +10,7 @@ from django.core.exceptions import ValidationError
 from django.forms import fields as djangofields, widgets
 from django_sorcery import fields as sorceryfields
 from django_sorcery.db import fields as dbfields, meta
+from django_sorcery.db.meta import column
 
 from ...base import TestCase, mock
 from ...testapp.models import (
@@ -131,6 +132,23 @@ class TestColumnMeta(TestCase):
             {"help_text": None, "label": "Decimal", "required": False, "validators": []}, col.field_kwargs
         )
 
+    def test_column_info_class_cache(self):
+        info = meta.column_info(sa.Column(sa.Enum(VehicleType)), name="test")
+        self.assertIsInstance(info, meta.column.enum_column_info)
+        self.assertIs(
+            column._column_info_classes[(meta.column_info, sa.Enum, VehicleType)], meta.column.enum_column_info
+        )
+
+        enums = [(sa.Enum, enum.Enum), (sa.Enum, object)]
+        mapping = {k: v for k, v in meta.column.COLUMN_INFO_MAPPING.items() if k not in enums}
+        mapping[sa.Enum] = meta.column.string_column_info
+        with self.settings(DJANGO_SORCERY={"column_info_mapping": mapping}):
+            self.assertEqual(column._column_info_classes, {})
+            info = meta.column_info(sa.Column(sa.Enum(VehicleType)), name="test")
+            self.assertIsInstance(info, meta.column.string_column_info)
+
+        self.assertIsInstance(meta.column_info(sa.Column(sa.Enum(VehicleType))), meta.column.enum_column_info)
+
 
 def _run_tests(test, column_info, tests):
     for value, exp in tests:
@@ -425,3 +443,45 @@ class TestTimeColumn(TestCase):
             ("14:25:59", time(14, 25, 59)),
         ]
         _run_tests(self, info, tests)
+
+
+class TestGetCoercer(TestCase):
+    def test_fast_path(self):
+        class Demo(enum.Enum):
+            one = "1"
+
+        tests = [
+            (sa.Integer(), 1),
+            (sa.Numeric(), Decimal("1.1")),
+            (sa.Float(), 1.1),
+            (sa.Boolean(), True),
+            (sa.Date(), date(2006, 10, 25)),
+            (sa.DateTime(), datetime(2006, 10, 25, 14, 30)),
+            (sa.Time(), time(14, 25)),
+            (sa.Interval(), timedelta(seconds=30)),
+            (sa.Enum(Demo), Demo.one),
+        ]
+        for type_, value in tests:
+            info = meta.column_info(sa.Column(type_), name="test")
+            with mock.patch.object(type(info), "to_python") as to_python:
+                coerce = info.get_coercer()
+                self.assertIs(coerce(value), value)
+                self.assertIsNone(coerce(None))
+                to_python.assert_not_called()
+
+    def test_slow_path(self):
+        tests = [
+            (sa.Integer(), "1", 1),
+            (sa.Integer(), True, True),
+            (sa.Date(), datetime(2006, 10, 25, 14, 30), date(2006, 10, 25)),
+            (sa.DateTime(), date(2006, 10, 25), datetime(2006, 10, 25)),
+            (
+                sa.DateTime(),
+                datetime(2006, 10, 25, 14, 30, 45, 200, tzinfo=pytz.utc),
+                datetime(2006, 10, 25, 14, 30, 45, 200),
+            ),
+            (sa.String(), " abc ", "abc"),
+        ]
+        for type_, value, expected in tests:
+            coerce = meta.column_info(sa.Column(type_), name="test").get_coercer()
+            self.assertEqual(coerce(value), expected)
@@ -1,11 +1,11 @@
 import sqlalchemy as sa
 from django.apps import apps
-from django.core.exceptions import FieldDoesNotExist
-from django_sorcery.db import meta  # noqa
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django_sorcery.db import SQLAlchemy, meta  # noqa
 
-from ...base import TestCase
+from ...base import TestCase, mock
 from ...otherapp.models import OtherAppInOtherApp
-from ...testapp.models import Business, CompositePkModel, Owner, Vehicle
+from ...testapp.models import Business, CompositePkModel, Owner, Vehicle, VehicleType, db
 
 
 class TestModelMeta(TestCase):
@@ -27,6 +27,8 @@ class TestModelMeta(TestCase):
         self.assertEqual(
             [attr for attr in dir(info) if not attr.startswith("__")],
             [
+                "_field_lookup",
+                "_get_validation_plan",
                 "_init",
                 "app_config",
                 "app_label",
@@ -64,7 +66,9 @@ class TestModelMeta(TestCase):
                 "relationships",
                 "run_validators",
                 "sa_state",
+                "unchanged_fields",
                 "unique_together",
+                "validation_plan",
                 "vehicles",
                 "verbose_name",
                 "verbose_name_plural",
@@ -176,10 +180,121 @@ class TestModelMeta(TestCase):
             [("id", info.id), ("first_name", info.first_name), ("last_name", info.last_name)],
         )
 
+    def test_validation_plan(self):
+        info = meta.model_info(Vehicle)
+        plan = {entry[0]: entry[1:] for entry in info.validation_plan}
+
+        self.assertEqual(list(plan), list(info.properties))
+        self.assertEqual(plan["type"], (info.type, False, None, "clean_type", ()))
+        self.assertEqual(plan["paint"], (info.paint, True, None, "clean_paint", ()))
+        self.assertTrue(plan["_owner_id"][1])
+
+        vehicle = Vehicle(type="car", paint="pink")
+        with self.assertRaises(ValidationError) as ctx:
+            info.clean_fields(vehicle)
+        self.assertEqual(ctx.exception.message_dict, {"paint": ["Can't have a pink car"]})
+
+        info.clean_fields(vehicle, exclude=["paint"])
+        self.assertEqual(vehicle.type, VehicleType.car)
+
+    def test_validation_plan_hooks(self):
+        info = meta.model_info(Vehicle)
+        vehicle = Vehicle(type="car", paint="pink")
+        vehicle.clean_paint = mock.MagicMock()
+
+        info.clean_fields(vehicle)
+
+        vehicle.clean_paint.assert_called_once_with()
+
+        hook = mock.MagicMock()
+        with mock.patch.object(Vehicle, "clean_name", staticmethod(hook), create=True):
+            info.clean_fields(Vehicle(type="car", name="name"))
+
+        hook.assert_called_once_with()
+
+    def test_validation_plan_properties(self):
+        info = meta.model_info(Vehicle)
+        vehicle = Vehicle(type="car", paint="pink")
+
+        with mock.patch.object(Vehicle, "_get_properties_for_validation", return_value={"type": info.type}):
+            info.clean_fields(vehicle)
+
+        self.assertEqual(vehicle.type, VehicleType.car)
+
+    def test_validation_plan_custom_clean(self):
+        info = meta.model_info(Vehicle)
+
+        def clean(column, value, instance):
+            return value.upper()
+
+        with mock.patch.object(type(info.name), "clean", clean):
+            plan = info._get_validation_plan()
+
+        vehicle = Vehicle(type="car", name="name")
+        with mock.patch.object(info, "validation_plan", plan):
+            info.clean_fields(vehicle)
+
+        self.assertEqual(vehicle.name, "NAME")
+
+    def test_warmup(self):
+        for parallel in (False, True):
+            with mock.patch.dict(meta.model_info._registry, clear=True):
+                timings = meta.warmup([db], parallel=parallel)
+
+            self.assertEqual(set(timings), {m for m in db.models_registry if hasattr(m, "__mapper__")})
+            self.assertEqual(list(timings.values()), sorted(timings.values(), reverse=True))
+
+    def test_warmup_skips_registered(self):
+        info = meta.model_info(Vehicle)
+
+        with mock.patch.dict(meta.model_info._registry, {Vehicle: info}, clear=True):
+            timings = meta.warmup([db])
+
+        self.assertNotIn(Vehicle, timings)
+        self.assertIn(Owner, timings)
+        self.assertIs(meta.model_info(Vehicle), info)
+
     def test_model_meta_with_mapper(self):
         mapper = Vehicle.owner.property.parent
         self.assertEqual(meta.model_info(mapper), meta.model_info(Vehicle))
 
+    def test_model_meta_fast_path(self):
+        info = meta.model_info(Vehicle)
+
+        with mock.patch("sqlalchemy.inspect") as inspect:
+            self.assertIs(meta.model_info(Vehicle), info)
+            self.assertIs(meta.model_info(Vehicle()), info)
+            inspect.assert_not_called()
+
+    def test_model_meta_unregistered_instance(self):
+        sqlite_db = SQLAlchemy("sqlite://")
+
+        class Unhashable(sqlite_db.Model):
+            id = sqlite_db.Column(sqlite_db.Integer(), primary_key=True)
+
+            def __eq__(self, other):
+                return isinstance(other, Unhashable) and self.id == other.id
+
+        instance = Unhashable(id=1)
+
+        with mock.patch.dict(meta.model_info._registry):
+            del meta.model_info._registry[Unhashable]
+            info = meta.model_info(instance)
+
+            self.assertIs(info.model_class, Unhashable)
+            self.assertIs(meta.model_info(Unhashable), info)
+
+    def test_field_lookup(self):
+        info = meta.model_info(Business)
+
+        self.assertIs(info.get_field("id"), info.primary_keys["id"])
+        self.assertIs(info.get_field("name"), info.properties["name"])
+        self.assertIs(info.get_field("location"), info.composites["location"])
+        self.assertIs(meta.model_info(Vehicle).get_field("owner"), meta.model_info(Vehicle).relationships["owner"])
+        self.assertIs(info.location, info.composites["location"])
+        with self.assertRaises(AttributeError):
+            info.zzzzzz
+
     def test_primary_keys_from_dict(self):
         info = meta.model_info(Owner)
 
@@ -3,7 +3,7 @@ from django.core.exceptions import ImproperlyConfigured
 from django_sorcery import fields
 from django_sorcery.db import meta
 
-from ...base import TestCase
+from ...base import TestCase, mock
 from ...models_terrible_relations import Foo
 from ...testapp.models import Owner, Part, Vehicle
 
@@ -97,3 +97,17 @@ class TestRelationshipMeta(TestCase):
 
         self.assertDictEqual(info.parts.field_kwargs, {"required": False})
         self.assertDictEqual(info.owner.field_kwargs, {"required": False})
+
+    def test_field_kwargs_info(self):
+        info = {"choices_cache_timeout": 60}
+
+        with mock.patch.dict(Vehicle.owner.property.info, info):
+            rel = meta.relation_info(Vehicle.owner.property)
+
+        self.assertDictEqual(rel.field_kwargs, {"required": False, "cache_timeout": 60})
+
+    def test_field_kwargs_search_url(self):
+        with mock.patch.dict(Vehicle.owner.property.info, {"search_url": "/owners/"}):
+            rel = meta.relation_info(Vehicle.owner.property)
+
+        self.assertDictEqual(rel.field_kwargs, {"required": False, "search_url": "/owners/"})
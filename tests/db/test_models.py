@@ -1,20 +1,27 @@
 import datetime
+from collections import OrderedDict
 from decimal import Decimal
 
 from django.core.exceptions import ValidationError
-from django_sorcery.db import meta, models
+from django.test import override_settings
+from django_sorcery.db import SQLAlchemy, meta, models
+from django_sorcery.db.profiler import SQLAlchemyProfiler
 from django_sorcery.utils import make_args
 
-from ..base import TestCase
+from ..base import TestCase, mock
 from ..testapp.models import (
     Address,
     AllKindsOfFields,
     Business,
     DummyEnum,
+    ModelOne,
+    ModelTwo,
     Option,
     Owner,
     Part,
     SelectedAutoCoerce,
+    States,
+    ValidateUniqueModel,
     Vehicle,
     VehicleType,
     db,
@@ -106,6 +113,51 @@ class TestSerialization(TestCase):
             models.serialize(vehicle, Vehicle.owner, Vehicle.options, Vehicle.parts),
         )
 
+    def test_serialize_list(self):
+        vehicles = [Vehicle(name="vehicle 1", owner=Owner(first_name="first_name")), None, Vehicle(name="vehicle 2")]
+
+        self.assertEqual(
+            models.serialize(vehicles, Vehicle.owner),
+            [models.serialize(vehicles[0], Vehicle.owner), None, models.serialize(vehicles[2], Vehicle.owner)],
+        )
+        self.assertEqual(models.serialize([None]), [None])
+        self.assertEqual(models.serialize(set()), [])
+
+    def test_serializer_plan(self):
+        plan = models.get_serializer_plan(Vehicle, Vehicle.owner, Owner.vehicles)
+
+        self.assertIs(plan, models.get_serializer_plan(Vehicle, Owner.vehicles, Vehicle.owner))
+        self.assertIsNot(plan, models.get_serializer_plan(Vehicle))
+        self.assertEqual([name for name, _ in plan.relationships], ["owner"])
+
+        owner_plan = plan.relationships[0][1]
+        self.assertEqual(owner_plan.model, Owner)
+        self.assertEqual(owner_plan.rels, frozenset([Owner.vehicles]))
+        self.assertEqual(owner_plan.relationships[0][1].rels, frozenset())
+
+        owner = Owner(first_name="first_name")
+        vehicles = [Vehicle(name="vehicle 1", owner=owner), Vehicle(name="vehicle 2", owner=owner)]
+
+        data = plan.many(vehicles)
+
+        self.assertEqual(data, [plan(v) for v in vehicles])
+        self.assertEqual([v["owner"]["vehicles"][1]["name"] for v in data], ["vehicle 2", "vehicle 2"])
+        self.assertEqual(plan(vehicles[0]), models.serialize(vehicles[0], Vehicle.owner, Owner.vehicles))
+
+    def test_serializer_plan_subclass(self):
+        sqlite_db = SQLAlchemy("sqlite://")
+
+        class Single(sqlite_db.Model):
+            id = sqlite_db.Column(sqlite_db.Integer(), primary_key=True)
+
+        class SingleSubclass(Single):
+            __tablename__ = None
+
+        plan = models.get_serializer_plan(Single)
+
+        self.assertEqual(plan(Single(id=1)), {"id": 1})
+        self.assertEqual(plan(SingleSubclass(id=2)), {"id": 2})
+
     def test_deserialize(self):
         data = {
             "_owner_id": None,
@@ -196,6 +248,113 @@ class TestSerialization(TestCase):
         )
 
 
+class TestBulkDeserialize(TestCase):
+    def test_bulk_deserialize(self):
+        data = [
+            {
+                "name": "vehicle {}".format(i),
+                "type": VehicleType.car,
+                "is_used": True,
+                "owner": {"first_name": "owner {}".format(i), "last_name": "last_name"},
+                "options": [{"name": "option 1"}, {"name": "option 2"}],
+                "parts": [{"name": "part 1"}],
+            }
+            for i in range(3)
+        ]
+
+        with SQLAlchemyProfiler() as profiler:
+            pks = models.bulk_deserialize(db, Vehicle, data)
+
+        self.assertEqual(len(pks), 3)
+        self.assertEqual(profiler.counts["insert"], 6 if db.bind.dialect.implicit_returning else 21)
+
+        vehicles = [Vehicle.objects.get(pk) for pk in pks]
+        self.assertEqual([v.name for v in vehicles], ["vehicle 0", "vehicle 1", "vehicle 2"])
+        self.assertEqual([v.owner.first_name for v in vehicles], ["owner 0", "owner 1", "owner 2"])
+        self.assertEqual([sorted(o.name for o in v.options) for v in vehicles], [["option 1", "option 2"]] * 3)
+        self.assertEqual([[p.name for p in v.parts] for v in vehicles], [["part 1"]] * 3)
+        self.assertTrue(all(v.is_used and v.type == VehicleType.car for v in vehicles))
+
+    def test_bulk_deserialize_identity_keys(self):
+        data = {
+            "id": 1000,
+            "first_name": "first_name",
+            "vehicles": [
+                {"id": 1001, "name": "vehicle 1", "type": VehicleType.car},
+                {"id": 1002, "name": "vehicle 2", "type": VehicleType.bus, "options": [{"id": 1000, "name": "option"}]},
+            ],
+        }
+
+        self.assertEqual(models.bulk_deserialize(db, Owner, data), (1000,))
+        self.assertEqual(
+            models.bulk_deserialize(
+                db,
+                Option,
+                [
+                    {"id": 1001, "vehicles": [{"id": 1003, "_owner_id": 1004, "type": VehicleType.car}]},
+                    {"id": 1002, "vehicles": [{"id": 1003}]},
+                    {"id": 1003, "vehicles": [{"id": 1004, "owner": {"id": 1004}, "type": VehicleType.car}]},
+                ],
+            ),
+            [(1001,), (1002,), (1003,)],
+        )
+
+        owner = Owner.objects.get(1000)
+        self.assertEqual(sorted(v.id for v in owner.vehicles), [1001, 1002])
+        self.assertEqual([o.id for o in Vehicle.objects.get(1002).options], [1000])
+        self.assertEqual(Vehicle.objects.get(1003).owner, Owner.objects.get(1004))
+        self.assertEqual(sorted(o.id for o in Vehicle.objects.get(1003).options), [1001, 1002])
+
+    def test_bulk_deserialize_composites(self):
+        pk = models.bulk_deserialize(
+            db, Business, {"name": "test", "location": {"street": "street 1", "state": "NY", "zip": "123"}}
+        )
+
+        business = Business.objects.get(pk)
+        self.assertEqual(business.location, Address(street="street 1", state=States.NY, zip="123"))
+        self.assertEqual(business.employees, 5)
+
+    def test_bulk_deserialize_serialized(self):
+        vehicle = Vehicle(name="vehicle", type=VehicleType.car, owner=Owner(first_name="first", last_name="last"))
+        data = models.serialize(vehicle, Vehicle.owner)
+        self.assertIsNone(data["id"])
+
+        pk = models.bulk_deserialize(db, Vehicle, data)
+
+        clone = Vehicle.objects.get(pk)
+        self.assertEqual((clone.name, clone.type), ("vehicle", VehicleType.car))
+        self.assertEqual((clone.owner.first_name, clone.owner.last_name), ("first", "last"))
+
+        (owner_id,) = models.bulk_deserialize(db, Owner, {"id": None, "first_name": "first"})
+        self.assertEqual(Owner.objects.get(owner_id).first_name, "first")
+
+    def test_bulk_deserialize_without_returning(self):
+        data = [
+            {"name": "vehicle {}".format(i), "type": VehicleType.car, "owner": {"first_name": "owner"}}
+            for i in range(3)
+        ]
+
+        with mock.patch.object(db.bind.dialect, "implicit_returning", False), SQLAlchemyProfiler() as profiler:
+            pks = models.bulk_deserialize(db, Vehicle, data)
+
+        self.assertEqual(profiler.counts["insert"], 6)
+        self.assertEqual([Vehicle.objects.get(pk).owner.first_name for pk in pks], ["owner"] * 3)
+
+    def test_bulk_deserialize_cyclic(self):
+        graph = models._BulkGraph()
+        one = graph.add(Owner.__mapper__, {})
+        two = graph.add(Owner.__mapper__, {})
+        one.sources.append((two, ()))
+        two.sources.append((one, ()))
+
+        with self.assertRaises(ValueError):
+            graph.execute(db)
+
+    def test_bulk_deserialize_empty(self):
+        self.assertIsNone(models.bulk_deserialize(db, Vehicle, None))
+        self.assertEqual(models.bulk_deserialize(db, Vehicle, []), [])
+
+
 class TestClone(TestCase):
     def setUp(self):
         super().setUp()
@@ -300,6 +459,151 @@ class TestClone(TestCase):
             self.assertNotEqual(cloned.as_dict(), orig.as_dict())
             self.assertNotEqual(cloned.id, orig.id)
 
+    def test_bulk_clone(self):
+        pk = models.bulk_clone(self.vehicle, paint="blue")
+        clone = Vehicle.objects.get(pk)
+
+        self.assertNotEqual(clone.id, self.vehicle.id)
+        self.assertEqual(clone.paint, "blue")
+        self.assertEqual(clone.name, self.vehicle.name)
+        self.assertEqual(clone.type, self.vehicle.type)
+        self.assertIs(clone.owner, self.vehicle.owner)
+        self.assertEqual(clone.options, [])
+        self.assertEqual(clone.parts, [])
+
+    def test_bulk_clone_with_relations(self):
+        pk = models.bulk_clone(
+            self.vehicle, make_args(Vehicle.owner, first_name="test"), Vehicle.options, parts=self.vehicle.parts
+        )
+        clone = Vehicle.objects.get(pk)
+
+        self.assertNotEqual(clone.owner.id, self.vehicle.owner.id)
+        self.assertEqual(clone.owner.first_name, "test")
+        self.assertEqual(clone.owner.last_name, self.vehicle.owner.last_name)
+        self.assertEqual(sorted(o.name for o in clone.options), ["option 1", "option 2"])
+        self.assertFalse(set(clone.options) & set(self.vehicle.options))
+        self.assertEqual(sorted(clone.parts, key=lambda p: p.id), sorted(self.vehicle.parts, key=lambda p: p.id))
+
+    def test_bulk_clone_graph(self):
+        owner = self.vehicle.owner
+        owner.vehicles.append(Vehicle(name="other", type=VehicleType.bus, parts=self.vehicle.parts))
+        db.flush()
+        parts = Part.objects.count()
+
+        with SQLAlchemyProfiler() as profiler:
+            pk = models.bulk_clone(owner, Owner.vehicles, Vehicle.parts)
+
+        clone = Owner.objects.get(pk)
+        self.assertEqual(sorted(v.name for v in clone.vehicles), ["other", "vehicle"])
+        self.assertEqual(Part.objects.count(), parts + 2)
+        vehicle_parts = [sorted(p.id for p in v.parts) for v in clone.vehicles]
+        self.assertEqual(vehicle_parts[0], vehicle_parts[1])
+        self.assertFalse(set(vehicle_parts[0]) & {p.id for p in self.vehicle.parts})
+        if db.bind.dialect.implicit_returning:
+            self.assertEqual(profiler.counts["insert"], 4)
+
+    def test_bulk_clone_remaps_foreign_keys(self):
+        one = ModelOne(name="one", _model_twos=[ModelTwo(name="two 1"), ModelTwo(name="two 2")])
+        db.add(one)
+        db.flush()
+
+        pks = models.bulk_clone([one] + one._model_twos)
+
+        clone = ModelOne.objects.get(pks[0])
+        self.assertNotEqual(clone.pk, one.pk)
+        self.assertEqual(sorted(t.pk for t in clone._model_twos), sorted(pk for pk, in pks[1:]))
+
+    def test_bulk_clone_empty(self):
+        self.assertEqual(models.bulk_clone([]), [])
+
+    def test_bulk_clone_one_to_many_override(self):
+        with self.assertRaises(ValueError):
+            models.bulk_clone(self.vehicle.owner, vehicles=[self.vehicle])
+
+    def test_bulk_clone_detached(self):
+        db.refresh(self.vehicle)
+        db.expunge(self.vehicle)
+
+        with self.assertRaises(ValueError):
+            models.bulk_clone(self.vehicle)
+
+        pk = models.bulk_clone(self.vehicle, session=db)
+
+        self.assertEqual(Vehicle.objects.get(pk).name, self.vehicle.name)
+
+    def test_bulk_clone_composites(self):
+        business = Business(name="business", location=Address(street="street", state=States.NY, zip="12345"))
+        db.add(business)
+        db.flush()
+
+        pk = models.bulk_clone(
+            business, location=Address(street="other", state=States.NJ, zip="54321"), other_location=None
+        )
+        clone = Business.objects.get(pk)
+
+        self.assertEqual(clone.name, "business")
+        self.assertEqual(clone.location, Address(street="other", state=States.NJ, zip="54321"))
+        self.assertIsNone(clone.other_location.street)
+
+    def test_bulk_clone_empty_relation(self):
+        vehicle = Vehicle(name="vehicle", type=VehicleType.car)
+        db.add(vehicle)
+        db.flush()
+        owners = Owner.objects.count()
+
+        pk = models.bulk_clone(vehicle, Vehicle.owner)
+
+        self.assertIsNone(Vehicle.objects.get(pk).owner)
+        self.assertEqual(Owner.objects.count(), owners)
+
+    def test_related_instances_dict(self):
+        relation = mock.Mock(uselist=True)
+        part = Part()
+
+        self.assertEqual(models._related_instances(relation, {"part": part}), [part])
+
+    def test_bulk_joined_table_inheritance(self):
+        sqlite_db = SQLAlchemy("sqlite://")
+
+        class BulkParent(sqlite_db.Model):
+            id = sqlite_db.Column(sqlite_db.Integer(), primary_key=True)
+            kind = sqlite_db.Column(sqlite_db.String())
+
+            __mapper_args__ = {"polymorphic_on": kind, "polymorphic_identity": "parent"}
+
+        class BulkChild(BulkParent):
+            id = sqlite_db.Column(sqlite_db.ForeignKey(BulkParent.id), primary_key=True)
+
+            __mapper_args__ = {"polymorphic_identity": "child"}
+
+        with self.assertRaises(ValueError):
+            models.bulk_deserialize(sqlite_db, BulkChild, [{"kind": "child"}])
+
+    def test_bulk_compiled_inserts_reused(self):
+        data = [{"first_name": "first {}".format(i), "last_name": "last"} for i in range(4)]
+
+        with mock.patch.object(models._BulkGraph, "_compiled_inserts", OrderedDict()) as compiled_inserts:
+            pks = models.bulk_deserialize(db, Owner, data, batch_size=2)
+
+            if db.bind.dialect.implicit_returning:
+                self.assertEqual(len(compiled_inserts), 1)
+
+        self.assertEqual([Owner.objects.get(pk).first_name for pk in pks], [d["first_name"] for d in data])
+
+    def test_bulk_clone_compiled_inserts_bounded(self):
+        graph = models._BulkGraph()
+        dialect = db.bind.dialect
+        columns = [Owner.__table__.c.first_name]
+
+        with mock.patch.object(models._BulkGraph, "_compiled_inserts", OrderedDict()):
+            with mock.patch.object(models._BulkGraph, "max_compiled_inserts", 2):
+                for size in range(1, 4):
+                    graph._returning_insert(
+                        Owner.__mapper__, Owner.__table__, ("first_name",), columns, size, dialect, True
+                    )
+
+                self.assertEqual([key[3] for key in graph._compiled_inserts], [2, 3])
+
 
 class TestBaseModel(TestCase):
     def test_default_table_name(self):
@@ -367,10 +671,73 @@ class TestBaseModel(TestCase):
         )
 
 
+class TestIncrementalValidation(TestCase):
+    def test_unchanged_fields(self):
+        business = Business(name="test", location=Address(street="street", state=States.NY, zip="123"))
+        db.add(business)
+        db.flush()
+        info = meta.model_info(Business)
+
+        business.name = "other"
+        self.assertEqual(set(info.unchanged_fields(business)), {"employees", "location", "other_location"})
+
+        business.location = Address(street="other street", state=States.NY, zip="123")
+        self.assertEqual(set(info.unchanged_fields(business)), {"employees", "other_location"})
+
+    def test_only_changed_fields_are_validated(self):
+        db.execute(Owner.__table__.insert().values(id=1000, first_name="invalid", last_name="last"))
+        owner = Owner.objects.get(1000)
+
+        owner.last_name = "other"
+        with override_settings(DJANGO_SORCERY={"incremental_validation": True}):
+            db.flush()
+
+        owner.last_name = "another"
+        with self.assertRaises(ValidationError):
+            db.flush()
+
+    def test_new_instances_are_fully_validated(self):
+        db.add(Owner(first_name="invalid", last_name="last"))
+
+        with override_settings(DJANGO_SORCERY={"incremental_validation": True}):
+            with self.assertRaises(ValidationError):
+                db.flush()
+
+    def test_validators_with_unchanged_dependencies_are_skipped(self):
+        table = ValidateUniqueModel.__table__
+        db.execute(table.insert().values([{"pk": 1000, "name": "name"}, {"pk": 1001, "name": "name"}]))
+        instance = ValidateUniqueModel.objects.get(1000)
+
+        instance.foo = "foo"
+        with override_settings(DJANGO_SORCERY={"incremental_validation": True}):
+            with SQLAlchemyProfiler() as profiler:
+                db.flush()
+        self.assertEqual(profiler.counts["select"], 1)
+
+        instance.foo = "other"
+        with self.assertRaises(ValidationError):
+            db.flush()
+
+
 class TestAutoCoerce(TestCase):
     def setUp(self):
         self.instance = AllKindsOfFields()
 
+    def test_coercer_not_a_column(self):
+        self.assertIsNone(models._make_coercer(Vehicle.owner))
+
+    def test_configure_coercers(self):
+        configured = next(iter(models._coercers))
+
+        with mock.patch.object(models, "_autocoerce_attrs", {configured, Vehicle.owner}):
+            with mock.patch.dict(models._coercers):
+                with mock.patch.object(models, "_make_coercer", return_value=None) as make_coercer:
+                    models._configure_coercers()
+
+                self.assertIsNone(models._coercers[Vehicle.owner])
+
+        make_coercer.assert_called_once_with(Vehicle.owner)
+
     def _run_tests(self, attr, tests):
         for test, exp in tests:
             if exp is ValidationError:
@@ -589,3 +956,86 @@ class TestInstantDefaults(TestCase):
 
     def test_non_model(self):
         self.assertIsNone(models.instant_defaults(list))
+
+    def test_precomputed(self):
+        Business()
+        Owner()
+
+        self.assertEqual(models._instant_defaults[Business], (("employees", 5),))
+        self.assertEqual(models._instant_defaults[Owner], ())
+        self.assertIs(models.instant_defaults(Business), Business)
+
+    def test_forward_reference(self):
+        db = SQLAlchemy("sqlite://")
+
+        @models.instant_defaults
+        class InstantParent(db.Model):
+            id = db.Column(db.Integer(), primary_key=True)
+            count = db.Column(db.Integer(), default=1)
+            children = db.relationship("InstantChild")
+
+        class InstantChild(db.Model):
+            id = db.Column(db.Integer(), primary_key=True)
+            parent_id = db.Column(db.ForeignKey(InstantParent.id))
+
+        self.assertEqual(InstantParent().count, 1)
+
+
+class TestTableVersions(TestCase):
+    def setUp(self):
+        super().setUp()
+        models.get_choices_cache().clear()
+        self.addCleanup(models.get_choices_cache().clear)
+
+    def test_commit_handler(self):
+        version = models.get_table_versions({"owner"})
+
+        models.table_versions_commit_handler(mock.Mock(models_committed={Owner()}, models_deleted={Vehicle()}, info={}))
+
+        self.assertNotEqual(models.get_table_versions({"owner"}), version)
+        self.assertIsNone(models.get_choices_cache().get(models._table_version_key("vehicle")))
+
+    def test_commit_handler_unversioned(self):
+        with mock.patch.object(models.get_choices_cache(), "set_many") as set_many:
+            models.table_versions_commit_handler(mock.Mock(models_committed={Owner()}, models_deleted=set(), info={}))
+
+        set_many.assert_not_called()
+
+    def test_commit_handler_cache_error(self):
+        with mock.patch.object(models.get_choices_cache(), "get_many", side_effect=ValueError):
+            with self.assertLogs(models.logger, "ERROR"):
+                models.table_versions_commit_handler(
+                    mock.Mock(models_committed={Owner()}, models_deleted=set(), info={})
+                )
+
+    def test_commit_handler_bulk_update(self):
+        version = models.get_table_versions({"owner"})
+
+        db.query(Owner).filter(Owner.id == -1).update({"first_name": "first"}, synchronize_session=False)
+        self.assertEqual(db.info[models._WRITTEN_TABLES_KEY], {"owner"})
+
+        models.table_versions_commit_handler(mock.Mock(models_committed=set(), models_deleted=set(), info=db.info))
+
+        self.assertNotEqual(models.get_table_versions({"owner"}), version)
+        self.assertNotIn(models._WRITTEN_TABLES_KEY, db.info)
+
+    def test_commit_handler_bulk_deserialize(self):
+        models.bulk_deserialize(db, Owner, [{"first_name": "first", "last_name": "last"}])
+
+        self.assertEqual(db.info[models._WRITTEN_TABLES_KEY], {"owner"})
+
+    def test_rollback_handler(self):
+        db.query(Owner).filter(Owner.id == -1).delete(synchronize_session=False)
+        self.assertEqual(db.info[models._WRITTEN_TABLES_KEY], {"owner"})
+
+        db.rollback()
+
+        self.assertNotIn(models._WRITTEN_TABLES_KEY, db.info)
+
+    def test_get_table_versions_added_concurrently(self):
+        cache = models.get_choices_cache()
+
+        cache.set(models._table_version_key("owner"), "other", None)
+
+        with mock.patch.object(cache, "get_many", return_value={}):
+            self.assertEqual(models.get_table_versions({"owner"}), ("other",))
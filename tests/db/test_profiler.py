@@ -1,11 +1,27 @@
+import json
+import tempfile
+
+import sqlalchemy as sa
 from django.http import HttpResponse
 from django.test import RequestFactory, override_settings
+from django_sorcery.db import signals
+from django_sorcery.db.middleware import SQLAlchemyMiddleware
 from django_sorcery.db.profiler import (
+    InMemorySpanExporter,
+    JSONFileSpanExporter,
+    QueryBudget,
+    RateLimiter,
     SQLAlchemyProfiler,
     SQLAlchemyProfilingMiddleware,
+    SpanExporter,
+    SQLAlchemyTracer,
+    fingerprint,
+    get_alias,
+    query_budget,
 )
+from django_sorcery.exceptions import QueryBudgetExceeded
 
-from ..base import TestCase
+from ..base import TestCase, mock
 from ..testapp.models import Business, Owner, db
 
 
@@ -22,9 +38,14 @@ class TestSQLAlchemyProfilingMiddleware(TestCase):
     def test_profiler_debug(self):
         m = SQLAlchemyProfilingMiddleware(get_response)
 
-        response = m(RequestFactory().get("/"))
+        with mock.patch.object(m, "log") as log:
+            response = m(RequestFactory().get("/"))
 
         self.assertEqual(response["X-SA-Insert"], "1")
+        self.assertEqual(response["X-SA-Flush"], "1")
+        self.assertIn("X-SA-FlushDuration", response)
+        self.assertIn("X-SA-ValidationDuration", response)
+        self.assertEqual(log.call_args[1]["sa_insert"], 1)
 
     @override_settings(DEBUG=False)
     def test_profiler_no_debug(self):
@@ -46,6 +67,57 @@ class TestSQLAlchemyProfilingMiddleware(TestCase):
         with override_settings(DEBUG=False):
             self.assertFalse(SQLAlchemyProfilingMiddleware(get_response).log_results)
 
+    def test_profiler_options(self):
+        with override_settings(DJANGO_SORCERY={"profiler": {"slow_query_threshold": 0.5}}):
+            m = SQLAlchemyProfilingMiddleware(get_response)
+
+        self.assertEqual(m.profiler.slow_query_threshold, 0.5)
+
+
+class TestFingerprint(TestCase):
+    def test_fingerprint(self):
+        self.assertEqual(
+            fingerprint("SELECT * FROM owner WHERE id IN (%(id_1)s, %(id_2)s) AND name = 'foo'"),
+            fingerprint("select *  from owner\nwhere id in (%(id_1)s) and name = 'bar'"),
+        )
+        self.assertEqual(fingerprint("SELECT 1"), fingerprint("SELECT 2"))
+        self.assertNotEqual(fingerprint("SELECT * FROM owner"), fingerprint("SELECT * FROM business"))
+
+
+class TestGetAlias(TestCase):
+    def test_get_alias(self):
+        self.assertEqual(get_alias(db.engine), "test")
+
+    def test_get_alias_other_registry(self):
+        engine = db.engine
+
+        with mock.patch.object(db, "_registry", object()):
+            self.assertIsNone(get_alias(engine))
+
+
+class TestRateLimiter(TestCase):
+    def test_acquire(self):
+        limiter = RateLimiter(limit=2, period=60)
+
+        self.assertEqual(limiter.acquire("foo"), (True, 0))
+        self.assertEqual(limiter.acquire("foo"), (True, 0))
+        self.assertEqual(limiter.acquire("foo"), (False, 1))
+        self.assertEqual(limiter.acquire("foo"), (False, 2))
+        self.assertEqual(limiter.acquire("bar"), (True, 0))
+
+        limiter.period = 0
+        self.assertEqual(limiter.acquire("foo"), (True, 2))
+
+    def test_bounded(self):
+        limiter = RateLimiter(limit=1, period=60, max_keys=2)
+
+        for key in ("foo", "bar", "foo", "baz"):
+            limiter.acquire(key)
+
+        self.assertEqual(list(limiter.windows), ["foo", "baz"])
+        self.assertEqual(limiter.acquire("foo"), (False, 2))
+        self.assertEqual(limiter.acquire("bar"), (True, 0))
+
 
 class TestProfiler(TestCase):
     def test_profiler(self):
@@ -81,3 +153,363 @@ class TestProfiler(TestCase):
 
         self.assertTrue(select_query.statement.lower().startswith("select owner.id"))
         self.assertTrue(select_query.parameters, [{}])
+
+    def test_excluded_repeated(self):
+        profiler = SQLAlchemyProfiler(exclude=["business"])
+
+        with profiler:
+            Business.objects.all()
+            Business.objects.all()
+
+        self.assertEqual(profiler.counts["execute"], 0)
+        self.assertEqual(profiler.queries, [])
+
+    def test_classify(self):
+        profiler = SQLAlchemyProfiler(exclude=["business"])
+        profiler.statement_cache_size = 1
+
+        self.assertEqual(profiler.exclude, ["business"])
+        self.assertIsNone(profiler.classify("SELECT * FROM business"))
+        self.assertEqual(profiler.classify("UPDATE owner"), ("update", "flush_update_duration"))
+        self.assertEqual(profiler._statement_cache, {"UPDATE owner": ("update", "flush_update_duration")})
+
+    def test_duration(self):
+        profiler = SQLAlchemyProfiler()
+
+        profiler.duration = 1.5
+
+        self.assertEqual(profiler.duration, 1.5)
+        self.assertEqual(profiler.stats["duration"], 1.5)
+
+    def test_orm_phases(self):
+        profiler = SQLAlchemyProfiler()
+
+        with profiler:
+            db.add_all([Owner(first_name="foo", last_name="bar"), Owner(first_name="bar", last_name="foo")])
+            db.flush()
+            owner = Owner.objects.first()
+            owner.first_name = "baz"
+            db.delete(Owner.objects.filter(Owner.first_name == "bar").one())
+            db.flush()
+            db.expunge_all()
+            Owner.objects.all()
+            db.rollback()
+            db.remove()
+
+        phases = profiler.phases
+        self.assertEqual(phases["load"], 1)
+        self.assertEqual(dict(profiler.loaded), {"Owner": 1})
+        self.assertEqual(phases["flush"], 3)
+        self.assertGreater(phases["load_duration"], 0)
+        self.assertGreater(phases["flush_insert_duration"], 0)
+        self.assertGreater(phases["flush_update_duration"], 0)
+        self.assertGreater(phases["flush_delete_duration"], 0)
+        self.assertGreater(phases["validation_duration"], 0)
+        self.assertGreater(
+            phases["flush_duration"],
+            phases["flush_insert_duration"] + phases["flush_update_duration"] + phases["flush_delete_duration"],
+        )
+
+        stats = profiler.stats
+        self.assertEqual(stats["load"], 1)
+        self.assertEqual(stats["execute"], 8)
+
+    def test_flush_failure(self):
+        profiler = SQLAlchemyProfiler()
+
+        with profiler:
+            db.add(Owner(id=1, first_name="foo", last_name="bar"))
+            db.flush()
+            db.add(Owner(id=1, first_name="foo", last_name="bar"))
+            with self.assertRaises(sa.orm.exc.FlushError):
+                db.flush()
+            self.assertNotIn("_flushing", profiler.local.__dict__)
+            db.rollback()
+            db.remove()
+
+        self.assertEqual(profiler.phases["flush"], 1)
+
+    def test_slow_queries(self):
+        profiler = SQLAlchemyProfiler(slow_query_threshold=0, explain_slow_queries=True)
+
+        with mock.patch.object(profiler, "logger") as logger, profiler:
+            Owner.objects.filter(Owner.first_name == "foo").all()
+            db.add(Owner(first_name="foo", last_name="bar"))
+            db.flush()
+            db.rollback()
+            db.remove()
+
+        self.assertEqual(profiler.counts["execute"], 2)
+
+        select_query, insert_query = profiler.slow_queries
+        self.assertEqual(select_query.fingerprint, fingerprint(select_query.statement))
+        self.assertEqual(select_query.parameters, {"first_name_1": "foo"})
+        self.assertEqual(select_query.alias, "test")
+        self.assertNotIn("postgres:postgres", select_query.engine)
+        self.assertIn("test_profiler.py", select_query.call_site)
+        self.assertIn("Seq Scan on owner", select_query.plan)
+        self.assertIsNone(insert_query.plan)
+
+        self.assertEqual(logger.warning.call_count, 2)
+        self.assertEqual(logger.warning.call_args[1]["extra"]["sa_slow_query"]["fingerprint"], insert_query.fingerprint)
+
+    def test_slow_queries_rate_limit(self):
+        profiler = SQLAlchemyProfiler(slow_query_threshold=0, slow_query_rate=1)
+
+        with mock.patch.object(profiler, "logger") as logger, profiler:
+            Owner.objects.filter(Owner.first_name == "foo").all()
+            Owner.objects.filter(Owner.first_name == "bar").all()
+            db.rollback()
+            db.remove()
+
+        self.assertEqual(len(profiler.slow_queries), 1)
+        self.assertEqual(logger.warning.call_count, 1)
+
+    def test_slow_queries_threshold(self):
+        profiler = SQLAlchemyProfiler(slow_query_threshold=60)
+
+        with profiler:
+            Owner.objects.all()
+            db.rollback()
+            db.remove()
+
+        self.assertEqual(profiler.slow_queries, [])
+
+    def test_explain_failure(self):
+        profiler = SQLAlchemyProfiler()
+
+        plan = profiler.explain(db.engine, "SELECT * FROM nonexistent", {})
+
+        self.assertTrue(plan.startswith("EXPLAIN failed"))
+        self.assertNotIn("_explaining", profiler.local.__dict__)
+
+
+class TestQueryBudget(TestCase):
+    def test_within_budget(self):
+        with QueryBudget(max_queries=1, max_query_time_ms=60000, raise_exception=True):
+            Owner.objects.all()
+
+    def test_max_queries_exceeded(self):
+        with self.assertRaises(QueryBudgetExceeded) as ctx:
+            with QueryBudget(max_queries=1, name="owners", raise_exception=True):
+                Owner.objects.all()
+                Owner.objects.all()
+
+        self.assertEqual(str(ctx.exception), "Query budget exceeded for owners: 2 queries exceeds max_queries=1")
+
+    def test_max_query_time_exceeded(self):
+        with self.assertRaises(QueryBudgetExceeded):
+            with QueryBudget(max_query_time_ms=0, raise_exception=True):
+                Owner.objects.all()
+
+    def test_report_only(self):
+        received = []
+
+        def receiver(sender, **kwargs):
+            received.append(kwargs)
+
+        signals.query_budget_exceeded.connect(receiver)
+        budget = QueryBudget(max_queries=0, name="owners")
+        try:
+            with override_settings(DJANGO_SORCERY={"raise_on_query_budget": False}):
+                with mock.patch.object(budget, "logger") as logger, budget:
+                    Owner.objects.all()
+        finally:
+            signals.query_budget_exceeded.disconnect(receiver)
+
+        logger.warning.assert_called_once_with("Query budget exceeded for owners: 1 queries exceeds max_queries=0")
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0]["queries"], 1)
+        self.assertEqual(received[0]["name"], "owners")
+
+    def test_should_raise(self):
+        budget = QueryBudget()
+
+        with override_settings(DEBUG=True):
+            self.assertTrue(budget.should_raise())
+        with override_settings(DEBUG=False, DJANGO_SORCERY={}):
+            self.assertFalse(budget.should_raise())
+        with override_settings(DEBUG=False, DJANGO_SORCERY={}), mock.patch.object(QueryBudget, "testing", True):
+            self.assertTrue(budget.should_raise())
+        with override_settings(DEBUG=True, DJANGO_SORCERY={"raise_on_query_budget": False}):
+            self.assertFalse(budget.should_raise())
+        with override_settings(DEBUG=False, DJANGO_SORCERY={"raise_on_query_budget": True}):
+            self.assertTrue(budget.should_raise())
+
+    def test_nested(self):
+        outer = QueryBudget(max_queries=2, raise_exception=True)
+        inner = QueryBudget(max_queries=1, raise_exception=True)
+
+        with outer:
+            Owner.objects.all()
+            with inner:
+                Owner.objects.all()
+
+    def test_decorator(self):
+        @QueryBudget(max_queries=0, raise_exception=True)
+        def func():
+            return Owner.objects.all()
+
+        with self.assertRaises(QueryBudgetExceeded):
+            func()
+
+    def test_query_budget(self):
+        @query_budget(max_queries=1, max_query_time_ms=5)
+        def func():
+            pass
+
+        self.assertEqual(func.max_queries, 1)
+        self.assertEqual(func.max_query_time_ms, 5)
+
+
+class TestSQLAlchemyTracer(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.exporter = InMemorySpanExporter()
+        self.tracer = SQLAlchemyTracer(exporter=self.exporter)
+        self.tracer.start()
+
+    def tearDown(self):
+        self.tracer.stop()
+        super().tearDown()
+
+    def test_span_hierarchy(self):
+        with db.atomic():
+            db.add(Owner(first_name="foo", last_name="bar"))
+
+        spans = {span.name: span for span in self.exporter.spans}
+        transaction, flush, insert = spans["transaction"], spans["flush"], spans["INSERT test"]
+
+        self.assertIsNone(transaction.parent_id)
+        self.assertEqual(flush.parent_id, transaction.span_id)
+        self.assertEqual(insert.parent_id, flush.span_id)
+        self.assertEqual({span.trace_id for span in self.exporter.spans}, {transaction.trace_id})
+        self.assertEqual(flush.attributes["db.sorcery.new"], 1)
+        self.assertEqual(insert.kind, "CLIENT")
+        self.assertEqual(insert.attributes["db.system"], "postgresql")
+        self.assertEqual(insert.attributes["db.name"], "test")
+        self.assertEqual(insert.attributes["db.operation"], "INSERT")
+        self.assertEqual(insert.attributes["db.sorcery.alias"], "test")
+        self.assertTrue(insert.attributes["db.statement"].startswith("INSERT INTO owner"))
+        self.assertGreaterEqual(transaction.duration, insert.duration)
+        self.assertEqual(self.tracer.stack, [])
+
+    def test_middleware(self):
+        middleware = SQLAlchemyMiddleware(get_response)
+
+        middleware(RequestFactory().get("/?q=1"))
+
+        root = self.exporter.spans[-1]
+        self.assertEqual(root.name, "HTTP GET")
+        self.assertEqual(root.kind, "SERVER")
+        self.assertEqual(root.attributes, {"http.method": "GET", "http.target": "/?q=1", "http.status_code": 200})
+        self.assertTrue(all(span.trace_id == root.trace_id for span in self.exporter.spans))
+        self.assertEqual([span.name for span in self.exporter.spans if span.parent_id == root.span_id], ["flush"])
+
+    def test_flush_failure(self):
+        db.add(Owner(first_name="foo", last_name="bar"))
+        db.add(Owner(id=1, first_name="foo", last_name="bar"))
+        db.flush()
+        db.expunge_all()
+
+        with self.assertRaises(sa.exc.IntegrityError):
+            with db.atomic():
+                db.add(Owner(id=1, first_name="foo", last_name="bar"))
+
+        spans = {span.name: span for span in self.exporter.spans}
+        self.assertEqual(spans["transaction"].status, "ERROR")
+        self.assertEqual(spans["transaction"].attributes["exception.type"], "IntegrityError")
+        self.assertEqual(spans["flush"].status, "ERROR")
+        self.assertEqual(spans["INSERT test"].status, "ERROR")
+        self.assertEqual(self.tracer.stack, [])
+
+    def test_begin_failure(self):
+        with mock.patch.object(db, "begin", side_effect=ValueError):
+            with self.assertRaises(ValueError):
+                with db.atomic():
+                    pass
+
+        self.assertEqual(self.exporter.spans, [])
+        self.assertEqual(self.tracer.stack, [])
+
+    def test_executemany(self):
+        db.add_all([Owner(id=1, first_name="foo", last_name="bar"), Owner(id=2, first_name="bar", last_name="foo")])
+        db.flush()
+
+        spans = {span.name: span for span in self.exporter.spans}
+        self.assertEqual(spans["INSERT test"].attributes["db.sorcery.executemany"], 2)
+
+    def test_middleware_no_response(self):
+        request = RequestFactory().get("/")
+
+        signals.after_middleware_response.send(None, request=request, response=HttpResponse())
+        self.assertEqual(self.exporter.spans, [])
+
+        signals.before_middleware_request.send(None, request=request)
+        signals.before_middleware_request.send(None, request=request)
+        signals.after_middleware_response.send(None, request=request, response=HttpResponse(status=500))
+
+        self.assertEqual(
+            [(span.status, span.status_description) for span in self.exporter.spans],
+            [
+                ("ERROR", "No response"),
+                ("ERROR", None),
+            ],
+        )
+
+    def test_span(self):
+        span = self.tracer.start_span("foo")
+
+        self.assertIsNone(span.duration)
+        self.assertEqual(repr(span), "<Span 'foo' span_id={} parent_id=None>".format(span.span_id))
+
+        span.end()
+        span.end()
+
+        self.assertEqual(self.exporter.spans, [span])
+        self.exporter.clear()
+        self.assertEqual(self.exporter.spans, [])
+
+    def test_span_exporter(self):
+        exporter = SpanExporter()
+
+        with self.assertRaises(NotImplementedError):
+            exporter.export([])
+        self.assertIsNone(exporter.shutdown())
+
+    def test_context_manager(self):
+        with SQLAlchemyTracer() as tracer:
+            self.assertIs(SQLAlchemyTracer.active, tracer)
+
+        self.assertIsNone(SQLAlchemyTracer.active)
+
+    def test_unended_children(self):
+        with self.tracer.start_span("parent") as parent:
+            child = self.tracer.start_span("child")
+
+        self.assertEqual(child.status, "ERROR")
+        self.assertEqual(self.exporter.spans, [child, parent])
+
+    def test_start_active_span(self):
+        self.tracer.stop()
+        self.assertIsNone(SQLAlchemyTracer.start_active_span("foo"))
+
+        self.tracer.start()
+        with SQLAlchemyTracer.start_active_span("foo", attributes={"bar": 1}) as span:
+            pass
+        self.assertEqual(self.exporter.spans, [span])
+        self.assertEqual(span.attributes, {"bar": 1})
+
+    def test_json_file_exporter(self):
+        with tempfile.NamedTemporaryFile(suffix=".json") as f:
+            self.tracer.exporter = JSONFileSpanExporter(f.name)
+
+            with self.tracer.start_span("parent"):
+                with self.tracer.start_span("child"):
+                    pass
+
+            spans = [json.loads(line) for line in open(f.name)]
+
+        self.assertEqual([span["name"] for span in spans], ["child", "parent"])
+        self.assertEqual(spans[0]["parent_id"], spans[1]["span_id"])
+        self.assertEqual(spans[1]["status"], {"status_code": "UNSET", "description": None})
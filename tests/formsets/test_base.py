@@ -1,9 +1,11 @@
-from django.core.exceptions import ImproperlyConfigured
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django_sorcery.db.profiler import SQLAlchemyProfiler
 from django_sorcery.forms import ALL_FIELDS
 from django_sorcery.formsets import modelformset_factory
+from django_sorcery.validators import ValidateUnique
 
-from ..base import TestCase
-from ..testapp.models import Owner, db
+from ..base import TestCase, mock
+from ..testapp.models import Owner, ValidateUniqueModel, db
 
 
 class TestModelFormSet(TestCase):
@@ -25,6 +27,39 @@ class TestModelFormSet(TestCase):
         self.assertEqual(formset.model, Owner)
         self.assertEqual(formset.session, db)
 
+    def test_constant_queries(self):
+        formset_class = modelformset_factory(Owner, fields=("first_name", "last_name"), session=db)
+
+        for count in (0, 4, 20):
+            db.add_all([Owner(first_name="Test", last_name="Owner") for _ in range(count)])
+            db.flush()
+            db.expire_all()
+
+            with SQLAlchemyProfiler() as profiler:
+                formset = formset_class()
+                formset.as_p()
+
+            self.assertEqual(profiler.counts["select"], 1)
+
+            data = {"form-TOTAL_FORMS": len(formset.initial_forms), "form-INITIAL_FORMS": len(formset.initial_forms)}
+            for i, form in enumerate(formset.initial_forms):
+                data.update({f"form-{i}-id": form.instance.id, f"form-{i}-first_name": "Bound"})
+            db.expire_all()
+
+            with SQLAlchemyProfiler() as profiler:
+                formset = formset_class(data=data)
+                self.assertTrue(formset.is_valid())
+                formset.as_p()
+
+            self.assertEqual(profiler.counts["select"], 1)
+
+    def test_iterable_queryset(self):
+        formset_class = modelformset_factory(Owner, fields=("first_name", "last_name"), session=db)
+
+        formset = formset_class(queryset=(o for o in self.owners))
+
+        self.assertEqual([f.instance for f in formset.initial_forms], self.owners)
+
     def test_render(self):
         formset_class = modelformset_factory(Owner, fields=("first_name", "last_name"), session=db)
         query = Owner.query
@@ -140,6 +175,87 @@ class TestModelFormSet(TestCase):
                 self.assertEqual(owner.first_name, "New first name")
                 self.assertEqual(owner.last_name, "New last name")
 
+    def test_bulk_edit(self):
+        formset_class = modelformset_factory(
+            Owner, fields=("first_name", "last_name"), session=db, can_delete=True, bulk=True
+        )
+        data = {"form-TOTAL_FORMS": "6", "form-INITIAL_FORMS": "4"}
+        for i, owner in enumerate(self.owners):
+            data.update({f"form-{i}-id": owner.id, f"form-{i}-first_name": f"Edited {i}"})
+        data.update({"form-3-DELETE": "on", "form-4-first_name": "New", "form-5-first_name": "New"})
+
+        formset = formset_class(queryset=Owner.query.order_by(Owner.id), data=data)
+        self.assertTrue(formset.is_valid())
+
+        with SQLAlchemyProfiler() as profiler, mock.patch.object(Owner, "full_clean", autospec=True) as full_clean:
+            instances = formset.save()
+
+        full_clean.assert_not_called()
+        self.assertEqual(db.info["django_sorcery:validated"], {})
+        self.assertEqual(profiler.counts["update"], 1)
+        self.assertEqual(profiler.counts["delete"], 1)
+        self.assertEqual(len(instances), 5)
+        self.assertEqual(formset.deleted_objects, self.owners[3:])
+        self.assertEqual(len(formset.new_objects), 2)
+        self.assertEqual([o.first_name for o in self.owners[:3]], ["Edited 0", "Edited 1", "Edited 2"])
+        self.assertEqual(Owner.query.filter(Owner.first_name == "New").count(), 2)
+
+    def test_bulk_changed_after_validation(self):
+        formset_class = modelformset_factory(Owner, fields=("first_name", "last_name"), session=db, bulk=True, extra=0)
+        data = {"form-TOTAL_FORMS": "2", "form-INITIAL_FORMS": "2"}
+        for i, owner in enumerate(self.owners[:2]):
+            data.update({f"form-{i}-id": owner.id, f"form-{i}-first_name": f"Edited {i}"})
+        formset = formset_class(queryset=Owner.query.order_by(Owner.id)[:2], data=data)
+        self.assertTrue(formset.is_valid())
+
+        formset.forms[1].instance.first_name = "invalid"
+        with mock.patch.object(
+            Owner, "full_clean", autospec=True, side_effect=ValidationError("invalid")
+        ) as full_clean:
+            with self.assertRaises(ValidationError):
+                formset.save()
+
+        full_clean.assert_called_once_with(self.owners[1])
+        self.assertEqual(db.info["django_sorcery:validated"], {})
+
+    def test_bulk_errors(self):
+        data = {"form-TOTAL_FORMS": "3", "form-INITIAL_FORMS": "2"}
+        for i, owner in enumerate(self.owners[:2]):
+            data.update({f"form-{i}-id": owner.id, f"form-{i}-first_name": "valid"})
+        data.update({"form-1-first_name": "invalid", "form-2-first_name": "invalid"})
+
+        errors = []
+        for bulk in (False, True):
+            formset_class = modelformset_factory(Owner, fields=("first_name", "last_name"), session=db, bulk=bulk)
+            formset = formset_class(queryset=Owner.query.order_by(Owner.id)[:2], data=data)
+            self.assertFalse(formset.is_valid())
+            errors.append(formset.errors)
+
+        self.assertEqual(errors[0], errors[1])
+        invalid = {"first_name": ["Invalid first name"]}
+        self.assertEqual(errors[1], [{}, invalid, invalid])
+
+    def test_bulk_batch_validators(self):
+        validators = [ValidateUnique(db, "name", batch=True)]
+        patcher = mock.patch.object(ValidateUniqueModel, "validators", validators)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        db.add(ValidateUniqueModel(name="existing"))
+        db.flush()
+
+        formset_class = modelformset_factory(ValidateUniqueModel, fields=("name",), session=db, bulk=True, extra=0)
+        names = ["name {}".format(i) for i in range(10)] + ["existing", "duplicate", "duplicate"]
+        data = {"form-TOTAL_FORMS": len(names), "form-INITIAL_FORMS": "0"}
+        data.update({f"form-{i}-name": name for i, name in enumerate(names)})
+        formset = formset_class(queryset=[], data=data)
+
+        with SQLAlchemyProfiler() as profiler:
+            self.assertFalse(formset.is_valid())
+
+        self.assertEqual(profiler.counts["select"], 1)
+        self.assertEqual([i for i, errors in enumerate(formset.errors) if errors], [10, 11, 12])
+        self.assertEqual(validators[0].local.__dict__.get("results"), None)
+
     def test_edit_new_delete_ignore(self):
         formset_class = modelformset_factory(Owner, fields=("first_name", "last_name"), session=db, can_delete=True)
 
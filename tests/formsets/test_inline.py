@@ -111,6 +111,25 @@ class TestInlineFormSet(TestCase):
         self.assertEqual(values[2].owner, self.owner)
         self.assertEqual(values[2].type, VehicleType.car)
 
+    def test_inline_form_create_bulk(self):
+        formset_class = inlineformset_factory(relation=Owner.vehicles, fields=("type",), session=db, bulk=True)
+        data = {
+            "vehicles-TOTAL_FORMS": "2",
+            "vehicles-INITIAL_FORMS": "0",
+            "vehicles-0-type": "car",
+            "vehicles-1-type": "bus",
+        }
+        formset = formset_class(instance=self.owner, data=data)
+
+        self.assertTrue(formset.bulk)
+        self.assertTrue(formset.is_valid())
+
+        values = formset.save(flush=True)
+
+        self.assertEqual([v.type for v in values], [VehicleType.car, VehicleType.bus])
+        self.assertEqual(self.owner.vehicles, values)
+        self.assertTrue(all(v.id for v in values))
+
     def test_inline_form_update_render(self):
         self.owner.vehicles = [Vehicle(type=VehicleType.car), Vehicle(type=VehicleType.bus)]
         db.flush()
@@ -0,0 +1,36 @@
+import six
+
+from django.test import TestCase
+from django_sorcery.db import meta
+from django_sorcery.management.commands.sorcery_warmup import Command
+
+from ...base import mock
+from ...testapp.models import Owner, Vehicle, db
+
+
+class TestWarmup(TestCase):
+    def test(self):
+        out = six.StringIO()
+        cmd = Command(stdout=out)
+        with mock.patch.dict(meta.model_info._registry, clear=True):
+            cmd.run_from_argv(["./manage.py sorcery", "warmup", "-d", db.alias, "--profile", "--parallel", "--no-color"])
+
+        out.seek(0)
+        lines = out.readlines()
+
+        models = [m for m in db.models_registry if hasattr(m, "__mapper__")]
+        self.assertEqual(len(lines), len(models) + 1)
+        self.assertTrue(any(line.endswith(" tests_testapp.Owner\n") for line in lines))
+        self.assertTrue(lines[-1].startswith("Built metadata for {} models in ".format(len(models))))
+
+    def test_without_profile(self):
+        out = six.StringIO()
+        cmd = Command(stdout=out)
+        cmd.run_from_argv(["./manage.py sorcery", "warmup", "--no-color"])
+
+        out.seek(0)
+        lines = out.readlines()
+
+        self.assertEqual(len(lines), 1)
+        self.assertIn(Owner, db.models_registry)
+        self.assertIn(Vehicle, db.models_registry)
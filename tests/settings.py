@@ -103,6 +103,9 @@ SECRET_KEY = "secret"
 
 ALLOWED_HOSTS = ["*"]
 
+# the pytest plugin is disabled in addopts so exceeded query budgets are made to raise here
+DJANGO_SORCERY = {"raise_on_query_budget": True}
+
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
@@ -0,0 +1,22 @@
+from django.apps import apps
+from django.test import override_settings
+
+from .base import TestCase, mock
+
+
+class TestSorceryConfig(TestCase):
+    @mock.patch("django_sorcery.db.meta.warmup")
+    def test_ready(self, warmup):
+        config = apps.get_app_config("django_sorcery")
+
+        config.ready()
+        warmup.assert_not_called()
+
+        with override_settings(DJANGO_SORCERY={"warmup": True}):
+            config.ready()
+        warmup.assert_called_once_with(parallel=False)
+
+        warmup.reset_mock()
+        with override_settings(DJANGO_SORCERY={"warmup": {"parallel": True}}):
+            config.ready()
+        warmup.assert_called_once_with(parallel=True)
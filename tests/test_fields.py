@@ -2,12 +2,15 @@ import json
 
 from django.core.exceptions import ValidationError
 from django_sorcery import fields
+from django_sorcery.db import signals
+from django_sorcery.db.models import get_choices_cache
+from django_sorcery.db.profiler import SQLAlchemyProfiler
 from django_sorcery.forms import (
     apply_limit_choices_to_form_field,
     modelform_factory,
 )
 
-from .base import TestCase
+from .base import TestCase, mock
 from .testapp.models import CompositePkModel, Owner, Vehicle, VehicleType, db
 
 
@@ -111,6 +114,39 @@ class TestModelChoiceField(TestCase):
         field = fields.ModelChoiceField(Owner, db, required=True, initial=1)
         self.assertListEqual(list(field.choices), [(owner.id, str(owner)) for owner in Owner.query])
 
+    def test_choices_loaded_once(self):
+        field = fields.ModelChoiceField(Owner, db)
+        choices = field.choices
+
+        with SQLAlchemyProfiler() as profiler:
+            self.assertEqual(len(choices), 11)
+            self.assertEqual(len(list(choices)), 11)
+
+        self.assertEqual(profiler.counts["select"], 1)
+
+    def test_cached_choices(self):
+        get_choices_cache().clear()
+        self.addCleanup(get_choices_cache().clear)
+        expected = list(fields.ModelChoiceField(Owner, db).choices)
+
+        with SQLAlchemyProfiler() as profiler:
+            self.assertEqual(list(fields.ModelChoiceField(Owner, db, cache_timeout=60).choices), expected)
+            field = fields.ModelChoiceField(Owner, db, cache_timeout=60)
+            self.assertEqual(list(field.choices), expected)
+            self.assertEqual(len(field.choices), len(expected))
+
+        self.assertEqual(profiler.counts["select"], 1)
+
+        owner = Owner(first_name="new", last_name="owner")
+        db.add(owner)
+        db.flush()
+        signals.after_commit.send(mock.Mock(models_committed={owner}, models_deleted=set(), info={}))
+
+        with SQLAlchemyProfiler() as profiler:
+            self.assertEqual(sorted(list(field.choices)[1:]), sorted(expected[1:] + [(owner.id, str(owner))]))
+
+        self.assertEqual(profiler.counts["select"], 1)
+
     def test_get_object(self):
         owner = Owner.objects.first()
 
@@ -191,6 +227,36 @@ class TestModelChoiceField(TestCase):
             str(bf), '<select name="owner" id="id_owner"><option value="" selected>---------</option></select>'
         )
 
+    def test_search_url(self):
+        owner = Owner.objects.first()
+        field = fields.ModelChoiceField(Owner, db, search_url="/search/")
+        widget = field.widget
+
+        self.assertIsInstance(widget, fields.SearchSelect)
+
+        widget.choices = field.choices
+        with SQLAlchemyProfiler() as profiler:
+            html = widget.render("owner", owner.id)
+
+        self.assertEqual(profiler.counts["select"], 1)
+        self.assertHTMLEqual(
+            html,
+            '<select name="owner" data-search-url="/search/">'
+            '<option value="">---------</option>'
+            '<option value="{}" selected>{}</option>'
+            "</select>".format(owner.id, owner),
+        )
+
+        with SQLAlchemyProfiler() as profiler:
+            html = widget.render("owner", "abc")
+
+        self.assertHTMLEqual(
+            html, '<select name="owner" data-search-url="/search/"><option value="">---------</option></select>'
+        )
+
+        self.assertEqual(profiler.counts["select"], 0)
+        self.assertEqual(field.to_python(str(owner.id)), owner)
+
 
 class TestModelMultipleChoiceField(TestCase):
     def setUp(self):
@@ -206,6 +272,43 @@ class TestModelMultipleChoiceField(TestCase):
 
         self.assertEqual(field.to_python([owner1.id, owner2.id, owner3.id]), [owner1, owner2, owner3])
 
+    def test_to_python_batched(self):
+        field = fields.ModelMultipleChoiceField(Owner, db)
+        owners = Owner.objects.order_by(Owner.id.desc()).all()
+        values = [str(o.id) for o in owners] + [str(owners[0].id)]
+
+        with SQLAlchemyProfiler() as profiler:
+            self.assertEqual(field.to_python(values), owners + owners[:1])
+
+        self.assertEqual(profiler.counts["select"], 1)
+
+    def test_to_python_missing(self):
+        field = fields.ModelMultipleChoiceField(Owner, db)
+        owner = Owner.objects.first()
+
+        for value in (0, "abc", "[1, 2]"):
+            with self.assertRaises(ValidationError) as ctx:
+                field.to_python([owner.id, value])
+
+            self.assertEqual(ctx.exception.code, "invalid_choice")
+            self.assertEqual(ctx.exception.params, {"value": value})
+
+    def test_to_python_composite_pk(self):
+        instances = [CompositePkModel(id=1, pk=2), CompositePkModel(id=2, pk=1)]
+        db.add_all(instances)
+        db.flush()
+
+        field = fields.ModelMultipleChoiceField(CompositePkModel, db)
+        values = [json.dumps(field.prepare_instance_value(i)) for i in reversed(instances)]
+
+        with SQLAlchemyProfiler() as profiler:
+            self.assertEqual(field.to_python(values), instances[::-1])
+
+        self.assertEqual(profiler.counts["select"], 1)
+
+        with self.assertRaises(ValidationError):
+            field.to_python(values + [json.dumps({"id": 1, "pk": 1})])
+
     def test_prepare_value(self):
         field = fields.ModelMultipleChoiceField(Owner, db)
         owner1, owner2, owner3 = Owner.objects[:3]
@@ -213,3 +316,23 @@ class TestModelMultipleChoiceField(TestCase):
         self.assertIsNone(field.prepare_value(None))
 
         self.assertEqual(field.prepare_value([owner1, owner2, owner3]), [owner1.id, owner2.id, owner3.id])
+
+    def test_search_url(self):
+        owner1, owner2, owner3 = Owner.objects[:3]
+        field = fields.ModelMultipleChoiceField(Owner, db, search_url="/search/")
+        widget = field.widget
+        widget.choices = field.choices
+
+        self.assertIsInstance(widget, fields.SearchSelectMultiple)
+
+        with SQLAlchemyProfiler() as profiler:
+            html = widget.render("owners", [owner3.id, owner1.id, 0])
+
+        self.assertEqual(profiler.counts["select"], 1)
+        self.assertHTMLEqual(
+            html,
+            '<select name="owners" data-search-url="/search/" multiple>'
+            '<option value="{}" selected>{}</option>'
+            '<option value="{}" selected>{}</option>'
+            "</select>".format(owner3.id, owner3, owner1.id, owner1),
+        )
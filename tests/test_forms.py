@@ -1,9 +1,13 @@
+from collections import OrderedDict
+
 from django import forms as djangoforms
 from django.core.exceptions import ImproperlyConfigured, ValidationError
 from django.forms import fields as djangofields
 from django_sorcery import fields as sorceryfields, forms
+from django_sorcery.db import meta
+from django_sorcery.db.profiler import SQLAlchemyProfiler
 
-from .base import TestCase
+from .base import TestCase, mock
 from .testapp.models import (
     ClassicModel,
     ModelFullCleanFail,
@@ -199,6 +203,87 @@ class TestModelToDict(TestCase):
             forms.model_to_dict(vehicle, fields=["name", "is_used", "paint"]),
         )
 
+    def test_model_to_dict_persistent(self):
+        vehicle = Vehicle(
+            name="vehicle",
+            owner=Owner(first_name="first_name", last_name="last_name"),
+            type=VehicleType.car,
+            options=[Option(name="option 1"), Option(name="option 2")],
+            parts=[Part(name="part 1")],
+        )
+        owner = vehicle.owner
+        db.add_all([vehicle, Vehicle(name="other", type=VehicleType.bus, owner=owner)])
+        db.flush()
+        db.expire_all()
+
+        with SQLAlchemyProfiler() as profiler:
+            data = forms.model_to_dict(vehicle)
+            owner_data = forms.model_to_dict(owner)
+
+        # vehicle refresh, options, parts, owner refresh and owner vehicles, no related objects are loaded
+        self.assertEqual(profiler.counts["select"], 5)
+        self.assertNotIn("owner", vehicle.__dict__)
+        self.assertNotIn("options", vehicle.__dict__)
+
+        self.assertEqual(vehicle.owner, owner)
+        self.assertEqual(len(vehicle.parts), 1)
+        self.assertEqual(len(owner.vehicles), 2)
+        self.assertEqual(data["owner"], owner.id)
+        self.assertEqual(data, forms.model_to_dict(vehicle))
+        self.assertEqual(sorted(data["options"]), sorted(o.id for o in vehicle.options))
+        self.assertEqual(owner_data, forms.model_to_dict(owner))
+        self.assertEqual(len(owner_data["vehicles"]), 2)
+
+    def test_model_to_dict_persistent_empty(self):
+        vehicle = Vehicle(name="vehicle", type=VehicleType.car)
+        db.add(vehicle)
+        db.flush()
+        db.expire_all()
+
+        self.assertEqual(
+            forms.model_to_dict(vehicle, fields=["owner", "options", "parts"]),
+            forms.model_to_dict(Vehicle(), fields=["owner", "options", "parts"]),
+        )
+
+    def test_related_primary_keys_partial_join(self):
+        owner = Owner(first_name="first_name", last_name="last_name")
+        vehicle = Vehicle(name="vehicle", type=VehicleType.car, owner=owner)
+        db.add(vehicle)
+        db.flush()
+        db.expire_all()
+        rel = meta.model_info(Vehicle).relationships["owner"]
+
+        with mock.patch.object(Vehicle.owner.property, "remote_side", set(Owner.__table__.columns)):
+            with SQLAlchemyProfiler() as profiler:
+                self.assertEqual(forms._get_related_primary_keys(vehicle, rel, meta.model_info(Owner)), [owner.id])
+
+        self.assertNotIn("owner", vehicle.__dict__)
+        self.assertTrue(any("FROM owner" in q.statement for q in profiler.queries))
+
+    def test_related_primary_keys_ordered(self):
+        owner = Owner(first_name="first_name", last_name="last_name")
+        vehicles = [Vehicle(name="vehicle {}".format(i), type=VehicleType.car, owner=owner) for i in range(3)]
+        db.add_all(vehicles)
+        db.flush()
+        rel = meta.model_info(Owner).relationships["vehicles"]
+
+        with mock.patch.object(Owner.vehicles.property, "order_by", [Vehicle.id.desc()]):
+            pks = forms._get_related_primary_keys(owner, rel, meta.model_info(Vehicle))
+
+        self.assertEqual(pks, [v.id for v in reversed(vehicles)])
+
+    def test_related_primary_keys_composite(self):
+        owner = Owner(first_name="first_name", last_name="last_name")
+        vehicle = Vehicle(name="vehicle", type=VehicleType.car, owner=owner)
+        db.add(vehicle)
+        db.flush()
+        rel = meta.model_info(Owner).relationships["vehicles"]
+        related_info = mock.Mock(primary_keys=OrderedDict([("id", None), ("name", None)]))
+
+        pks = forms._get_related_primary_keys(owner, rel, related_info)
+
+        self.assertEqual(pks, [OrderedDict([("id", vehicle.id), ("name", "vehicle")])])
+
     def test_model_to_dict_private_relation(self):
         obj = ModelTwo(pk=2, name="two", _model_one=ModelOne(pk=1, name="one"))
 
@@ -228,6 +313,112 @@ class TestModelForm(TestCase):
             ["created_at", "is_used", "msrp", "name", "options", "owner", "paint", "parts", "type"],
         )
 
+    def test_cached_modelform_factory(self):
+        forms.clear_form_class_cache()
+        self.addCleanup(forms.clear_form_class_cache)
+        widgets = {"name": djangoforms.Textarea}
+
+        form_class = forms.cached_modelform_factory(Vehicle, fields=["name", "owner"], widgets=widgets, session=db)
+
+        self.assertIs(
+            forms.cached_modelform_factory(Vehicle, fields=["name", "owner"], widgets=dict(widgets), session=db),
+            form_class,
+        )
+        self.assertIsNot(forms.cached_modelform_factory(Vehicle, fields=["name"], session=db), form_class)
+        self.assertIsNot(forms.cached_modelform_factory(Vehicle, fields=["name", "owner"]), form_class)
+        self.assertListEqual(list(form_class.base_fields), ["name", "owner"])
+
+    def test_cached_modelform_factory_bounded(self):
+        forms.clear_form_class_cache()
+        self.addCleanup(forms.clear_form_class_cache)
+
+        with self.settings(DJANGO_SORCERY={"form_class_cache_size": 1}):
+            form_class = forms.cached_modelform_factory(Vehicle, fields=["name"], session=db)
+            self.assertIs(forms.cached_modelform_factory(Vehicle, fields=["name"], session=db), form_class)
+
+            forms.cached_modelform_factory(Vehicle, fields=["paint"], session=db)
+
+            self.assertIsNot(forms.cached_modelform_factory(Vehicle, fields=["name"], session=db), form_class)
+
+    def test_cached_modelform_factory_sets(self):
+        forms.clear_form_class_cache()
+        self.addCleanup(forms.clear_form_class_cache)
+
+        form_class = forms.cached_modelform_factory(Vehicle, exclude={"paint", "msrp"}, session=db)
+
+        self.assertIs(forms.cached_modelform_factory(Vehicle, exclude={"msrp", "paint"}, session=db), form_class)
+        self.assertNotIn("paint", form_class.base_fields)
+
+    def test_cached_modelform_factory_unhashable(self):
+        forms.clear_form_class_cache()
+        self.addCleanup(forms.clear_form_class_cache)
+
+        class UnhashableWidget(djangoforms.TextInput):
+            __hash__ = None
+
+        widgets = {"name": UnhashableWidget()}
+        form_class = forms.cached_modelform_factory(Vehicle, fields=["name"], widgets=widgets, session=db)
+
+        self.assertIsNot(
+            forms.cached_modelform_factory(Vehicle, fields=["name"], widgets=widgets, session=db), form_class
+        )
+        self.assertEqual(len(forms._form_classes), 0)
+
+    def test_copy_on_write_fields(self):
+        form_class = forms.modelform_factory(Vehicle, fields=forms.ALL_FIELDS, session=db)
+        base_fields = form_class.base_fields
+
+        form = form_class()
+
+        self.assertIsInstance(form.fields, forms.CopyOnWriteFields)
+        self.assertEqual(list(form.fields), list(base_fields))
+        self.assertIn("name", form.fields)
+        self.assertEqual(form.fields._copied, set())
+
+        form.fields["name"].widget.attrs["class"] = "custom"
+
+        self.assertIsNot(form.fields["name"], base_fields["name"])
+        self.assertIs(form.fields["name"], form.fields["name"])
+        self.assertNotIn("class", base_fields["name"].widget.attrs)
+        self.assertNotIn("class", form_class().fields["name"].widget.attrs)
+        self.assertEqual(form.fields._copied, {"name"})
+
+        del form.fields["name"]
+        form.fields["extra"] = djangofields.CharField()
+
+        self.assertEqual(list(form.fields)[-1], "extra")
+        self.assertNotIn("name", form.fields)
+        self.assertEqual(len(form.fields), len(base_fields))
+        self.assertEqual(dict(form.fields.items())["paint"].__class__, base_fields["paint"].__class__)
+        self.assertEqual(repr(form.fields), "CopyOnWriteFields({!r})".format(list(form.fields)))
+
+    def test_copy_on_write_fields_limit_choices_to(self):
+        form_class = forms.modelform_factory(Vehicle, fields=("owner",), session=db)
+        form_class.base_fields["owner"].limit_choices_to = [Owner.id == self.owner.id]
+        db.add(Owner(first_name="other"))
+        db.flush()
+
+        ordered_form_class = type("OrderedForm", (form_class,), {"field_order": ["owner"]})
+        ordered_form_class.base_fields["owner"].limit_choices_to = [Owner.id == self.owner.id]
+
+        for form in (form_class(), ordered_form_class()):
+            self.assertEqual(form.fields["owner"].queryset.all(), [self.owner])
+            self.assertEqual(str(form.fields["owner"].queryset).count(" = "), 1)
+
+        self.assertEqual(form_class.base_fields["owner"].queryset.count(), 2)
+
+    def test_plain_base_fields_limit_choices_to(self):
+        form_class = forms.modelform_factory(Vehicle, fields=("owner",), session=db)
+        form_class.base_fields = OrderedDict(form_class.base_fields)
+        form_class.base_fields["owner"].limit_choices_to = [Owner.id == self.owner.id]
+        db.add(Owner(first_name="other"))
+        db.flush()
+
+        form = form_class()
+
+        self.assertNotIsInstance(form.fields, forms.CopyOnWriteFields)
+        self.assertEqual(form.fields["owner"].queryset.all(), [self.owner])
+
     def test_modelform_factory_instance_validate(self):
         vehicle = Vehicle(owner=self.owner)
         form_class = forms.modelform_factory(Vehicle, fields=forms.ALL_FIELDS, session=db)
@@ -1,5 +1,6 @@
 import pytest
-from django_sorcery.pytest_plugin import sqlalchemy_profiler, transact  # noqa
+from django_sorcery.db.profiler import QueryBudget
+from django_sorcery.pytest_plugin import pytest_configure, sqlalchemy_profiler, transact  # noqa
 from django_sorcery.testing import CommitException
 
 from .testapp.models import Business, Owner, db
@@ -48,3 +49,11 @@ def test_transact(transact):  # noqa
     transact.stop()
 
     assert Owner.objects.count() == 0
+
+
+def test_configure(monkeypatch):
+    monkeypatch.setattr(QueryBudget, "testing", False)
+
+    pytest_configure(None)
+
+    assert QueryBudget.testing
@@ -0,0 +1,111 @@
+import datetime
+import json
+from decimal import Decimal
+
+from django_sorcery import serializers
+
+from .base import TestCase, mock
+from .testapp.models import Address, Business, Owner, States, Vehicle, VehicleType, db
+
+
+class TestSorceryJSONEncoder(TestCase):
+    def test_encode(self):
+        encoder = serializers.SorceryJSONEncoder()
+
+        self.assertEqual(
+            json.loads(
+                encoder.encode(
+                    {
+                        "date": datetime.date(2020, 1, 2),
+                        "datetime": datetime.datetime(2020, 1, 2, 3, 4, 5),
+                        "decimal": Decimal("1.10"),
+                        "enum": VehicleType.car,
+                        "composite": Address(street="street", state=States.NY, zip="123"),
+                    }
+                )
+            ),
+            {
+                "date": "2020-01-02",
+                "datetime": "2020-01-02T03:04:05",
+                "decimal": "1.10",
+                "enum": "car",
+                "composite": {"street": "street", "state": "NY", "zip": "123"},
+            },
+        )
+
+
+class TestStreamJSON(TestCase):
+    def test_stream_json(self):
+        owner = Owner(first_name="first", last_name="last")
+        vehicles = [
+            Vehicle(name="vehicle {}".format(i), type=VehicleType.bus, msrp=Decimal("1.5"), owner=owner)
+            for i in range(5)
+        ]
+
+        chunks = list(serializers.stream_json(iter(vehicles), Vehicle.owner, chunk_size=2))
+
+        self.assertEqual(len(chunks), 3)
+        data = json.loads("".join(chunks))
+        self.assertEqual([v["name"] for v in data], ["vehicle {}".format(i) for i in range(5)])
+        self.assertEqual(data[0]["type"], "bus")
+        self.assertEqual(data[0]["msrp"], "1.5")
+        self.assertEqual(data[0]["owner"], {"id": None, "first_name": "first", "last_name": "last"})
+
+    def test_stream_json_none(self):
+        owner = Owner(first_name="first", last_name="last")
+
+        data = json.loads("".join(serializers.stream_json([owner, None], chunk_size=1)))
+
+        self.assertEqual(data, [{"id": None, "first_name": "first", "last_name": "last"}, None])
+
+    def test_stream_json_empty(self):
+        self.assertEqual(list(serializers.stream_json([])), ["[]"])
+
+    def test_stream_json_composites(self):
+        business = Business(name="business", location=Address(street="street", state=States.NY, zip="123"))
+
+        data = json.loads("".join(serializers.stream_json([business])))
+
+        self.assertEqual(
+            data,
+            [
+                {
+                    "id": None,
+                    "name": "business",
+                    "employees": 5,
+                    "location": {"street": "street", "state": "NY", "zip": "123"},
+                    "other_location": None,
+                }
+            ],
+        )
+
+
+class TestStreamingJSONResponse(TestCase):
+    def test_response(self):
+        db.add_all([Owner(first_name="first {}".format(i), last_name="last") for i in range(3)])
+        db.flush()
+
+        response = serializers.StreamingJSONResponse(Owner.objects.order_by(Owner.id), yield_per=2)
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/json")
+        data = json.loads(b"".join(response.streaming_content))
+        self.assertEqual([o["first_name"] for o in data], ["first 0", "first 1", "first 2"])
+
+    def test_close_session(self):
+        session = mock.MagicMock()
+        query = mock.MagicMock(session=session)
+
+        response = serializers.StreamingJSONResponse(query, close_session=True)
+        response.close()
+
+        session.close.assert_called_once_with()
+
+    def test_close_session_disabled(self):
+        session = mock.MagicMock()
+        query = mock.MagicMock(session=session)
+
+        response = serializers.StreamingJSONResponse(query)
+        response.close()
+
+        session.close.assert_not_called()
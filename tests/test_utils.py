@@ -29,3 +29,7 @@ class TestUtils(TestCase):
     def test_lower(self):
         self.assertEqual(utils.lower("HELLO"), "hello")
         self.assertEqual(utils.lower(5), 5)
+
+    def test_chunked(self):
+        self.assertEqual(list(utils.chunked([1, 2, 3, 4, 5], 2)), [[1, 2], [3, 4], [5]])
+        self.assertEqual(list(utils.chunked([], 2)), [])
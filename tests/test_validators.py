@@ -1,6 +1,8 @@
 from collections import namedtuple
 
 from django.core.exceptions import ValidationError
+from django_sorcery.db import meta
+from django_sorcery.db.profiler import SQLAlchemyProfiler
 from django_sorcery.exceptions import NestedValidationError
 from django_sorcery.validators import (
     ValidateCantRemove,
@@ -8,12 +10,14 @@ from django_sorcery.validators import (
     ValidateNotEmptyWhen,
     ValidateOnlyOneOf,
     ValidateTogetherModelFields,
+    ValidateUnique,
     ValidateValue,
     ValidationRunner,
+    depends_on,
 )
 
-from .base import TestCase
-from .testapp.models import ValidateUniqueModel, db
+from .base import TestCase, mock
+from .testapp.models import Owner, ValidateUniqueModel, db
 
 
 class TestValidatorRunner(TestCase):
@@ -51,6 +55,27 @@ Node = namedtuple("Node", ["left", "right", "value"])
 Node.__new__.__defaults__ = (None, None, None)
 
 
+class TestDependsOn(TestCase):
+    def test_depends_on(self):
+        @depends_on("first_name")
+        def validator(m):
+            raise ValidationError("invalid")
+
+        self.assertEqual(validator.depends_on, ("first_name",))
+        self.assertEqual(ValidateTogetherModelFields(["left", "right"]).depends_on, ["left", "right"])
+        self.assertEqual(ValidateOnlyOneOf(["left", "right"]).depends_on, ["left", "right"])
+        self.assertEqual(ValidateCantRemove("left").depends_on, ("left",))
+        self.assertIsNone(ValidateValue("left", bool).depends_on)
+
+        instance = Owner()
+        instance.validators = [validator]
+        info = meta.model_info(Owner)
+
+        info.run_validators(instance, exclude=["first_name"])
+        with self.assertRaises(ValidationError):
+            info.run_validators(instance, exclude=["last_name"])
+
+
 class TestValidateTogetherModelFields(TestCase):
     def test_success_all_none(self):
         node = Node()
@@ -100,6 +125,89 @@ class TestValidateUnique(TestCase):
         db.flush()
 
 
+class TestValidateUniqueBatch(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.validators = [ValidateUnique(db, "name", batch=True), ValidateUnique(db, "foo", "bar", batch=True)]
+        patcher = mock.patch.object(ValidateUniqueModel, "validators", self.validators)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_batch(self):
+        db.add_all([ValidateUniqueModel(name="name {}".format(i), foo="foo", bar=str(i)) for i in range(10)])
+
+        with SQLAlchemyProfiler() as profiler:
+            db.flush()
+
+        self.assertEqual(profiler.counts["select"], 2)
+        self.assertEqual([v.local.__dict__.get("results") for v in self.validators], [None, None])
+
+    def test_batch_existing(self):
+        db.add(ValidateUniqueModel(name="name", foo="foo", bar="bar"))
+        db.flush()
+
+        db.add(ValidateUniqueModel(name="name", foo="foo", bar="other"))
+        with self.assertRaises(ValidationError) as ctx:
+            db.flush()
+
+        self.assertEqual(ctx.exception.message_dict, {"__all__": ["name must make a unique set."]})
+
+    def test_batch_persistent(self):
+        model = ValidateUniqueModel(name="name", foo="foo", bar="bar")
+        db.add(model)
+        db.flush()
+
+        model.foo = "other"
+        db.add(ValidateUniqueModel(name="other", foo="foo", bar="other"))
+        with SQLAlchemyProfiler() as profiler:
+            db.flush()
+
+        self.assertEqual(profiler.counts["select"], 2)
+
+    def test_batch_cleaned_values(self):
+        db.add(ValidateUniqueModel(name="foo", foo="foo", bar="bar"))
+        db.flush()
+
+        db.add(ValidateUniqueModel(name="foo ", foo="foo", bar="other"))
+        with self.assertRaises(ValidationError) as ctx:
+            db.flush()
+
+        self.assertEqual(ctx.exception.message_dict, {"__all__": ["name must make a unique set."]})
+
+    def test_batch_duplicates(self):
+        models = [ValidateUniqueModel(name="name", foo="foo", bar=str(i)) for i in range(2)]
+        validator = self.validators[0]
+
+        validator.validate_batch(models)
+
+        for model in models:
+            with self.assertRaises(ValidationError):
+                validator(model)
+        self.assertEqual(validator.local.results, {})
+
+    def test_batch_invalid_values(self):
+        model = ValidateUniqueModel(name="name", foo="foo", bar="bar")
+        validator = self.validators[0]
+
+        with mock.patch.object(validator, "_to_python", side_effect=ValidationError("invalid")):
+            validator.validate_batch([model])
+
+        self.assertEqual(validator.local.results, {})
+        with SQLAlchemyProfiler() as profiler:
+            validator(model)
+        self.assertEqual(profiler.counts["select"], 1)
+
+    def test_batch_none_values(self):
+        db.add(ValidateUniqueModel(name="name"))
+        db.flush()
+
+        db.add(ValidateUniqueModel(name="other"))
+        with self.assertRaises(ValidationError) as ctx:
+            db.flush()
+
+        self.assertEqual(ctx.exception.message_dict, {"__all__": ["bar, foo must make a unique set."]})
+
+
 class TestValidateValue(TestCase):
     def setUp(self):
         super().setUp()
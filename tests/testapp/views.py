@@ -2,7 +2,7 @@ from django.urls import reverse_lazy
 from django_sorcery import forms, views, viewsets
 from django_sorcery.routers import action
 
-from .models import Owner, Vehicle, db
+from .models import CompositePkModel, Owner, Vehicle, db
 
 
 class OwnerListView(views.ListView):
@@ -96,6 +96,18 @@ class OwnerDeleteView(views.DeleteView):
     success_url = reverse_lazy("owners_list")
 
 
+class OwnerSearchView(views.SearchView):
+    queryset = Owner.query
+    search_fields = ("first_name", "last_name")
+    paginate_by = 2
+
+
+class CompositePkSearchView(views.SearchView):
+    model = CompositePkModel
+    session = db
+    search_fields = ("name",)
+
+
 class OwnerViewSet(viewsets.ModelViewSet):
     model = Owner
 
@@ -55,5 +55,8 @@ urlpatterns = [
     re_path(r"^edit/vehicles/create/$", views.VehicleCreateView.as_view(), name="vehicle_create"),
     # delete views
     re_path(r"^delete/owners/(?P<id>[0-9]+)/$", views.OwnerDeleteView.as_view(), name="owner_delete"),
+    # search views
+    re_path(r"^search/owners/$", views.OwnerSearchView.as_view(), name="owners_search"),
+    re_path(r"^search/composite/$", views.CompositePkSearchView.as_view(), name="composite_search"),
     re_path(r"^viewsets/", include(router.urls)),
 ]
@@ -1,6 +1,12 @@
 import sqlalchemy as sa
 from django.core.exceptions import ImproperlyConfigured
-from django.test import TestCase
+from django.http import HttpResponse
+from django.template import engines
+from django.template.response import TemplateResponse
+from django.test import RequestFactory, TestCase
+from django.views.generic.base import View
+from django_sorcery.db.profiler import query_budget
+from django_sorcery.exceptions import QueryBudgetExceeded
 from django_sorcery.views.base import SQLAlchemyMixin
 
 from ..testapp.models import ClassicModel, Owner, db
@@ -103,3 +109,76 @@ class TestBaseView(TestCase):
         view.get_session()
 
         self.assertEqual(view.session, db)
+
+
+class TestQueryBudget(TestCase):
+    def test_no_budget(self):
+        class DummyView(SQLAlchemyMixin, View):
+            model = Owner
+
+            def get(self, request, *args, **kwargs):
+                Owner.objects.all()
+                return HttpResponse()
+
+        view = DummyView()
+        view.setup(RequestFactory().get("/"))
+
+        self.assertIsNone(view.get_query_budget())
+        self.assertEqual(view.dispatch(view.request).status_code, 200)
+
+    def test_view_budget(self):
+        class DummyView(SQLAlchemyMixin, View):
+            model = Owner
+            max_queries = 1
+            max_query_time_ms = 60000
+
+            def get(self, request, *args, **kwargs):
+                Owner.objects.all()
+                return HttpResponse()
+
+        response = DummyView.as_view()(RequestFactory().get("/"))
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_view_budget_exceeded(self):
+        class DummyView(SQLAlchemyMixin, View):
+            model = Owner
+            max_queries = 1
+
+            def get(self, request, *args, **kwargs):
+                Owner.objects.all()
+                Owner.objects.all()
+                return HttpResponse()
+
+        with self.assertRaises(QueryBudgetExceeded) as ctx:
+            DummyView.as_view()(RequestFactory().get("/"))
+
+        self.assertIn("DummyView.get", str(ctx.exception))
+
+    def test_template_response_budget(self):
+        class DummyView(SQLAlchemyMixin, View):
+            model = Owner
+            max_queries = 0
+
+            def get(self, request, *args, **kwargs):
+                template = engines["django"].from_string("{% for owner in owners %}{{ owner }}{% endfor %}")
+                return TemplateResponse(request, template, {"owners": Owner.query})
+
+        response = DummyView.as_view()(RequestFactory().get("/"))
+
+        self.assertFalse(response.is_rendered)
+        with self.assertRaises(QueryBudgetExceeded):
+            response.render()
+
+    def test_handler_budget_overrides_view_budget(self):
+        class DummyView(SQLAlchemyMixin, View):
+            model = Owner
+            max_queries = 5
+
+            @query_budget(max_queries=0)
+            def get(self, request, *args, **kwargs):
+                Owner.objects.all()
+                return HttpResponse()
+
+        with self.assertRaises(QueryBudgetExceeded):
+            DummyView.as_view()(RequestFactory().get("/"))
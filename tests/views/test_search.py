@@ -0,0 +1,76 @@
+import json
+
+from django.core.exceptions import ImproperlyConfigured
+from django.urls import reverse
+from django_sorcery.db.profiler import SQLAlchemyProfiler
+from django_sorcery.views.search import SearchView
+
+from ..base import TestCase
+from ..testapp.models import CompositePkModel, Owner, db
+from ..testapp.views import CompositePkSearchView
+
+
+class TestSearchView(TestCase):
+    def setUp(self):
+        super().setUp()
+        db.add_all(
+            [
+                Owner(id=1, first_name="Alice", last_name="Smith"),
+                Owner(id=2, first_name="Bob", last_name="Allen"),
+                Owner(id=3, first_name="Carol", last_name="Jones"),
+                Owner(id=4, first_name="al_", last_name="Brown"),
+            ]
+        )
+        db.flush()
+
+    def test_search(self):
+        url = reverse("owners_search")
+
+        with SQLAlchemyProfiler() as profiler:
+            response = self.client.get(url, {"q": "AL"})
+
+        self.assertEqual(profiler.counts["select"], 1)
+        results = [{"id": 1, "text": str(Owner.query.get(1))}, {"id": 2, "text": str(Owner.query.get(2))}]
+        self.assertEqual(response.json(), {"results": results, "next": "[2]"})
+
+        response = self.client.get(url, {"q": "AL", "cursor": "[2]"})
+
+        self.assertEqual(response.json(), {"results": [{"id": 4, "text": str(Owner.query.get(4))}], "next": None})
+
+    def test_search_escapes_term(self):
+        response = self.client.get(reverse("owners_search"), {"q": "al_"})
+
+        self.assertEqual([r["id"] for r in response.json()["results"]], [4])
+
+    def test_limit(self):
+        url = reverse("owners_search")
+
+        self.assertEqual(len(self.client.get(url, {"limit": 3}).json()["results"]), 3)
+        self.assertEqual(len(self.client.get(url, {"limit": 0}).json()["results"]), 1)
+        self.assertEqual(len(self.client.get(url, {"limit": "abc"}).json()["results"]), 2)
+
+    def test_invalid_cursor(self):
+        url = reverse("owners_search")
+
+        for cursor in ("abc", "1", "[1, 2]", '["abc"]'):
+            self.assertEqual(self.client.get(url, {"cursor": cursor}).status_code, 400)
+
+    def test_composite_pk(self):
+        db.add_all([CompositePkModel(id=i // 2, pk=i % 2, name="name {}".format(i)) for i in range(5)])
+        db.flush()
+        url = reverse("composite_search")
+
+        response = self.client.get(url, {"q": "name", "cursor": "[1, 0]"})
+
+        self.assertEqual([r["id"] for r in response.json()["results"]], [{"id": 1, "pk": 1}, {"id": 2, "pk": 0}])
+
+    def test_missing_search_fields(self):
+        view = SearchView(model=Owner, session=db)
+
+        with self.assertRaises(ImproperlyConfigured):
+            view.get_search_fields()
+
+    def test_encode_cursor(self):
+        view = CompositePkSearchView()
+
+        self.assertEqual(json.loads(view.encode_cursor(CompositePkModel(id=1, pk=2))), [1, 2])
@@ -2,6 +2,8 @@ from django.core.exceptions import ImproperlyConfigured
 from django.http import Http404
 from django.urls import reverse
 from django_sorcery import forms, viewsets
+from django_sorcery.db.profiler import query_budget
+from django_sorcery.exceptions import QueryBudgetExceeded
 
 from ..base import TestCase
 from ..testapp.models import Owner, db
@@ -86,6 +88,21 @@ class TestListModelMixin(TestCase):
         with self.assertRaises(Http404):
             viewset.list(viewset.request)
 
+    def test_list_query_budget(self):
+        class OwnerViewSet(viewsets.ListModelMixin, viewsets.GenericViewSet):
+            model = Owner
+
+            @query_budget(max_queries=0)
+            def list(self, request, *args, **kwargs):
+                return super().list(request, *args, **kwargs)
+
+        response = OwnerViewSet.as_view(actions={"get": "list"})(self.factory.get("/"))
+
+        with self.assertRaises(QueryBudgetExceeded) as ctx:
+            response.render()
+
+        self.assertIn("OwnerViewSet.list: 1 queries exceeds max_queries=0", str(ctx.exception))
+
 
 class TestRetieveModelMixin(TestCase):
     def setUp(self):
@@ -168,6 +185,13 @@ class TestCreateModelMixin(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertDictEqual(response.context_data, {"form": response.context_data["form"], "view": viewset})
 
+    def test_form_class_cached(self):
+        class OwnerViewSet(viewsets.CreateModelMixin, viewsets.GenericViewSet):
+            model = Owner
+            fields = "__all__"
+
+        self.assertIs(OwnerViewSet().get_form_class(), OwnerViewSet().get_form_class())
+
     def test_create_bad_config(self):
         class OwnerViewSet(viewsets.CreateModelMixin, viewsets.GenericViewSet):
             model = Owner